@@ -0,0 +1,51 @@
+import argparse
+import os
+import sys
+
+# Ensure the root directory is in sys.path for internal imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence.database import ReadSessionLocal
+from src.infrastructure.persistence.sql_repository import SQLBlockchainRepository
+from src.application.services.chain_validator import ChainValidator
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Audit the NotaryChain ledger: hashes, links and signatures.")
+    parser.add_argument("--workers", type=int, default=None, help="validation processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="blocks per validation task")
+    parser.add_argument("--checkpoint", default="validation_checkpoint.json", help="trusted checkpoint file")
+    parser.add_argument("--full", action="store_true", help="ignore the checkpoint and validate from genesis")
+    parser.add_argument("--skip-signatures", action="store_true", help="only check hashes and links")
+    args = parser.parse_args()
+
+    validator = ChainValidator(
+        ECDSAService(),
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        checkpoint_path=args.checkpoint,
+        check_signatures=not args.skip_signatures
+    )
+
+    print(f"🔍 Auditing ledger with {validator.workers} worker(s)...")
+    try:
+        report = validator.validate_repository(
+            SQLBlockchainRepository(read_session_factory=ReadSessionLocal),
+            full=args.full,
+            on_progress=lambda height, checked: print(f"   ✔ validated up to block {height} ({checked} blocks)")
+        )
+    except Exception as e:
+        # Nothing is reported valid, and the checkpoint is left as it was
+        print(f"❌ Audit aborted, the ledger could not be read: {str(e)}")
+        sys.exit(1)
+
+    if report.valid and report.blocks_checked == 0:
+        print(f"🏆 Ledger valid: no new blocks since checkpoint at height {report.validated_height}")
+    elif report.valid:
+        print(
+            f"🏆 Ledger valid: blocks {report.start_height}..{report.validated_height}, "
+            f"{report.signatures_checked} signatures in {report.elapsed_seconds:.2f}s"
+        )
+    else:
+        print(f"❌ Ledger invalid at block {report.first_invalid_block}: {report.reason}")
+        sys.exit(1)
@@ -0,0 +1,135 @@
+"""
+Benchmark: latency of authenticated endpoints while users keep logging in.
+
+Starts the API with uvicorn in a scratch directory, registers a few users, then
+runs reader threads polling GET /auth/me alongside threads calling POST /auth/login
+(bcrypt), and reports /auth/me throughput and p50/p99 latency. Each scenario sets
+environment variables for the server, e.g. USER_CACHE_TTL_SECONDS=0 to disable the
+user cache. Run from the backend directory:
+
+    python benchmarks/bench_auth_latency.py --readers 8 --logins 2 --seconds 10
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SCENARIOS = [
+    ("user cache off", {"USER_CACHE_TTL_SECONDS": "0"}),
+    ("user cache on (30 s)", {"USER_CACHE_TTL_SECONDS": "30"}),
+]
+
+
+def request(url, body=None, token=None):
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    data = json.dumps(body).encode() if body is not None else None
+    with urllib.request.urlopen(urllib.request.Request(url, data=data, headers=headers), timeout=60) as response:
+        return json.loads(response.read())
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(app_dir, workdir, env):
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.api.server:app", "--app-dir", app_dir,
+         "--port", str(port), "--log-level", "warning"],
+        cwd=workdir, env={**os.environ, "BLOCK_BATCHING": "0", **env}
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(300):
+        try:
+            urllib.request.urlopen(url + "/chain?limit=1", timeout=1)
+            return server, url
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("server did not start")
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))] if ordered else float("nan")
+
+
+def run_scenario(label, env, args):
+    with tempfile.TemporaryDirectory() as workdir:
+        server, url = start_server(args.app_dir, workdir, env)
+        try:
+            tokens = []
+            for n in range(args.users):
+                user = {"email": f"user{n}@example.com", "password": "s3cret-password"}
+                request(url + "/auth/register", user)
+                tokens.append(request(url + "/auth/login", user)["access_token"])
+
+            latencies, logins, errors = [], [0], [0]
+            done = threading.Event()
+
+            def read(n):
+                token = tokens[n % len(tokens)]
+                while not done.is_set():
+                    started = time.perf_counter()
+                    try:
+                        request(url + "/auth/me", token=token)
+                        latencies.append(time.perf_counter() - started)
+                    except Exception:
+                        errors[0] += 1
+
+            def login(n):
+                user = {"email": f"user{n % args.users}@example.com", "password": "s3cret-password"}
+                while not done.is_set():
+                    try:
+                        request(url + "/auth/login", user)
+                        logins[0] += 1
+                    except Exception:
+                        errors[0] += 1
+
+            threads = [threading.Thread(target=read, args=(n,)) for n in range(args.readers)]
+            threads += [threading.Thread(target=login, args=(n,)) for n in range(args.logins)]
+            for thread in threads:
+                thread.start()
+            time.sleep(args.seconds)
+            done.set()
+            for thread in threads:
+                thread.join()
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(
+        f"{label:<24} {len(latencies) / args.seconds:>8,.0f} req/s  "
+        f"p50 {percentile(latencies, 0.5) * 1000:>7.1f} ms  p99 {percentile(latencies, 0.99) * 1000:>7.1f} ms  "
+        f"logins {logins[0]:>4}  errors {errors[0]}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--logins", type=int, default=2)
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--app-dir", default=BACKEND_DIR, help="backend directory of the server to measure")
+    args = parser.parse_args()
+
+    print(f"{args.readers} /auth/me readers, {args.logins} login loops, {args.seconds:g} s per scenario")
+    for label, env in SCENARIOS:
+        run_scenario(label, env, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: SQL write latency per mined block as the chain grows.
+
+Compares the previous persistence path (save_chain with the whole chain after
+every block) against append_block. Run from the backend directory:
+
+    python benchmarks/bench_block_append.py --blocks 2000 --txs-per-block 10
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.domain.entities.block import Block
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.persistence.sql_repository import SQLBlockchainRepository
+
+
+def make_block(index: int, txs_per_block: int) -> Block:
+    txs = [Transaction("SYSTEM", f"{index:032x}{n:032x}", {"user_id": 1}, 0.0) for n in range(txs_per_block)]
+    return Block(index, txs, "0", 0.0, hash=f"{index:064x}")
+
+
+def run(mode: str, blocks: int, txs_per_block: int, report_every: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db = sessionmaker(bind=engine)()
+        repository = SQLBlockchainRepository(db)
+        chain = []
+        window = []
+
+        for index in range(blocks):
+            block = make_block(index, txs_per_block)
+            chain.append(block)
+            started = time.perf_counter()
+            if mode == "append_block":
+                repository.append_block(block)
+            else:
+                repository.save_chain(chain)
+            window.append(time.perf_counter() - started)
+
+            if (index + 1) % report_every == 0:
+                print(f"{mode:>12} {index + 1:>8,} blocks  {sum(window) / len(window) * 1000:8.2f} ms/block")
+                window = []
+        db.close()
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocks", type=int, default=2000)
+    parser.add_argument("--txs-per-block", type=int, default=10)
+    parser.add_argument("--report-every", type=int, default=500)
+    args = parser.parse_args()
+
+    for mode in ("save_chain", "append_block"):
+        run(mode, args.blocks, args.txs_per_block, args.report_every)
+
+
+if __name__ == "__main__":
+    main()
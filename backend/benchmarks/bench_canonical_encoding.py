@@ -0,0 +1,67 @@
+"""
+Benchmark: transaction and block hashing per block format version.
+
+Compares the JSON hashing of format version 3 (a dict per transaction, then
+json.dumps with sorted keys) with the canonical binary encoding of version 4.
+Run from the backend directory:
+
+    python benchmarks/bench_canonical_encoding.py --transactions 50000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.domain.entities.block import Block, MERKLE_BLOCK_VERSION, BINARY_BLOCK_VERSION
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+
+OWNER = "04" + "ab" * 64
+
+
+def make_transactions(count: int):
+    return [
+        Transaction(OWNER, f"{n:064x}", {
+            "original_filename": f"contract_{n}.pdf",
+            "description": "Registro automático desde Web",
+            "user_id": n % 100,
+            "display_address": "0x74a4e8b...f3c"
+        })
+        for n in range(count)
+    ]
+
+
+def timed(label, fn, count, unit):
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<36} {count / elapsed:>12,.0f} {unit}/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transactions", type=int, default=50000)
+    parser.add_argument("--block-size", type=int, default=500)
+    args = parser.parse_args()
+
+    crypto = ECDSAService()
+    txs = make_transactions(args.transactions)
+    blocks = [
+        txs[start:start + args.block_size] for start in range(0, len(txs), args.block_size)
+    ]
+    for version in (MERKLE_BLOCK_VERSION, BINARY_BLOCK_VERSION):
+        print(f"\nformat version {version}:")
+        timed("transaction hashes", lambda: [crypto.calculate_tx_hash(tx, version) for tx in txs], len(txs), "tx")
+        timed(
+            f"block hashes ({args.block_size} tx/block)",
+            lambda: [crypto.calculate_hash(Block(i, chunk, "0", 0.0, version=version)) for i, chunk in enumerate(blocks)],
+            len(blocks), "blocks"
+        )
+        hasher = crypto.header_hasher(Block(1, [], "0" * 64, 0.0, version=version, tx_root="f" * 64))
+        timed("header hashes (mining)", lambda: [hasher.hash_nonce(n) for n in range(200000)], 200000, "nonces")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: serving PDF certificates with and without CertificateCache.
+
+Compares rendering every certificate with PDFCertificateGenerator against cache
+hits from the disk store (fresh process, nothing in memory) and from the in-memory
+LRU. Run from the backend directory:
+
+    python benchmarks/bench_certificate_cache.py --certificates 500
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.infrastructure.services.pdf_service import PDFCertificateGenerator
+from src.infrastructure.services.certificate_cache import CertificateCache
+
+
+def make_transactions(count):
+    return [
+        (CertificateCache.key(f"tx_{n}", "cd" * 70), {
+            "owner": "04" + "ab" * 64,
+            "timestamp": 1700000000 + n,
+            "document_hash": f"{n:064x}",
+            "metadata": {"original_filename": f"contrato_{n}.pdf", "description": "Contrato de arrendamiento"},
+            "signature": "cd" * 70
+        })
+        for n in range(count)
+    ]
+
+
+def timed(label, fn, count):
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {count / elapsed:>10,.0f} certificates/s  {elapsed / count * 1000:>7.3f} ms each")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--certificates", type=int, default=500)
+    args = parser.parse_args()
+
+    generator = PDFCertificateGenerator()
+    transactions = make_transactions(args.certificates)
+    with tempfile.TemporaryDirectory() as directory:
+        timed("render every time", lambda: [generator.generate_certificate(tx).getvalue() for _, tx in transactions],
+              len(transactions))
+        warm = CertificateCache(generator, directory)
+        for key, tx in transactions:
+            warm.get(key, tx)
+
+        cold = CertificateCache(generator, directory)
+        timed("disk store hit", lambda: [cold.get(key, tx) for key, tx in transactions], len(transactions))
+        timed("memory LRU hit", lambda: [warm.peek(key) for key, _ in transactions], len(transactions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: exporting many certificates as one ZIP archive.
+
+Compares rendering every certificate serially into an in-memory ZIP (what looping
+over /notarizations/{hash}/certificate amounts to) with CertificateZipExporter,
+which renders on a process pool and streams the archive. Reports throughput and
+the largest piece of archive held in memory at once. Run from the backend directory:
+
+    python benchmarks/bench_certificate_export.py --certificates 1000 --workers 4
+"""
+import argparse
+import io
+import os
+import sys
+import time
+import zipfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.infrastructure.services.pdf_service import PDFCertificateGenerator
+from src.infrastructure.services.certificate_cache import CertificateCache
+from src.infrastructure.services.certificate_export import CertificateZipExporter
+
+
+def make_items(count):
+    for n in range(count):
+        yield CertificateCache.key(f"tx_{n}", "cd" * 70), f"certificado_{n}.pdf", {
+            "owner": "04" + "ab" * 64,
+            "timestamp": 1700000000 + n,
+            "document_hash": f"{n:064x}",
+            "metadata": {"original_filename": f"contrato_{n}.pdf", "description": "Contrato de arrendamiento"},
+            "signature": "cd" * 70
+        }
+
+
+def serial_export(count):
+    generator = PDFCertificateGenerator()
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        for _, name, tx_data in make_items(count):
+            archive.writestr(name, generator.generate_certificate(tx_data).getvalue())
+    # The whole archive is held until it is sent
+    return len(output.getvalue()), len(output.getvalue())
+
+
+def streamed_export(count, workers):
+    exporter = CertificateZipExporter(CertificateCache(PDFCertificateGenerator()), workers=workers)
+    try:
+        sizes = [len(piece) for piece in exporter.zip_stream(make_items(count))]
+        return sum(sizes), max(sizes)
+    finally:
+        exporter.shutdown()
+
+
+def timed(label, fn, count):
+    started = time.perf_counter()
+    size, held = fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {count / elapsed:>8,.0f} certificates/s  archive {size / 1e6:>6.2f} MB  held {held / 1e3:>8.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--certificates", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    timed("serial render, in-memory zip", lambda: serial_export(args.certificates), args.certificates)
+    timed(f"process pool ({args.workers} workers), streamed",
+          lambda: streamed_export(args.certificates, args.workers), args.certificates)
+
+
+if __name__ == "__main__":
+    main()
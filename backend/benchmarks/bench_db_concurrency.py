@@ -0,0 +1,120 @@
+"""
+Benchmark: concurrent readers against a single block writer on SQLite.
+
+Runs N reader threads (a document lookup plus a page of block headers per read,
+each on its own session) while one thread keeps appending blocks through
+SQLBlockchainRepository. Compares
+the default rollback journal with the WAL configuration from database.py, then
+checks the stored chain is contiguous and valid. Run from the backend directory:
+
+    python benchmarks/bench_db_concurrency.py --readers 1 2 4 8 --seconds 3
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence.database import create_sqlite_engine, SQLITE_PRAGMAS
+from src.infrastructure.persistence.models import BlockModel, TransactionModel
+from src.infrastructure.persistence.sql_repository import SQLBlockchainRepository
+
+TXS_PER_BLOCK = 200
+# The previous configuration: SQLite defaults (rollback journal, full sync), no busy timeout
+DEFAULT_PRAGMAS = (("journal_mode", "DELETE"), ("synchronous", "FULL"))
+
+
+def mine(blockchain: Blockchain, height: int):
+    blockchain.pending_transactions = [
+        Transaction("SYSTEM", f"{height * TXS_PER_BLOCK + n:064x}", {"user_id": n % 20}, float(n))
+        for n in range(TXS_PER_BLOCK)
+    ]
+    return blockchain.mine_pending_transactions("miner")
+
+
+def run(label: str, pragmas: tuple, readers: int, seconds: float, seed_blocks: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'load.db')}"
+        engine = create_sqlite_engine(url, pragmas=pragmas)
+        read_engine = create_sqlite_engine(url, read_only=True, pool_size=readers, pragmas=pragmas)
+        repository = SQLBlockchainRepository(
+            session_factory=sessionmaker(bind=engine), read_session_factory=sessionmaker(bind=read_engine)
+        )
+        blockchain = Blockchain(ECDSAService(), difficulty=1)
+        repository.save_chain(blockchain.chain)
+        for height in range(1, seed_blocks + 1):
+            repository.append_block(mine(blockchain, height))
+
+        stop = threading.Event()
+        counts = {"reads": 0, "writes": 0, "errors": 0}
+        lock = threading.Lock()
+        ReadSession = sessionmaker(bind=read_engine)
+
+        def reader(seed: int):
+            rng = random.Random(seed)
+            reads = errors = 0
+            while not stop.is_set():
+                try:
+                    with ReadSession() as db:
+                        target = f"{rng.randrange(seed_blocks * TXS_PER_BLOCK):064x}"
+                        db.execute(select(TransactionModel.id).where(TransactionModel.document_hash == target)).first()
+                        start = rng.randrange(1, seed_blocks)
+                        db.execute(select(BlockModel.block_hash).where(BlockModel.index.between(start, start + 20))).all()
+                    reads += 1
+                except OperationalError:
+                    errors += 1
+            with lock:
+                counts["reads"] += reads
+                counts["errors"] += errors
+
+        def writer():
+            while not stop.is_set():
+                block = mine(blockchain, len(blockchain.chain))
+                if repository.append_block(block):
+                    counts["writes"] += 1
+                else:
+                    blockchain.chain.pop()
+
+        threads = [threading.Thread(target=reader, args=(n,)) for n in range(readers)] + [threading.Thread(target=writer)]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        stored = repository.load_chain()
+        consistent = [b.index for b in stored] == list(range(len(stored))) and blockchain.is_chain_valid(stored)
+        print(
+            f"{label:<10} {readers:>3} readers  {counts['reads'] / seconds:>9,.0f} reads/s  "
+            f"{counts['writes'] / seconds:>7,.1f} blocks/s  {counts['errors']:>5} lock errors  "
+            f"chain {'consistent' if consistent else 'INCONSISTENT'} ({len(stored)} blocks)"
+        )
+        engine.dispose()
+        read_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--seed-blocks", type=int, default=50)
+    args = parser.parse_args()
+
+    for label, pragmas in (("default", DEFAULT_PRAGMAS), ("wal", SQLITE_PRAGMAS)):
+        for readers in args.readers:
+            run(label, pragmas, readers, args.seconds, args.seed_blocks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: /verify lookup latency against ledger size.
+
+Compares the previous linear scan over Blockchain.chain with the DocumentIndex
+used by NotaryService. Run from the backend directory:
+
+    python benchmarks/bench_document_index.py --sizes 1000 10000 100000 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.domain.entities.block import Block
+from src.domain.entities.transaction import Transaction
+from src.application.services.document_index import DocumentIndex
+
+TXS_PER_BLOCK = 500
+OWNER = "04" + "ab" * 64
+METADATA = {}
+
+
+def build_chain(notarizations: int):
+    chain = []
+    for index in range((notarizations + TXS_PER_BLOCK - 1) // TXS_PER_BLOCK):
+        first = index * TXS_PER_BLOCK
+        last = min(first + TXS_PER_BLOCK, notarizations)
+        txs = [Transaction(OWNER, f"{n:064x}", METADATA, 0.0) for n in range(first, last)]
+        chain.append(Block(index, txs, "0", 0.0))
+    return chain
+
+
+def linear_scan(chain, document_hash):
+    for block in chain:
+        for tx in block.transactions:
+            if tx.document_hash == document_hash:
+                return block.index
+    return None
+
+
+def measure(lookup, hashes):
+    started = time.perf_counter()
+    for document_hash in hashes:
+        lookup(document_hash)
+    return (time.perf_counter() - started) / len(hashes) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--lookups", type=int, default=10000)
+    parser.add_argument("--scan-lookups", type=int, default=20, help="lookups for the (slow) linear scan")
+    args = parser.parse_args()
+
+    print(f"{'notarizations':>14} {'build (s)':>10} {'index (us)':>11} {'scan (us)':>12}")
+    for size in args.sizes:
+        chain = build_chain(size)
+
+        started = time.perf_counter()
+        index = DocumentIndex()
+        index.build(chain)
+        build_seconds = time.perf_counter() - started
+
+        # Half hits, half misses
+        hashes = [f"{random.randrange(size * 2):064x}" for _ in range(args.lookups)]
+        index_us = measure(index.lookup, hashes)
+        scan_us = measure(lambda h: linear_scan(chain, h), hashes[:args.scan_lookups])
+
+        print(f"{size:>14,} {build_seconds:>10.2f} {index_us:>11.3f} {scan_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark: memory held per notarization by the domain entities.
+
+Builds the same ledger with the previous plain @dataclass entities and with the
+slotted Block/Transaction (hex fields stored as bytes), measuring allocated
+bytes per transaction with tracemalloc, and times re-hashing a block with and
+without the cached transaction hashes. Run from the backend directory:
+
+    python benchmarks/bench_entity_memory.py --transactions 200000
+"""
+import argparse
+import gc
+import hashlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.domain.entities.block import Block
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+
+TXS_PER_BLOCK = 500
+
+
+@dataclass
+class PreviousTransaction:
+    """The Transaction entity before slots and compact hex storage."""
+    owner: str
+    document_hash: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = 0.0
+    signature: Optional[str] = None
+
+
+@dataclass
+class PreviousBlock:
+    index: int
+    transactions: List[PreviousTransaction]
+    previous_hash: str
+    timestamp: float = 0.0
+    nonce: int = 0
+    hash: Optional[str] = None
+    version: int = 3
+    tx_root: Optional[str] = None
+
+
+def fields(n: int):
+    # Every value goes through json like a ledger loaded from storage, so nothing is shared by accident
+    owner = hashlib.sha512(b"owner%d" % n).hexdigest()[:128]
+    return (
+        "04" + owner,
+        hashlib.sha256(b"doc%d" % n).hexdigest(),
+        json.loads(json.dumps({"filename": f"scan_{n}.pdf", "description": "Registro", "user_id": n % 50})),
+        1700000000.0 + n,
+        "3045" + hashlib.sha512(b"sig%d" % n).hexdigest()[:138]
+    )
+
+
+def build(tx_cls, block_cls, count: int):
+    chain = []
+    for index in range(0, count, TXS_PER_BLOCK):
+        txs = [tx_cls(*fields(n)) for n in range(index, min(index + TXS_PER_BLOCK, count))]
+        digest = hashlib.sha256(b"block%d" % index).hexdigest()
+        chain.append(block_cls(index // TXS_PER_BLOCK, txs, digest, 0.0, 0, digest, tx_root=digest))
+    return chain
+
+
+def measure(label: str, tx_cls, block_cls, count: int):
+    gc.collect()
+    tracemalloc.start()
+    chain = build(tx_cls, block_cls, count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<32} {current / count:>8,.0f} bytes/tx   {current / 2 ** 20:>8,.1f} MiB total")
+    return chain
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transactions", type=int, default=200000)
+    args = parser.parse_args()
+
+    measure("dataclass entities (previous)", PreviousTransaction, PreviousBlock, args.transactions)
+    chain = measure("slotted compact entities", Transaction, Block, args.transactions)
+
+    crypto = ECDSAService()
+    for label in ("block tx_roots, cold cache", "block tx_roots, cached hashes"):
+        started = time.perf_counter()
+        for block in chain:
+            crypto.calculate_tx_root(block.transactions, block.version)
+        print(f"{label:<32} {args.transactions / (time.perf_counter() - started):>12,.0f} tx/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark: importing a legacy blockchain.json into SQL, and the cost of importing the API.
+
+Builds a JSON ledger, then times the old startup migration (load the whole file, then
+save_chain block by block) against migrate_chain streaming the file through bulk inserts.
+Each step runs in a fresh process so its peak memory can be reported. Also times a cold import
+of src.api.server, which no longer touches the database or the ledger. Run from the
+backend directory:
+
+    python benchmarks/bench_migration.py --sizes 10000 100000 500000
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, BACKEND)
+
+from sqlalchemy.orm import sessionmaker
+from src.domain.entities.block import Block
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence.database import SQLITE_PRAGMAS, create_sqlite_engine
+from src.infrastructure.persistence.json_repository import JSONBlockchainRepository
+from src.infrastructure.persistence.sql_repository import SQLBlockchainRepository
+from src.application.services.ledger_migration import migrate_chain
+
+TXS_PER_BLOCK = 500
+# Memory-mapped database pages would count towards the peak RSS reported for each run
+PRAGMAS = tuple(pragma for pragma in SQLITE_PRAGMAS if pragma[0] != "mmap_size")
+
+
+def build_json_ledger(path: str, notarizations: int):
+    """Write a linked chain of unsigned blocks; the migration does not check signatures."""
+    crypto = ECDSAService()
+    repository = JSONBlockchainRepository(path)
+    chain = Blockchain(crypto, difficulty=0).chain
+    for index in range(1, (notarizations + TXS_PER_BLOCK - 1) // TXS_PER_BLOCK + 1):
+        first = (index - 1) * TXS_PER_BLOCK
+        txs = [
+            Transaction(f"owner_{n % 50}", f"{n:064x}", {"user_id": n % 20, "original_filename": f"doc_{n}.pdf"}, float(n))
+            for n in range(first, min(first + TXS_PER_BLOCK, notarizations))
+        ]
+        block = Block(index, txs, chain[-1].hash, float(index))
+        block.tx_root = crypto.calculate_tx_root(txs, block.version)
+        block.hash = crypto.header_hasher(block).hash_nonce(0)
+        chain.append(block)
+    repository.save_chain(chain)
+
+
+def run(mode: str, source: str, database: str):
+    """One migration in this process; prints seconds and peak RSS in MB."""
+    url = f"sqlite:///{database}"
+    target = SQLBlockchainRepository(session_factory=sessionmaker(bind=create_sqlite_engine(url, pragmas=PRAGMAS)))
+    started = time.perf_counter()
+    if mode == "legacy":
+        assert target.save_chain(JSONBlockchainRepository(source).load_chain())
+    else:
+        assert migrate_chain(JSONBlockchainRepository(source), target).ok
+    seconds = time.perf_counter() - started
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{seconds} {peak_mb}")
+
+
+def measure(*args: str):
+    # A child starts with its parent's peak RSS, so this process never holds a ledger
+    output = subprocess.run([sys.executable, *args], cwd=BACKEND, capture_output=True, text=True, check=True).stdout
+    return [float(value) for value in output.split()[-2:]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--build", nargs=2, metavar=("PATH", "NOTARIZATIONS"), help=argparse.SUPPRESS)
+    parser.add_argument("--run", nargs=3, metavar=("MODE", "SOURCE", "DATABASE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.build:
+        return build_json_ledger(args.build[0], int(args.build[1]))
+    if args.run:
+        return run(*args.run)
+
+    import_seconds = min(
+        measure("-c", "import time; t = time.perf_counter(); import src.api.server; print(time.perf_counter() - t, 0)")[0]
+        for _ in range(3)
+    )
+    print(f"import src.api.server: {import_seconds:.2f}s (no database or ledger access)\n")
+
+    print(
+        f"{'notarizations':>14} {'file (MB)':>10} {'load+save_chain (s)':>20} {'peak (MB)':>10} "
+        f"{'streamed (s)':>13} {'peak (MB)':>10}"
+    )
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "blockchain.json")
+            subprocess.run([sys.executable, __file__, "--build", source, str(size)], cwd=BACKEND, check=True)
+            legacy_seconds, legacy_mb = measure(__file__, "--run", "legacy", source, os.path.join(tmp, "legacy.db"))
+            stream_seconds, stream_mb = measure(__file__, "--run", "stream", source, os.path.join(tmp, "stream.db"))
+            file_mb = os.path.getsize(source) / 1024 / 1024
+            print(
+                f"{size:>14,} {file_mb:>10.1f} {legacy_seconds:>20.2f} {legacy_mb:>10.0f} "
+                f"{stream_seconds:>13.2f} {stream_mb:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: /search latency over a large notarization table.
+
+Fills a temporary SQLite database through append_block (which keeps the FTS5
+index in sync) and times full-text, prefix and filtered queries. Run from the
+backend directory:
+
+    python benchmarks/bench_search.py --transactions 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.domain.entities.block import Block
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.persistence.sql_repository import SQLBlockchainRepository
+
+WORDS = ["contrato", "factura", "escritura", "poder", "acta", "testamento", "recibo", "informe", "plano", "patente"]
+TXS_PER_BLOCK = 500
+
+
+def fill(repository: SQLBlockchainRepository, transactions: int, users: int):
+    rng = random.Random(42)
+    for index in range((transactions + TXS_PER_BLOCK - 1) // TXS_PER_BLOCK):
+        txs = []
+        for n in range(index * TXS_PER_BLOCK, min((index + 1) * TXS_PER_BLOCK, transactions)):
+            word = rng.choice(WORDS)
+            txs.append(Transaction(f"owner_{n % users}", f"{n:064x}", {
+                "user_id": n % users,
+                "original_filename": f"{word}_{n}.pdf",
+                "description": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {n}",
+                "display_address": f"0x{n % users:040x}"
+            }, float(n)))
+        repository.append_block(Block(index, txs, "0", 0.0, hash=f"{index:064x}"))
+
+
+def timed(label, fn, repeat=20):
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - started) / repeat * 1000
+    print(f"{label:<40} {elapsed:8.2f} ms  (total={result['total']:,})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transactions", type=int, default=200000)
+    parser.add_argument("--users", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db = sessionmaker(bind=engine)()
+        repository = SQLBlockchainRepository(db)
+
+        started = time.perf_counter()
+        fill(repository, args.transactions, args.users)
+        print(f"Indexed {args.transactions:,} transactions in {time.perf_counter() - started:.1f}s\n")
+
+        search = repository.search.search
+        timed("user's documents, newest first", lambda: search(db, user_id=7))
+        timed("full text 'contrato' (user)", lambda: search(db, query="contrato", user_id=7))
+        timed("prefix 'escrit' (user)", lambda: search(db, query="escrit", user_id=7))
+        timed("exact document hash", lambda: search(db, document_hash=f"{12345:064x}"))
+        timed("owner + time range", lambda: search(db, owner_address="owner_7", since=1000.0, until=50000.0))
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: ECDSA signature verification paths.
+
+Compares the previous per-call path (unhexlify + from_encoded_point on every
+verification) with SignatureVerifier's cached keys and its threaded
+verify_many batch API. Run from the backend directory:
+
+    python benchmarks/bench_signature_verify.py --signatures 5000 --owners 50
+"""
+import argparse
+import binascii
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.cryptography.signature_verifier import SignatureVerifier
+
+
+def per_call_verify(public_key_hex: str, signature_hex: str, data: str) -> bool:
+    """The verification path ECDSAService used before the key cache."""
+    try:
+        public_key = ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256K1(), binascii.unhexlify(public_key_hex))
+        public_key.verify(binascii.unhexlify(signature_hex), data.encode('utf-8'), ec.ECDSA(hashes.SHA256()))
+        return True
+    except Exception:
+        return False
+
+
+def make_items(signatures: int, owners: int, compressed: bool):
+    crypto = ECDSAService()
+    keys = [crypto.generate_key_pair(compressed=compressed) for _ in range(owners)]
+    items = []
+    for n in range(signatures):
+        key = keys[n % owners]
+        data = crypto.calculate_hash(f"document-{n}")
+        items.append((key["public_key_hex"], crypto.sign_data(data, key["private_key"]), data))
+    return items
+
+
+def timed(label, fn, count):
+    started = time.perf_counter()
+    results = fn()
+    elapsed = time.perf_counter() - started
+    assert all(results)
+    print(f"{label:<40} {count / elapsed:>10,.0f} verifications/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--signatures", type=int, default=5000)
+    parser.add_argument("--owners", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    for compressed in (False, True):
+        print(f"\n{'compressed' if compressed else 'uncompressed'} keys, {args.owners} owners:")
+        items = make_items(args.signatures, args.owners, compressed)
+
+        timed("per-call decode (previous)", lambda: [per_call_verify(*i) for i in items], len(items))
+        verifier = SignatureVerifier(workers=args.workers)
+        timed("cached keys, serial", lambda: [verifier.verify(*i) for i in items], len(items))
+        timed(f"cached keys, verify_many ({verifier.workers} threads)", lambda: verifier.verify_many(items), len(items))
+
+
+if __name__ == "__main__":
+    main()
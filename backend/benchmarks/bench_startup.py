@@ -0,0 +1,114 @@
+"""
+Benchmark: node startup time against ledger size, with and without a ledger snapshot.
+
+Builds a SQLite ledger, then times NotaryService start-up from a full scan of the
+stored chain and from a snapshot taken 'tail' blocks below the tip. Those blocks are
+replayed at boot and validated, signatures included, in the background; that catch-up
+is timed separately. Run from the backend directory:
+
+    python benchmarks/bench_startup.py --sizes 10000 100000 1000000 --tail 10
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy.orm import sessionmaker
+from src.domain.entities.block import Block
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence.database import create_sqlite_engine
+from src.infrastructure.persistence.snapshot_store import FileSnapshotStore
+from src.infrastructure.persistence.sql_repository import SQLBlockchainRepository
+from src.application.use_cases.notary_service import NotaryService
+
+TXS_PER_BLOCK = 500
+
+
+def open_repository(url: str) -> SQLBlockchainRepository:
+    return SQLBlockchainRepository(
+        session_factory=sessionmaker(bind=create_sqlite_engine(url)),
+        read_session_factory=sessionmaker(bind=create_sqlite_engine(url, read_only=True))
+    )
+
+
+def build_ledger(repository: SQLBlockchainRepository, crypto: ECDSAService, notarizations: int, tail: int) -> int:
+    """Store a linked chain; only the last 'tail' blocks carry real signatures, since only they are validated."""
+    blockchain = Blockchain(crypto, difficulty=0)
+    repository.save_chain(blockchain.chain)
+    keys = crypto.generate_key_pair()
+    blocks = (notarizations + TXS_PER_BLOCK - 1) // TXS_PER_BLOCK
+    previous_hash = blockchain.chain[0].hash
+    for index in range(1, blocks + 1):
+        first = (index - 1) * TXS_PER_BLOCK
+        txs = [
+            Transaction(keys["public_key_hex"], f"{n:064x}", {"user_id": n % 20}, float(n))
+            for n in range(first, min(first + TXS_PER_BLOCK, notarizations))
+        ]
+        if index > blocks - tail:
+            for tx in txs:
+                tx.signature = crypto.sign_data(crypto.calculate_tx_hash(tx), keys["private_key"])
+        block = Block(index, txs, previous_hash, float(index))
+        block.tx_root = crypto.calculate_tx_root(txs, block.version)
+        block.hash = crypto.header_hasher(block).hash_nonce(0)
+        repository.append_block(block)
+        previous_hash = block.hash
+    return blocks + 1
+
+
+def start(repository: SQLBlockchainRepository, crypto: ECDSAService, snapshot_store=None):
+    started = time.perf_counter()
+    service = NotaryService(
+        Blockchain(crypto, difficulty=0, create_genesis=False), repository, crypto, snapshot_store=snapshot_store
+    )
+    return service, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--tail", type=int, default=10, help="blocks sealed after the snapshot")
+    args = parser.parse_args()
+    crypto = ECDSAService()
+
+    print(
+        f"{'notarizations':>14} {'blocks':>7} {'full scan (s)':>14} {'snapshot (s)':>13} {'file (MB)':>10} "
+        f"{'boot (s)':>9} {'tail check (s)':>15}"
+    )
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite:///{os.path.join(tmp, 'ledger.db')}"
+            length = build_ledger(open_repository(url), crypto, size, args.tail)
+
+            service, full_seconds = start(open_repository(url), crypto)
+
+            # Snapshot of the chain as it stood 'tail' blocks ago
+            store = FileSnapshotStore(os.path.join(tmp, "ledger.snapshot"))
+            tip = length - 1 - args.tail
+            service.blockchain.chain = service.blockchain.chain[:tip + 1]
+            service.document_index = service.document_index.copy_below(tip + 1)
+            service.validated_height = tip
+            started = time.perf_counter()
+            store.save(service.take_snapshot())
+            save_seconds = time.perf_counter() - started
+
+            booted, boot_seconds = start(open_repository(url), crypto, store)
+            started = time.perf_counter()
+            validated_height = booted.validate_new_blocks()
+            check_seconds = boot_seconds + time.perf_counter() - started
+            assert len(booted.blockchain.chain) == length and validated_height == length - 1
+            assert len(booted.document_index) == size
+
+            file_mb = os.path.getsize(store.path) / 1024 / 1024
+            print(
+                f"{size:>14,} {length:>7,} {full_seconds:>14.2f} {save_seconds:>13.2f} {file_mb:>10.1f} "
+                f"{boot_seconds:>9.2f} {check_seconds:>15.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
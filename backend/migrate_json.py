@@ -0,0 +1,45 @@
+import argparse
+import os
+import sys
+
+# Ensure the root directory is in sys.path for internal imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.infrastructure.persistence.database import SessionLocal, ReadSessionLocal
+from src.infrastructure.persistence.json_repository import JSONBlockchainRepository
+from src.infrastructure.persistence.sql_repository import SQLBlockchainRepository
+from src.application.services.ledger_migration import migrate_chain
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import a legacy blockchain.json ledger into the SQL database.")
+    parser.add_argument("--source", default="blockchain.json", help="legacy JSON ledger")
+    parser.add_argument("--batch-blocks", type=int, default=20, help="blocks per bulk insert")
+    parser.add_argument("--keep", action="store_true", help="leave the source in place instead of renaming it to .bak")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.source):
+        print(f"❌ {args.source} not found")
+        sys.exit(1)
+
+    repository = SQLBlockchainRepository(session_factory=SessionLocal, read_session_factory=ReadSessionLocal)
+    print(f"📦 Migrating {args.source} to SQL in batches of {args.batch_blocks} blocks...")
+    report = migrate_chain(
+        JSONBlockchainRepository(file_path=args.source),
+        repository,
+        batch_blocks=args.batch_blocks,
+        on_progress=lambda height, copied: print(f"   ✔ stored up to block {height} ({copied} blocks)")
+    )
+
+    if not report.ok:
+        print(f"❌ Migration stopped after {report.blocks_copied} blocks: {report.error}")
+        print("   Run it again once fixed: blocks already stored are skipped.")
+        sys.exit(1)
+
+    print(
+        f"✅ Migrated {report.blocks_copied} blocks ({report.transactions_copied} transactions) "
+        f"from height {report.start_height} in {report.elapsed_seconds:.2f}s"
+    )
+    if not args.keep:
+        os.rename(args.source, args.source + ".bak")
+        print(f"   {args.source} renamed to '.bak'")
+    print("   Check signatures with: python audit_chain.py")
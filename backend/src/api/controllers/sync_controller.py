@@ -0,0 +1,82 @@
+import gzip
+import json
+from typing import Callable, Iterable, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from src.application.use_cases.notary_service import NotaryService
+from src.application.services.chain_sync import ChainSynchronizer
+from src.infrastructure.networking.block_codec import block_to_json
+from src.api.schemas.sync_schemas import RegisterNodesRequest
+
+# Responses smaller than this are not worth compressing
+GZIP_MIN_BYTES = 1024
+
+def _json_response(request: Request, data: dict) -> Response:
+    body = json.dumps(data, separators=(',', ':')).encode("utf-8")
+    headers = {"Vary": "Accept-Encoding"}
+    if len(body) >= GZIP_MIN_BYTES and "gzip" in request.headers.get("accept-encoding", ""):
+        body = gzip.compress(body, compresslevel=6)
+        headers["Content-Encoding"] = "gzip"
+    return Response(body, media_type="application/json", headers=headers)
+
+def create_sync_router(
+    notary_service: NotaryService,
+    synchronizer: ChainSynchronizer,
+    authorize: Callable,
+    allowed_peers: Optional[Iterable[str]] = None,
+    max_headers: int = 2000,
+    max_blocks: int = 500
+) -> APIRouter:
+    """
+    Endpoints other nodes use to synchronize with this one (tip, headers, block bodies),
+    plus peer registration and on-demand synchronization. Those two make this node contact
+    other hosts and possibly replace its chain, so they run behind the 'authorize' dependency
+    and only peers in 'allowed_peers' (when given) can be registered.
+    """
+    allowed = None if allowed_peers is None else {notary_service.normalize_node_url(url) for url in allowed_peers}
+    router = APIRouter(tags=["sync"])
+
+    @router.get("/sync/tip")
+    def get_tip():
+        chain = notary_service.blockchain.chain
+        return {"length": len(chain), "tip": chain[-1].hash, "difficulty": notary_service.blockchain.difficulty}
+
+    @router.get("/sync/headers")
+    def get_headers(
+        request: Request,
+        from_height: int = Query(0, alias="from", ge=0),
+        limit: int = Query(max_headers, ge=1, le=max_headers)
+    ):
+        blocks = notary_service.get_blocks(from_height, limit)
+        return _json_response(request, {"headers": [block_to_json(b, headers_only=True) for b in blocks]})
+
+    @router.get("/sync/blocks")
+    def get_blocks(
+        request: Request,
+        from_height: int = Query(0, alias="from", ge=0),
+        limit: int = Query(100, ge=1, le=max_blocks)
+    ):
+        blocks = notary_service.get_blocks(from_height, limit)
+        return _json_response(request, {"blocks": [block_to_json(b) for b in blocks]})
+
+    @router.get("/nodes")
+    def list_nodes():
+        return {"nodes": sorted(notary_service.blockchain.nodes)}
+
+    @router.post("/nodes/register", status_code=201, dependencies=[Depends(authorize)])
+    def register_nodes(payload: RegisterNodesRequest):
+        try:
+            urls = [notary_service.normalize_node_url(url) for url in payload.nodes]
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Nodo inválido: {e}")
+        refused = [url for url in urls if allowed is not None and url not in allowed]
+        if refused:
+            raise HTTPException(status_code=403, detail=f"Nodos no permitidos: {', '.join(refused)}")
+        registered = [notary_service.register_node(url) for url in urls]
+        return {"registered": registered, "nodes": sorted(notary_service.blockchain.nodes)}
+
+    @router.post("/nodes/resolve", dependencies=[Depends(authorize)])
+    def resolve_conflicts():
+        # Longest valid chain among this node and its peers
+        return synchronizer.sync().to_dict()
+
+    return router
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+class BulkHashItem(BaseModel):
+    document_hash: str = Field(pattern=r"^[0-9a-fA-F]{64}$")
+    filename: Optional[str] = None
+    description: str = ""
+
+class BulkNotarizeRequest(BaseModel):
+    owner_address: str
+    items: List[BulkHashItem]
+
+class VerifyBatchRequest(BaseModel):
+    hashes: List[str]
@@ -0,0 +1,5 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+class RegisterNodesRequest(BaseModel):
+    nodes: List[str] = Field(min_length=1)
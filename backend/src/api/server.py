@@ -1,24 +1,149 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI, HTTPException, Request, Response, Depends, Query
+from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer
-from typing import List, Optional
+from contextlib import asynccontextmanager, contextmanager
+from typing import List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy import event, inspect
 import os
-import shutil
-import uuid
+import json
+import hashlib
+import tempfile
+import time
+import zipfile
+import zlib
 
 from src.domain.entities.blockchain import Blockchain
 from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.mining.parallel_miner import ParallelMiner
 from src.infrastructure.persistence.sql_repository import SQLBlockchainRepository
-from src.infrastructure.persistence.database import SessionLocal, get_db
+from src.infrastructure.persistence.database import SessionLocal, ReadSessionLocal, get_db, get_read_db
 from src.infrastructure.persistence.json_repository import JSONBlockchainRepository
-from src.infrastructure.persistence.models import User as UserModel, TransactionModel
+from src.infrastructure.persistence.snapshot_store import FileSnapshotStore
+from src.infrastructure.persistence.models import User as UserModel, BlockModel, TransactionModel
 from src.application.use_cases.notary_service import NotaryService
 from src.application.services.auth_service import AuthService
+from src.application.services.notarization_jobs import NotarizationJobQueue, JobQueueFull
+from src.application.services.password_hasher import PasswordHasherPool, PasswordHasherBusy
+from src.application.services.ttl_cache import TTLCache
+from src.application.services.chain_sync import ChainSynchronizer
+from src.application.services.chain_validator import ChainValidator
+from src.infrastructure.networking.http_peer_client import HTTPPeerClient
+from src.infrastructure.networking.block_codec import block_to_json
+from src.api.controllers.sync_controller import create_sync_router
 from src.infrastructure.services.pdf_service import PDFCertificateGenerator
+from src.infrastructure.services.certificate_cache import CertificateCache
+from src.infrastructure.services.certificate_export import CertificateZipExporter
 from src.api.schemas.auth_schemas import UserRegister, UserLogin, Token, UserResponse
+from src.api.schemas.notary_schemas import BulkNotarizeRequest, VerifyBatchRequest
+from src.api.streaming_upload import StreamedUpload, UploadStreamError, FILE_START, FILE_DATA, FILE_END
 
-app = FastAPI(title="NotaryChain Commercial API", version="2.0.0")
+# Block batching: seal one block per BLOCK_MAX_TRANSACTIONS or BLOCK_MAX_WAIT_SECONDS window
+BLOCK_BATCHING = os.getenv("BLOCK_BATCHING", "1") == "1"
+BLOCK_MAX_TRANSACTIONS = int(os.getenv("BLOCK_MAX_TRANSACTIONS", "500"))
+BLOCK_MAX_WAIT_SECONDS = float(os.getenv("BLOCK_MAX_WAIT_SECONDS", "2"))
+
+# Notarization jobs: signing and mining run on NOTARIZE_WORKERS threads, at most NOTARIZE_QUEUE_SIZE waiting
+NOTARIZE_WORKERS = int(os.getenv("NOTARIZE_WORKERS", "2"))
+NOTARIZE_QUEUE_SIZE = int(os.getenv("NOTARIZE_QUEUE_SIZE", "1000"))
+
+# Bulk notarization: items per request, and zip archives kept in memory up to this size before spilling to disk
+MAX_BULK_ITEMS = int(os.getenv("MAX_BULK_ITEMS", "10000"))
+ZIP_SPOOL_BYTES = 64 * 1024 * 1024
+BULK_RECEIPT_WAIT_SECONDS = 60
+# Batch verification: digests per request, and NDJSON lines per streamed chunk
+MAX_VERIFY_BATCH = int(os.getenv("MAX_VERIFY_BATCH", "50000"))
+VERIFY_STREAM_LINES = 1000
+# Authenticated users are cached by token subject for USER_CACHE_TTL_SECONDS (0 disables the cache)
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+USER_CACHE_MAX_ENTRIES = 10000
+# bcrypt runs on PASSWORD_HASH_WORKERS threads; logins beyond PASSWORD_HASH_MAX_PENDING get a 503
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+# Rendered certificates: kept in memory and under CERTIFICATE_CACHE_DIR, each tier bounded in bytes
+CERTIFICATE_CACHE_DIR = os.getenv("CERTIFICATE_CACHE_DIR", "certificate_cache")
+CERTIFICATE_MEMORY_BYTES = int(os.getenv("CERTIFICATE_MEMORY_BYTES", str(64 * 1024 * 1024)))
+CERTIFICATE_DISK_BYTES = int(os.getenv("CERTIFICATE_DISK_BYTES", str(512 * 1024 * 1024)))
+# Bulk certificate export: renders on CERTIFICATE_EXPORT_WORKERS processes (default: one per CPU)
+CERTIFICATE_EXPORT_WORKERS = int(os.getenv("CERTIFICATE_EXPORT_WORKERS", "0")) or None
+CERTIFICATE_EXPORT_QUERY_ROWS = 1000
+# Peer synchronization: a round every SYNC_INTERVAL_SECONDS (0 disables), PEER_NODES seeds the peer list
+SYNC_INTERVAL_SECONDS = float(os.getenv("SYNC_INTERVAL_SECONDS", "30"))
+SYNC_WORKERS = int(os.getenv("SYNC_WORKERS", "4"))
+PEER_NODES = [url.strip() for url in os.getenv("PEER_NODES", "").split(",") if url.strip()]
+# Peers POST /nodes/register accepts besides PEER_NODES
+ALLOWED_PEER_NODES = [url.strip() for url in os.getenv("ALLOWED_PEER_NODES", "").split(",") if url.strip()]
+# A sync never replaces more than SYNC_MAX_REORG_BLOCKS blocks, blocks the last audit checkpointed
+# or a genesis block with blocks on it, unless the operator sets SYNC_ALLOW_DEEP_REORG=1
+SYNC_MAX_REORG_BLOCKS = int(os.getenv("SYNC_MAX_REORG_BLOCKS", "100"))
+SYNC_ALLOW_DEEP_REORG = os.getenv("SYNC_ALLOW_DEEP_REORG", "0") == "1"
+AUDIT_CHECKPOINT_PATH = os.getenv("AUDIT_CHECKPOINT_PATH", "validation_checkpoint.json")
+# Ledger snapshots: the node boots from SNAPSHOT_PATH, rewritten every SNAPSHOT_EVERY_BLOCKS blocks (0: only at shutdown)
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH", "ledger.snapshot")
+SNAPSHOT_EVERY_BLOCKS = int(os.getenv("SNAPSHOT_EVERY_BLOCKS", "1000"))
+# /chain pagination, and blocks per chunk of the streamed export
+MAX_CHAIN_PAGE = 1000
+EXPORT_STREAM_BLOCKS = 100
+
+# Legacy JSON ledgers are imported with migrate_json.py, never at startup
+LEGACY_JSON_PATHS = ("blockchain.json", "backend/blockchain.json")
+
+@contextmanager
+def _timed(timings: dict, phase: str):
+    started = time.perf_counter()
+    yield
+    timings[phase] = round(time.perf_counter() - started, 3)
+
+def initialize(timings: dict):
+    """
+    Startup work that touches the database and the ledger. Runs in the lifespan rather than
+    at import, so importing the app (tests, tooling, the reloader) stays cheap.
+    """
+    with _timed(timings, "schema"):
+        repository.create_schema()
+    for path in LEGACY_JSON_PATHS:
+        # Only the first block is read
+        if next(JSONBlockchainRepository(file_path=path).iter_chain(1), None) is None:
+            continue
+        if repository.chain_length() == 0:
+            # Starting would seal a new genesis block and the legacy ledger could no longer be imported
+            raise RuntimeError(f"Legacy ledger {path} not migrated: run 'python migrate_json.py --source {path}' first")
+        print(f"⚠️ Legacy ledger {path} is still present; finish importing it with: python migrate_json.py --source {path}")
+    with _timed(timings, "ledger"):
+        notary_service.load()
+    with _timed(timings, "peers"):
+        for peer_url in PEER_NODES:
+            notary_service.register_node(peer_url)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    timings = {}
+    await run_in_threadpool(initialize, timings)
+    if BLOCK_BATCHING:
+        notary_service.start_block_producer(BLOCK_MAX_TRANSACTIONS, BLOCK_MAX_WAIT_SECONDS)
+    certificate_cache.start()
+    job_queue.start()
+    synchronizer.start(SYNC_INTERVAL_SECONDS)
+    timings["total"] = round(time.perf_counter() - started, 3)
+    app.state.startup_timings = timings
+    print(
+        f"🚀 NotaryChain ready in {timings['total']:.2f}s "
+        f"(schema {timings['schema']:.2f}s, ledger {timings['ledger']:.2f}s, {len(notary_service.blockchain.chain)} blocks)"
+    )
+    yield
+    synchronizer.stop()
+    # Drain queued jobs, then seal whatever is still in the mempool before shutting down
+    job_queue.stop()
+    notary_service.stop_block_producer()
+    certificate_cache.stop()
+    certificate_exporter.shutdown()
+    # Next start only replays the blocks sealed after this
+    notary_service.save_snapshot()
+
+app = FastAPI(title="NotaryChain Commercial API", version="2.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -30,54 +155,116 @@ app.add_middleware(
 
 # Dependency Injection
 crypto_service = ECDSAService()
-db = SessionLocal()
-repository = SQLBlockchainRepository(db)
+# Each repository call opens its own session: reads on the query_only pool, block appends through one writer.
+# The schema and the ledger are loaded at startup (lifespan), not at import.
+repository = SQLBlockchainRepository(
+    session_factory=SessionLocal, read_session_factory=ReadSessionLocal, create_schema=False
+)
 pdf_generator = PDFCertificateGenerator()
+certificate_cache = CertificateCache(
+    pdf_generator, CERTIFICATE_CACHE_DIR, memory_bytes=CERTIFICATE_MEMORY_BYTES, disk_bytes=CERTIFICATE_DISK_BYTES
+)
+certificate_exporter = CertificateZipExporter(certificate_cache, workers=CERTIFICATE_EXPORT_WORKERS)
 
-# Migration Logic: JSON -> SQL (One time)
-JSON_PATH = "blockchain.json"
-if not os.path.exists(JSON_PATH) and os.path.exists("backend/blockchain.json"):
-    JSON_PATH = "backend/blockchain.json"
+# Proof of Work engine: MINER_WORKERS > 1 spreads the nonce search over a process pool
+MINER_WORKERS = int(os.getenv("MINER_WORKERS", "1"))
+miner = ParallelMiner(crypto_service, workers=MINER_WORKERS) if MINER_WORKERS > 1 else None
 
-if os.path.exists(JSON_PATH):
-    print(f"📦 Migrating legacy JSON data from {JSON_PATH} to SQL...")
-    try:
-        old_repo = JSONBlockchainRepository(file_path=JSON_PATH)
-        old_chain = old_repo.load_chain()
-        if old_chain:
-            repository.save_chain(old_chain)
-            os.rename(JSON_PATH, JSON_PATH + ".bak")
-            print(f"✅ Migration successful. {JSON_PATH} renamed to '.bak'")
-    except Exception as e:
-        print(f"⚠️ Migration failed: {e}")
+# The chain comes from the repository (or a snapshot); genesis is only created for a fresh ledger
+blockchain = Blockchain(crypto_service=crypto_service, miner=miner, create_genesis=False)
+notary_service = NotaryService(
+    blockchain, repository, crypto_service, node_address=os.getenv("NODE_ADDRESS", "NOTARY_NODE"),
+    snapshot_store=FileSnapshotStore(SNAPSHOT_PATH), snapshot_every_blocks=SNAPSHOT_EVERY_BLOCKS, load=False
+)
 
-blockchain = Blockchain(crypto_service=crypto_service)
-notary_service = NotaryService(blockchain, repository, crypto_service)
+def _certificate_data(tx) -> dict:
+    return {
+        "owner": tx.owner,
+        "timestamp": tx.timestamp,
+        "document_hash": tx.document_hash,
+        "metadata": tx.metadata,
+        "signature": tx.signature
+    }
+
+def _certificate_key(block, tx) -> str:
+    return CertificateCache.key(crypto_service.calculate_tx_hash(tx, block.version), tx.signature)
+
+def _prerender_certificates(block):
+    # Certificates of a confirmed block never change: render them before anyone asks
+    for tx in block.transactions:
+        if tx.owner != "SYSTEM":
+            certificate_cache.prerender(_certificate_key(block, tx), _certificate_data(tx))
+
+notary_service.add_block_listener(_prerender_certificates)
+
+job_queue = NotarizationJobQueue(workers=NOTARIZE_WORKERS, max_queued=NOTARIZE_QUEUE_SIZE)
+
+audit_validator = ChainValidator(crypto_service, checkpoint_path=AUDIT_CHECKPOINT_PATH)
+
+def _audited_height() -> int:
+    # Height of the last audit_chain.py checkpoint, if any
+    checkpoint = audit_validator.load_checkpoint()
+    return checkpoint[0] if checkpoint else -1
+
+synchronizer = ChainSynchronizer(
+    notary_service,
+    HTTPPeerClient(),
+    workers=SYNC_WORKERS,
+    max_reorg_blocks=SYNC_MAX_REORG_BLOCKS,
+    finalized_height=_audited_height,
+    allow_deep_reorg=SYNC_ALLOW_DEEP_REORG
+)
+
+user_cache = TTLCache(USER_CACHE_TTL_SECONDS, max_entries=USER_CACHE_MAX_ENTRIES)
+password_hasher = PasswordHasherPool(workers=PASSWORD_HASH_WORKERS, max_pending=PASSWORD_HASH_MAX_PENDING)
+
+@event.listens_for(UserModel, "after_insert")
+@event.listens_for(UserModel, "after_update")
+@event.listens_for(UserModel, "after_delete")
+def _forget_cached_user(mapper, connection, target):
+    # A changed email leaves the old one in the attribute history
+    for email in (target.email, *inspect(target).attrs.email.history.deleted):
+        user_cache.invalidate(email)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 # --- Dependencies ---
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: SessionLocal = Depends(get_db)):
+def _find_user(email: str) -> Optional[UserModel]:
+    """User by email, detached from the read session so it can be cached."""
+    with ReadSessionLocal() as db:
+        return db.query(UserModel).filter(UserModel.email == email).first()
+
+async def get_current_user(token: str = Depends(oauth2_scheme)):
     payload = AuthService.decode_token(token)
     if not payload:
         raise HTTPException(status_code=401, detail="Credenciales inválidas")
     email = payload.get("sub")
-    user = db.query(UserModel).filter(UserModel.email == email).first()
-    if not user:
-        raise HTTPException(status_code=401, detail="Usuario no encontrado")
+    user = user_cache.get(email)
+    if user is None:
+        user = await run_in_threadpool(_find_user, email)
+        if not user:
+            raise HTTPException(status_code=401, detail="Usuario no encontrado")
+        user_cache.put(email, user)
     return user
 
+# Registering peers and forcing a sync round need an authenticated user
+app.include_router(create_sync_router(
+    notary_service, synchronizer, authorize=get_current_user, allowed_peers=PEER_NODES + ALLOWED_PEER_NODES
+))
+
+async def _run_password_hasher(operation, *args):
+    try:
+        return await operation(*args)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=503, detail="Demasiadas solicitudes de autenticación, inténtelo más tarde",
+            headers={"Retry-After": "1"}
+        )
+
 # --- Auth Endpoints ---
 
-@app.post("/auth/register", response_model=UserResponse)
-def register(user_data: UserRegister, db: SessionLocal = Depends(get_db)):
-    # Check if user exists
-    existing_user = db.query(UserModel).filter(UserModel.email == user_data.email).first()
-    if existing_user:
-        raise HTTPException(status_code=400, detail="El email ya está registrado")
-    
-    hashed_pwd = AuthService.get_password_hash(user_data.password)
+def _add_user(db, user_data: UserRegister, hashed_pwd: str) -> UserModel:
     new_user = UserModel(
         email=user_data.email,
         hashed_password=hashed_pwd,
@@ -89,10 +276,20 @@ def register(user_data: UserRegister, db: SessionLocal = Depends(get_db)):
     db.refresh(new_user)
     return new_user
 
+@app.post("/auth/register", response_model=UserResponse)
+async def register(user_data: UserRegister, db: SessionLocal = Depends(get_db)):
+    # Check if user exists
+    if await run_in_threadpool(_find_user, user_data.email):
+        raise HTTPException(status_code=400, detail="El email ya está registrado")
+    
+    # bcrypt runs on the password hasher pool, the database work on the request threadpool
+    hashed_pwd = await _run_password_hasher(password_hasher.hash, user_data.password)
+    return await run_in_threadpool(_add_user, db, user_data, hashed_pwd)
+
 @app.post("/auth/login", response_model=Token)
-def login(credentials: UserLogin, db: SessionLocal = Depends(get_db)):
-    user = db.query(UserModel).filter(UserModel.email == credentials.email).first()
-    if not user or not AuthService.verify_password(credentials.password, user.hashed_password):
+async def login(credentials: UserLogin):
+    user = await run_in_threadpool(_find_user, credentials.email)
+    if not user or not await _run_password_hasher(password_hasher.verify, credentials.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Email o contraseña incorrectos")
     
     access_token = AuthService.create_access_token(data={"sub": user.email})
@@ -106,56 +303,162 @@ def get_me(current_user: UserModel = Depends(get_current_user)):
 def read_root():
     return {"message": "Welcome to NotaryChain Commercial API", "status": "active"}
 
-@app.post("/notarize")
+@app.post("/notarize", status_code=202)
 async def notarize_document(
-    owner_address: str = Form(...),
-    description: str = Form(""),
-    file: UploadFile = File(...),
-    current_user: UserModel = Depends(get_current_user),
-    db: SessionLocal = Depends(get_db)
+    request: Request,
+    current_user: UserModel = Depends(get_current_user)
 ):
-    # Inject current DB session into repository for this request
-    repository.set_db(db)
-    
-    temp_filename = f"temp_{uuid.uuid4()}_{file.filename}"
-    temp_path = os.path.abspath(temp_filename)
-    
+    # Form fields: file, owner_address, description. The file is hashed as it arrives and never stored.
     try:
-        with open(temp_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
+        upload = StreamedUpload(request)
+        file_hash = await run_in_threadpool(notary_service.hash_stream, upload.file_chunks())
+        owner_address = upload.fields.get("owner_address")
+        if not owner_address:
+            raise UploadStreamError("Falta el campo 'owner_address'")
+    except UploadStreamError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    metadata = {
+        "filename": upload.filename,
+        "description": upload.fields.get("description", ""),
+        "display_address": owner_address,
+        "original_filename": upload.filename,
+        "user_id": current_user.id # This will be used by the SQL repo
+    }
+
+    def notarize_job():
         # 1. Generate real keys for the transaction
-        keys = crypto_service.generate_key_pair() 
-        public_key = keys["public_key_hex"]
-        private_key = keys["private_key"]
-        
+        keys = crypto_service.generate_key_pair()
         # 2. Notarize with user context in metadata
-        result = notary_service.notarize_file(
-            temp_path, 
-            public_key, 
-            private_key, 
-            {
-                "description": description,
-                "display_address": owner_address,
-                "original_filename": file.filename,
-                "user_id": current_user.id # This will be used by the SQL repo
-            }
+        return notary_service.record_hash(file_hash, keys["public_key_hex"], keys["private_key"], metadata)
+
+    # Signing and mining run on the job workers; poll GET /jobs/{job_id} for the outcome
+    try:
+        job = job_queue.submit(file_hash, notarize_job, user_id=current_user.id)
+    except JobQueueFull:
+        raise HTTPException(
+            status_code=503, detail="Cola de notarización llena, inténtelo más tarde", headers={"Retry-After": "5"}
         )
-        
-        result["owner"] = owner_address
-        return result
-        
+
+    result = job.to_dict()
+    result["owner"] = owner_address
+    return result
+
+def _hash_bulk_upload(upload: StreamedUpload) -> List[Tuple[str, str]]:
+    """
+    (name, SHA-256) of every uploaded file. Plain files are hashed as they stream in;
+    zip archives are spooled and their entries hashed in parallel.
+    """
+    hashed, name, sink = [], None, None
+    for kind, value in upload.file_events():
+        if kind == FILE_START:
+            name = value
+            is_zip = name.lower().endswith(".zip")
+            sink = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_BYTES) if is_zip else hashlib.sha256()
+        elif kind == FILE_DATA:
+            if is_zip:
+                sink.write(value)
+            else:
+                sink.update(value)
+        elif kind == FILE_END:
+            if is_zip:
+                with sink:
+                    sink.seek(0)
+                    try:
+                        entries = notary_service.hash_archive(sink)
+                    except (zipfile.BadZipFile, zlib.error, RuntimeError, NotImplementedError) as e:
+                        # Corrupt, encrypted or using an unsupported compression method
+                        raise UploadStreamError(f"No se pudo leer el archivo zip '{name}': {str(e)}")
+                    hashed.extend((f"{name}/{entry}", h) for entry, h in entries)
+            else:
+                hashed.append((name, sink.hexdigest()))
+        if len(hashed) > MAX_BULK_ITEMS:
+            raise UploadStreamError(f"Se admiten como máximo {MAX_BULK_ITEMS} documentos por solicitud")
+    return hashed
+
+async def _stream_receipts(receipts, names: List[Optional[str]], wait: bool):
+    for position, (receipt, name) in enumerate(zip(receipts, names)):
+        if wait and not receipt.sealed.is_set():
+            await run_in_threadpool(receipt.wait, BULK_RECEIPT_WAIT_SECONDS)
+        yield json.dumps({"item": position, "filename": name, **receipt.to_dict()}) + "\n"
+
+@app.post("/notarize/bulk")
+async def notarize_bulk(
+    request: Request,
+    wait: bool = True,
+    current_user: UserModel = Depends(get_current_user)
+):
+    # Multipart 'files' (plain files and/or zip archives) plus owner_address/description,
+    # or a JSON body {"owner_address", "items": [{"document_hash", "filename", "description"}]}
+    try:
+        if request.headers.get("content-type", "").startswith("application/json"):
+            payload = BulkNotarizeRequest.model_validate_json(await request.body())
+            owner_address = payload.owner_address
+            documents = [(item.document_hash.lower(), item.filename, item.description) for item in payload.items]
+        else:
+            upload = StreamedUpload(request, file_field="files", max_files=MAX_BULK_ITEMS)
+            hashed = await run_in_threadpool(_hash_bulk_upload, upload)
+            owner_address = upload.fields.get("owner_address")
+            description = upload.fields.get("description", "")
+            documents = [(file_hash, name, description) for name, file_hash in hashed]
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=json.loads(e.json()))
+    except UploadStreamError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not owner_address:
+        raise HTTPException(status_code=400, detail="Falta el campo 'owner_address'")
+    if not documents:
+        raise HTTPException(status_code=400, detail="No se recibió ningún documento")
+    if len(documents) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Se admiten como máximo {MAX_BULK_ITEMS} documentos por solicitud")
+
+    items = [
+        (file_hash, {
+            "filename": name,
+            "description": description,
+            "display_address": owner_address,
+            "original_filename": name,
+            "user_id": current_user.id
+        })
+        for file_hash, name, description in documents
+    ]
+
+    def record_bulk():
+        # One key pair signs the whole group
+        keys = crypto_service.generate_key_pair()
+        return notary_service.record_hashes(items, keys["public_key_hex"], keys["private_key"])
+
+    try:
+        receipts = await run_in_threadpool(record_bulk)
     except Exception as e:
-        print(f"❌ Error in /notarize: {str(e)}")
+        print(f"❌ Error in /notarize/bulk: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+
+    # One JSON receipt per line, in request order; with wait=true each line is sent once its block is sealed
+    return StreamingResponse(
+        _stream_receipts(receipts, [name for _, name, _ in documents], wait), media_type="application/x-ndjson"
+    )
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str, current_user: UserModel = Depends(get_current_user)):
+    # Someone else's job is reported as missing
+    job = job_queue.get_job(job_id)
+    if not job or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Trabajo no encontrado")
+    return job.to_dict()
+
+@app.get("/receipts/{receipt_id}")
+def get_receipt(receipt_id: str, current_user: UserModel = Depends(get_current_user)):
+    receipt = notary_service.get_receipt(receipt_id)
+    if not receipt or receipt.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Recibo no encontrado")
+    return receipt.to_dict()
 
 @app.get("/my-notarizations")
 def get_user_history(
     current_user: UserModel = Depends(get_current_user),
-    db: SessionLocal = Depends(get_db)
+    db: SessionLocal = Depends(get_read_db)
 ):
     # We query the TransactionModel table directly for speed
     history = db.query(TransactionModel).filter(TransactionModel.user_id == current_user.id).all()
@@ -171,59 +474,231 @@ def get_user_history(
         } for t in history
     ]
 
+@app.get("/search")
+def search_notarizations(
+    q: Optional[str] = None,
+    owner: Optional[str] = None,
+    document_hash: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    current_user: UserModel = Depends(get_current_user),
+    db: SessionLocal = Depends(get_read_db)
+):
+    # Full-text search over filename/description/display address, scoped to the user's notarizations
+    return repository.search.search(
+        db,
+        query=q,
+        user_id=current_user.id,
+        owner_address=owner,
+        document_hash=document_hash,
+        since=since,
+        until=until,
+        page=page,
+        page_size=page_size
+    )
+
+def _user_notarizations(db, user_id: int, document_hash: Optional[str] = None, since: Optional[float] = None, until: Optional[float] = None):
+    """
+    Query of (document_hash, block index, signature) for the user's notarizations, oldest first.
+    Ownership comes from the database: only notarizations sealed by this node have a user there,
+    while the 'user_id' metadata of blocks adopted from peers refers to the peers' users.
+    """
+    query = (
+        db.query(TransactionModel.document_hash, BlockModel.index, TransactionModel.signature)
+        .join(BlockModel, TransactionModel.block_id == BlockModel.id)
+        .filter(TransactionModel.user_id == user_id)
+    )
+    if document_hash is not None:
+        query = query.filter(TransactionModel.document_hash == document_hash)
+    if since is not None:
+        query = query.filter(TransactionModel.timestamp >= since)
+    if until is not None:
+        query = query.filter(TransactionModel.timestamp <= until)
+    return query.order_by(TransactionModel.timestamp, TransactionModel.id)
+
+def _find_notarization(document_hash: str, block_index: int, signature: Optional[str]):
+    """The (block, transaction) of one stored notarization, through the document index."""
+    return next(
+        ((b, t) for b, t in notary_service.find_notarizations(document_hash) if b.index == block_index and t.signature == signature),
+        None
+    )
+
+def _certificate_export_items(user_id: int, since: Optional[float], until: Optional[float]):
+    """
+    Certificates of the user's notarizations between 'since' and 'until', oldest first.
+    Notarizations are read from the database in pages and resolved through the document index.
+    """
+    with ReadSessionLocal() as db:
+        query = _user_notarizations(db, user_id, since=since, until=until)
+        for document_hash, block_index, signature in query.yield_per(CERTIFICATE_EXPORT_QUERY_ROWS):
+            found = _find_notarization(document_hash, block_index, signature)
+            if found is None:
+                continue
+            block, tx = found
+            key = _certificate_key(block, tx)
+            yield key, f"certificado_{document_hash[:16]}_{block.index}_{key[:8]}.pdf", _certificate_data(tx)
+
+@app.get("/my-notarizations/certificates")
+def export_certificates(
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    current_user: UserModel = Depends(get_current_user)
+):
+    # ZIP of every certificate in the range, streamed while the missing ones are rendered in parallel
+    return StreamingResponse(
+        certificate_exporter.zip_stream(_certificate_export_items(current_user.id, since, until)),
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=certificados.zip"}
+    )
+
 @app.get("/notarizations/{document_hash}/certificate")
-def download_certificate(
+async def download_certificate(
     document_hash: str,
-    db: SessionLocal = Depends(get_db),
     current_user: UserModel = Depends(get_current_user)
 ):
-    # Search for the transaction in the DB associated with the user
-    tx = db.query(TransactionModel).filter(
-        TransactionModel.document_hash == document_hash,
-        TransactionModel.user_id == current_user.id
-    ).first()
+    # The user's notarization of the document, resolved through the shared document index.
+    # Database reads (blocks of a lazily served chain included) stay off the event loop.
+    def find_owned():
+        with ReadSessionLocal() as db:
+            owned = _user_notarizations(db, current_user.id, document_hash=document_hash).first()
+        return _find_notarization(*owned) if owned else None
+
+    found = await run_in_threadpool(find_owned)
     
-    if not tx:
+    if not found:
         raise HTTPException(status_code=404, detail="Certificado no encontrado o acceso denegado")
     
-    tx_data = {
-        "owner": tx.owner_address,
-        "timestamp": tx.timestamp,
-        "document_hash": tx.document_hash,
-        "metadata": tx.metadata_json,
-        "signature": tx.signature
-    }
-    
-    pdf_stream = pdf_generator.generate_certificate(tx_data)
+    # Served from memory when pre-rendered; disk reads and rendering stay off the event loop
+    block, tx = found
+    key = _certificate_key(block, tx)
+    pdf = certificate_cache.peek(key)
+    if pdf is None:
+        pdf = await run_in_threadpool(certificate_cache.get, key, _certificate_data(tx))
     
     filename = f"certificado_{document_hash[:8]}.pdf"
-    return StreamingResponse(
-        pdf_stream, 
+    return Response(
+        pdf,
         media_type="application/pdf",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
-@app.post("/verify")
-async def verify_document(file: UploadFile = File(...)):
-    temp_filename = f"verify_{uuid.uuid4()}_{file.filename}"
-    temp_path = os.path.abspath(temp_filename)
+@app.get("/notarizations/{document_hash}/proof")
+def get_inclusion_proof(document_hash: str):
+    try:
+        proof = notary_service.get_inclusion_proof(document_hash)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     
+    if not proof:
+        raise HTTPException(status_code=404, detail="Documento no encontrado en la blockchain")
+    return proof
+
+@app.post("/verify")
+async def verify_document(request: Request):
     try:
-        with open(temp_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-            
-        result = notary_service.verify_document(temp_path)
-        return result
+        upload = StreamedUpload(request)
+        file_hash = await run_in_threadpool(notary_service.hash_stream, upload.file_chunks())
+    except UploadStreamError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        # The block may have to be read from the database
+        return await run_in_threadpool(notary_service.verify_hash, file_hash)
     except Exception as e:
         print(f"❌ Error in /verify: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+
+def _verify_batch_lines(hashes: List[str]):
+    lines = []
+    for result in notary_service.verify_hashes(hashes):
+        lines.append(json.dumps(result))
+        if len(lines) == VERIFY_STREAM_LINES:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+@app.post("/verify/batch")
+def verify_batch(payload: VerifyBatchRequest, request: Request):
+    # Digests are normalized to lowercase hex, as produced by hashlib; unknown or malformed ones are 'verified: false'
+    if len(payload.hashes) > MAX_VERIFY_BATCH:
+        raise HTTPException(status_code=413, detail=f"Se admiten como máximo {MAX_VERIFY_BATCH} hashes por solicitud")
+    hashes = [h.strip().lower() for h in payload.hashes]
+
+    # Large batches can be streamed as NDJSON (Accept: application/x-ndjson)
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        return StreamingResponse(_verify_batch_lines(hashes), media_type="application/x-ndjson")
+
+    # Results are plain JSON types, so the response skips FastAPI's per-field encoding pass
+    results = list(notary_service.verify_hashes(hashes))
+    return JSONResponse({"found": sum(1 for r in results if r["verified"]), "total": len(results), "results": results})
+
+def _chain_etag(length: int) -> str:
+    # Blocks are immutable once sealed, so the tip hash identifies every chain response
+    return f'"{blockchain.chain[length - 1].hash}"'
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return None
 
 @app.get("/chain")
-def get_chain():
-    return {
-        "length": len(blockchain.chain),
-        "chain": [b.__dict__ for b in blockchain.chain]
-    }
+def get_chain(
+    request: Request,
+    from_height: Optional[int] = Query(None, alias="from", ge=0),
+    limit: int = Query(100, ge=1, le=MAX_CHAIN_PAGE),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    headers_only: bool = False
+):
+    # Cursor pagination by height; 'next' is the 'from' of the following page
+    length = len(blockchain.chain)
+    etag = _chain_etag(length)
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    descending = order == "desc"
+    start = from_height if from_height is not None else (length - 1 if descending else 0)
+    blocks = notary_service.get_blocks(start, limit, descending)
+
+    next_height = None
+    if blocks:
+        next_height = blocks[-1].index - 1 if descending else blocks[-1].index + 1
+        if next_height < 0 or next_height >= length:
+            next_height = None
+
+    return JSONResponse(
+        {
+            "length": length,
+            "tip": blockchain.chain[length - 1].hash,
+            "next": next_height,
+            "chain": [block_to_json(b, headers_only) for b in blocks]
+        },
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+def _export_chunks(length: int, headers_only: bool):
+    yield f'{{"length":{length},"chain":['
+    for start in range(0, length, EXPORT_STREAM_BLOCKS):
+        blocks = notary_service.get_blocks(start, min(EXPORT_STREAM_BLOCKS, length - start))
+        prefix = "," if start else ""
+        yield prefix + ",".join(json.dumps(block_to_json(b, headers_only)) for b in blocks)
+    yield "]}"
+
+@app.get("/chain/export")
+def export_chain(request: Request, headers_only: bool = False):
+    # Full chain as one JSON document, encoded block by block instead of in memory
+    length = len(blockchain.chain)
+    etag = _chain_etag(length)
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    return StreamingResponse(
+        _export_chunks(length, headers_only),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
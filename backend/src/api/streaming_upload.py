@@ -0,0 +1,165 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import anyio.from_thread
+from fastapi import Request
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+# Request body is coalesced into chunks of this size before parsing and hashing
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Plain form fields (owner_address, description, ...) are kept in memory up to this size
+MAX_FIELD_SIZE = 64 * 1024
+
+# Events produced by StreamedUpload.file_events()
+FILE_START = "start"
+FILE_DATA = "data"
+FILE_END = "end"
+
+class UploadStreamError(ValueError):
+    """The request body is not a usable multipart upload."""
+
+class StreamedUpload:
+    """
+    A multipart/form-data request whose file parts are streamed instead of spooled to disk.
+    file_chunks()/file_events() must run in a worker thread (run_in_threadpool): they pull
+    the body from the event loop, parse it and yield the file bytes, so memory stays at
+    about one chunk whatever the file size. Form fields are available once they are exhausted.
+    """
+    def __init__(
+        self, request: Request, file_field: str = "file", chunk_size: int = UPLOAD_CHUNK_SIZE, max_files: int = 1
+    ):
+        content_type, params = parse_options_header(request.headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise UploadStreamError("Se esperaba un formulario multipart/form-data")
+
+        self.file_field = file_field
+        self.chunk_size = chunk_size
+        self.max_files = max_files
+        self.fields: Dict[str, str] = {}
+        self.filenames: List[str] = []
+        self.size = 0
+        self._boundary = params[b"boundary"]
+        self._body = request.stream()
+        self._pending = bytearray()
+
+        self._header_name = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._part_name: Optional[str] = None
+        self._is_file = False
+        self._field_data = bytearray()
+        self._events: List[Tuple[str, Any]] = []
+
+    @property
+    def filename(self) -> Optional[str]:
+        return self.filenames[0] if self.filenames else None
+
+    def file_chunks(self) -> Iterator[bytes]:
+        """Bytes of the single uploaded file."""
+        for kind, value in self.file_events():
+            if kind == FILE_DATA:
+                yield value
+        if not self.filenames:
+            raise UploadStreamError(f"Falta el archivo '{self.file_field}'")
+
+    def file_events(self) -> Iterator[Tuple[str, Any]]:
+        """
+        (FILE_START, filename), (FILE_DATA, bytes)... (FILE_END, None) for every uploaded file, in order.
+        """
+        parser = MultipartParser(self._boundary, {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished
+        })
+        while True:
+            body = anyio.from_thread.run(self._read_body)
+            try:
+                if body:
+                    parser.write(body)
+                else:
+                    parser.finalize()
+            except MultipartParseError as e:
+                raise UploadStreamError(f"Formulario multipart inválido: {e}") from e
+            yield from self._drain_events()
+            if not body:
+                break
+
+    def _drain_events(self) -> Iterator[Tuple[str, Any]]:
+        # Consecutive data pieces of one file are joined into one chunk
+        data: List[bytes] = []
+        for kind, value in self._events:
+            if kind == FILE_DATA:
+                data.append(value)
+                continue
+            if data:
+                yield self._data_event(data)
+                data = []
+            yield kind, value
+        if data:
+            yield self._data_event(data)
+        self._events.clear()
+
+    def _data_event(self, data: List[bytes]) -> Tuple[str, bytes]:
+        chunk = b"".join(data)
+        self.size += len(chunk)
+        return FILE_DATA, chunk
+
+    async def _read_body(self) -> bytes:
+        buffer = self._pending
+        while len(buffer) < self.chunk_size:
+            try:
+                buffer += await self._body.__anext__()
+            except StopAsyncIteration:
+                break
+        # Oversized messages from the server are split so parsing works on bounded chunks
+        self._pending = buffer[self.chunk_size:]
+        return bytes(buffer[:self.chunk_size])
+
+    def _on_part_begin(self):
+        self._disposition = b""
+        self._part_name = None
+        self._is_file = False
+        self._field_data.clear()
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def _on_header_end(self):
+        if self._header_name.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self):
+        _, options = parse_options_header(self._disposition)
+        if b"name" not in options:
+            raise UploadStreamError("Parte del formulario sin nombre")
+        self._part_name = options[b"name"].decode("utf-8", errors="replace")
+        if b"filename" in options:
+            if self._part_name != self.file_field or len(self.filenames) >= self.max_files:
+                raise UploadStreamError(
+                    f"Se admiten como máximo {self.max_files} archivo(s) en el campo '{self.file_field}'"
+                )
+            self._is_file = True
+            self.filenames.append(options[b"filename"].decode("utf-8", errors="replace"))
+            self._events.append((FILE_START, self.filenames[-1]))
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        if self._is_file:
+            self._events.append((FILE_DATA, data[start:end]))
+            return
+        if len(self._field_data) + end - start > MAX_FIELD_SIZE:
+            raise UploadStreamError(f"El campo '{self._part_name}' es demasiado grande")
+        self._field_data += data[start:end]
+
+    def _on_part_end(self):
+        if self._is_file:
+            self._events.append((FILE_END, None))
+        else:
+            self.fields[self._part_name] = self._field_data.decode("utf-8", errors="replace")
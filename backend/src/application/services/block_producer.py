@@ -0,0 +1,157 @@
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, List, Optional
+from src.domain.entities.block import Block
+from src.domain.entities.transaction import Transaction
+
+RECEIPT_PENDING = "pending"
+RECEIPT_CONFIRMED = "confirmed"
+RECEIPT_FAILED = "failed"
+
+@dataclass
+class NotarizationReceipt:
+    """
+    Handle returned for a queued transaction. Confirmed once its block is sealed.
+    """
+    document_hash: str
+    receipt_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = RECEIPT_PENDING
+    block_index: Optional[int] = None
+    block_hash: Optional[str] = None
+    error: Optional[str] = None
+    # Local user the transaction was notarized for; only they can look it up
+    user_id: Optional[int] = None
+    sealed: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self.sealed.wait(timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "receipt_id": self.receipt_id,
+            "status": self.status,
+            "document_hash": self.document_hash,
+            "block_index": self.block_index,
+            "block_hash": self.block_hash
+        }
+        if self.error:
+            data["error"] = self.error
+        return data
+
+class BlockProducer:
+    """
+    Background block producer. Collects signed transactions in a mempool and seals
+    them into one block when 'max_transactions' are queued or 'max_wait_seconds'
+    have passed since the oldest queued transaction, whichever comes first.
+    """
+    def __init__(
+        self,
+        seal_block: Callable[[List[Transaction]], Block],
+        max_transactions: int = 500,
+        max_wait_seconds: float = 2.0,
+        max_receipts: int = 100000
+    ):
+        self.seal_block = seal_block
+        self.max_transactions = max_transactions
+        self.max_wait_seconds = max_wait_seconds
+        self.max_receipts = max_receipts
+
+        self._mempool: List[Transaction] = []
+        self._waiting: List[NotarizationReceipt] = []
+        self._oldest_at = 0.0
+        self._receipts: "OrderedDict[str, NotarizationReceipt]" = OrderedDict()
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="block-producer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Seal whatever is still queued and stop the producer thread."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, transaction: Transaction) -> NotarizationReceipt:
+        return self.submit_many([transaction])[0]
+
+    def submit_many(self, transactions: List[Transaction]) -> List[NotarizationReceipt]:
+        receipts = [NotarizationReceipt(tx.document_hash, user_id=tx.metadata.get("user_id")) for tx in transactions]
+        with self._condition:
+            if self._stopping:
+                raise RuntimeError("Block producer is stopped")
+            if not self._mempool:
+                self._oldest_at = time.monotonic()
+            self._mempool.extend(transactions)
+            self._waiting.extend(receipts)
+            for receipt in receipts:
+                self._remember(receipt)
+            self._condition.notify_all()
+        return receipts
+
+    def get_receipt(self, receipt_id: str) -> Optional[NotarizationReceipt]:
+        with self._condition:
+            return self._receipts.get(receipt_id)
+
+    @property
+    def queued(self) -> int:
+        with self._condition:
+            return len(self._mempool)
+
+    def _remember(self, receipt: NotarizationReceipt):
+        # Keep a bounded window of receipts so polling clients can still find recent ones
+        self._receipts[receipt.receipt_id] = receipt
+        while len(self._receipts) > self.max_receipts:
+            self._receipts.popitem(last=False)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._mempool and not self._stopping:
+                    self._condition.wait()
+                if not self._mempool:
+                    return
+
+                # Wait for the batch to fill up or for the oldest transaction's deadline
+                deadline = self._oldest_at + self.max_wait_seconds
+                while len(self._mempool) < self.max_transactions and not self._stopping:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch = self._mempool[:self.max_transactions]
+                receipts = self._waiting[:self.max_transactions]
+                del self._mempool[:self.max_transactions]
+                del self._waiting[:self.max_transactions]
+                # Leftovers open a new window
+                self._oldest_at = time.monotonic()
+
+            self._seal(batch, receipts)
+
+    def _seal(self, batch: List[Transaction], receipts: List[NotarizationReceipt]):
+        try:
+            block = self.seal_block(batch)
+        except Exception as e:
+            print(f"❌ Error sealing block: {str(e)}")
+            for receipt in receipts:
+                receipt.status = RECEIPT_FAILED
+                receipt.error = str(e)
+                receipt.sealed.set()
+            return
+
+        for receipt in receipts:
+            receipt.status = RECEIPT_CONFIRMED
+            receipt.block_index = block.index
+            receipt.block_hash = block.hash
+            receipt.sealed.set()
@@ -0,0 +1,226 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Callable, Iterable, List, Optional, Tuple
+from src.domain.entities.block import Block, CURRENT_BLOCK_VERSION
+from src.domain.interfaces.peer_client import PeerClient, PeerTip
+from src.application.services.chain_validator import validate_blocks
+
+class SyncRejected(Exception):
+    """Raised when a peer's chain fails validation."""
+
+@dataclass
+class SyncResult:
+    """
+    Outcome of one synchronization round.
+    """
+    replaced: bool
+    length: int
+    peer: Optional[str] = None
+    fork_height: Optional[int] = None
+    blocks_downloaded: int = 0
+    resubmitted_transactions: int = 0
+    # Orphans that could not be re-sealed (signed for an older block format)
+    dropped_transactions: int = 0
+    reason: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self):
+        return asdict(self)
+
+class ChainSynchronizer:
+    """
+    Headers-first synchronization with the registered peers. Each round asks every peer
+    for its tip; peers with a longer chain are tried longest first. From the last block
+    both chains share, headers are downloaded and validated (current block format, links,
+    header hashes, proof of work) before any body is requested; the missing bodies are then
+    fetched in parallel ranges, checked against those headers and fully validated, proof of
+    work and signatures included.
+    The longest valid chain wins; transactions only the local chain held are resubmitted.
+    Unless 'allow_deep_reorg' is set, a peer's chain is refused when adopting it would replace
+    more than 'max_reorg_blocks' blocks, blocks at or below the height 'finalized_height()'
+    returns (e.g. the audit checkpoint), or a genesis block the local chain has built on.
+    """
+    def __init__(
+        self,
+        notary_service,
+        peer_client: PeerClient,
+        header_batch: int = 2000,
+        body_batch: int = 100,
+        workers: int = 4,
+        max_reorg_blocks: int = 100,
+        finalized_height: Optional[Callable[[], int]] = None,
+        allow_deep_reorg: bool = False
+    ):
+        self.notary_service = notary_service
+        self.peer_client = peer_client
+        self.header_batch = header_batch
+        self.body_batch = body_batch
+        self.workers = max(1, workers)
+        self.max_reorg_blocks = max_reorg_blocks
+        self.finalized_height = finalized_height
+        self.allow_deep_reorg = allow_deep_reorg
+        # One round at a time, whether started by the timer or by a request
+        self._round_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def crypto_service(self):
+        return self.notary_service.crypto_service
+
+    def sync(self, peers: Optional[Iterable[str]] = None) -> SyncResult:
+        started = time.perf_counter()
+        with self._round_lock:
+            result = self._sync(list(peers if peers is not None else self.notary_service.blockchain.nodes))
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+
+    def _sync(self, peers: List[str]) -> SyncResult:
+        local_length = len(self.notary_service.blockchain.chain)
+        tips = [(peer, tip) for peer, tip in self._fetch_tips(peers) if tip.length > local_length]
+        if not tips:
+            return SyncResult(False, local_length, reason="Local chain is already the longest")
+
+        rejected = []
+        for peer, tip in sorted(tips, key=lambda item: item[1].length, reverse=True):
+            try:
+                return self._sync_from(peer, tip)
+            except Exception as e:
+                print(f"⚠️ Sync with {peer} failed: {str(e)}")
+                rejected.append(f"{peer}: {str(e)}")
+        return SyncResult(False, len(self.notary_service.blockchain.chain), reason="; ".join(rejected))
+
+    def _fetch_tips(self, peers: List[str]) -> List[Tuple[str, PeerTip]]:
+        def fetch(peer: str) -> Optional[PeerTip]:
+            try:
+                return self.peer_client.get_tip(peer)
+            except Exception as e:
+                print(f"⚠️ Peer {peer} unreachable: {str(e)}")
+                return None
+
+        if not peers:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(peers))) as pool:
+            return [(peer, tip) for peer, tip in zip(peers, pool.map(fetch, peers)) if tip is not None]
+
+    def _sync_from(self, peer: str, tip: PeerTip) -> SyncResult:
+        fork = self._find_fork(peer, tip.length)
+        self._check_reorg(fork)
+        headers = self._download_headers(peer, fork, tip)
+        blocks = self._download_bodies(peer, fork, headers)
+
+        orphans, owners = self.notary_service.replace_chain_from(fork + 1, blocks)
+        resubmitted = self.notary_service.resubmit_transactions(orphans, owners) if orphans else 0
+        print(f"🔗 Adopted chain of {peer}: {len(blocks)} blocks from height {fork + 1}")
+        return SyncResult(
+            True, len(self.notary_service.blockchain.chain), peer, fork, len(blocks), resubmitted,
+            len(orphans) - resubmitted
+        )
+
+    def _find_fork(self, peer: str, peer_length: int) -> int:
+        """Height of the last block both chains share, or -1 if they share none (different genesis)."""
+        chain = self.notary_service.blockchain.chain
+        top = min(len(chain), peer_length) - 1
+        while top >= 0:
+            start = max(0, top - self.header_batch + 1)
+            headers = self.peer_client.get_headers(peer, start, top - start + 1)
+            for header in reversed(headers):
+                if header.index <= top and chain[header.index].hash == header.hash:
+                    return header.index
+            top = start - 1
+        return -1
+
+    def _check_reorg(self, fork: int):
+        """Refuse to replace the blocks above 'fork' when that reaches too deep into the local chain."""
+        if self.allow_deep_reorg:
+            return
+        length = len(self.notary_service.blockchain.chain)
+        # A node holding only its own genesis block has nothing to lose
+        if fork < 0 and length > 1:
+            raise SyncRejected("Peer chain starts from a different genesis block")
+        if fork >= 0 and length - 1 - fork > self.max_reorg_blocks:
+            raise SyncRejected(
+                f"Adopting it would replace {length - 1 - fork} blocks, more than {self.max_reorg_blocks}"
+            )
+        finalized = self.finalized_height() if self.finalized_height else -1
+        if fork < finalized:
+            raise SyncRejected(f"Fork at height {fork} is below the finalized height {finalized}")
+
+    def _download_headers(self, peer: str, fork: int, tip: PeerTip) -> List[Block]:
+        headers: List[Block] = []
+        previous_hash = self.notary_service.blockchain.chain[fork].hash if fork >= 0 else None
+        height = fork + 1
+        while height < tip.length:
+            batch = self.peer_client.get_headers(peer, height, min(self.header_batch, tip.length - height))
+            if not batch:
+                raise SyncRejected(f"Peer returned no headers from height {height}")
+            for header in batch:
+                self._check_header(header, height, previous_hash)
+                previous_hash = header.hash
+                height += 1
+            headers.extend(batch)
+        if headers and headers[-1].hash != tip.tip:
+            raise SyncRejected("Headers do not end at the advertised tip")
+        return headers
+
+    def _check_header(self, header: Block, height: int, previous_hash: Optional[str]):
+        if header.index != height:
+            raise SyncRejected(f"Expected header {height}, got {header.index}")
+        if height == 0 and header.previous_hash != "0":
+            raise SyncRejected("Genesis header does not start the chain")
+        if height > 0 and header.previous_hash != previous_hash:
+            raise SyncRejected(f"Header {height} does not link to the previous block")
+        # Older formats are only ever read from the local ledger, never adopted from a peer
+        if header.version < CURRENT_BLOCK_VERSION:
+            raise SyncRejected(f"Header {height} uses block format {header.version}, older than {CURRENT_BLOCK_VERSION}")
+        if header.hash != self.crypto_service.header_hasher(header).hash_nonce(header.nonce):
+            raise SyncRejected(f"Header {height} hash mismatch")
+        if height > 0 and not header.hash.startswith("0" * self.notary_service.blockchain.difficulty):
+            raise SyncRejected(f"Header {height} does not meet the proof of work target")
+
+    def _download_bodies(self, peer: str, fork: int, headers: List[Block]) -> List[Block]:
+        ranges = [headers[i:i + self.body_batch] for i in range(0, len(headers), self.body_batch)]
+
+        def fetch(expected: List[Block]) -> List[Block]:
+            blocks = self.peer_client.get_blocks(peer, expected[0].index, len(expected))
+            if [b.hash for b in blocks] != [h.hash for h in expected]:
+                raise SyncRejected(f"Blocks {expected[0].index}-{expected[-1].index} do not match their headers")
+            return blocks
+
+        previous_hash = self.notary_service.blockchain.chain[fork].hash if fork >= 0 else None
+        blocks: List[Block] = []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            # Ranges download in parallel; they are validated in height order as they arrive
+            for batch in pool.map(fetch, ranges):
+                invalid_height, reason, _, _ = validate_blocks(
+                    self.crypto_service, batch, previous_hash, difficulty=self.notary_service.blockchain.difficulty
+                )
+                if invalid_height is not None:
+                    raise SyncRejected(f"Block {invalid_height}: {reason}")
+                previous_hash = batch[-1].hash
+                blocks.extend(batch)
+        return blocks
+
+    # --- Background rounds ---
+
+    def start(self, interval: float):
+        """Run a round every 'interval' seconds on a background thread."""
+        if self._thread is None and interval > 0:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval,), name="chain-sync", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self, interval: float):
+        while not self._stopping.wait(interval):
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"❌ Error in chain sync round: {str(e)}")
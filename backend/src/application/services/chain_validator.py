@@ -0,0 +1,224 @@
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from dataclasses import dataclass, asdict
+from typing import Callable, Iterable, List, Optional, Tuple
+from src.domain.entities.block import Block, HEADER_BLOCK_VERSION
+from src.domain.interfaces.blockchain_repository import BlockchainRepository
+from src.domain.interfaces.cryptography_service import CryptographyService
+
+# (first invalid height or None, reason, blocks checked, signatures checked)
+ChunkResult = Tuple[Optional[int], Optional[str], int, int]
+
+@dataclass
+class ValidationReport:
+    """
+    Outcome of a ledger audit.
+    """
+    valid: bool
+    start_height: int
+    validated_height: int
+    blocks_checked: int
+    signatures_checked: int
+    first_invalid_block: Optional[int] = None
+    reason: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self):
+        return asdict(self)
+
+def validate_blocks(
+    crypto_service: CryptographyService,
+    blocks: List[Block],
+    previous_hash: Optional[str],
+    check_signatures: bool = True,
+    difficulty: int = 0
+) -> ChunkResult:
+    """
+    Validate a contiguous run of blocks: link to the previous block, transactions
+    digest, header hash, proof of work for 'difficulty' (blocks after the genesis)
+    and every non-SYSTEM signature. Runs inside pool workers.
+    """
+    checked = len(blocks)
+    failure: Tuple[Optional[int], Optional[str]] = (None, None)
+    for position, block in enumerate(blocks):
+        if block.index > 0 and previous_hash is not None and block.previous_hash != previous_hash:
+            failure = (block.index, "Broken link to previous block")
+        elif block.version >= HEADER_BLOCK_VERSION and block.tx_root != crypto_service.calculate_tx_root(
+            block.transactions, block.version
+        ):
+            failure = (block.index, "Transactions do not match tx_root")
+        elif block.hash != crypto_service.header_hasher(block).hash_nonce(block.nonce):
+            failure = (block.index, "Block hash mismatch")
+        elif block.index > 0 and not block.hash.startswith("0" * difficulty):
+            failure = (block.index, "Block does not meet the proof of work target")
+
+        if failure[0] is not None:
+            checked = position
+            break
+        previous_hash = block.hash
+
+    # Signatures of every structurally valid block are verified as one batch
+    signed = [
+        (block, tx)
+        for block in blocks[:checked] if check_signatures
+        for tx in block.transactions if tx.owner != "SYSTEM"
+    ]
+    results = crypto_service.verify_many(
+        (tx.owner, tx.signature or "", crypto_service.calculate_tx_hash(tx, block.version))
+        for block, tx in signed
+    )
+    for (block, tx), ok in zip(signed, results):
+        if not ok:
+            return block.index, f"Invalid signature for document {tx.document_hash}", 0, len(signed)
+
+    if failure[0] is not None:
+        return failure[0], failure[1], 0, len(signed)
+    return None, None, len(blocks), len(signed)
+
+class ChainValidator:
+    """
+    Full-ledger audit engine. Blocks are streamed from the repository in chunks and
+    validated in parallel on a process pool, including transaction signatures.
+    A successful run records a trusted checkpoint (height + hash) so the next run
+    only validates the blocks added since.
+    """
+    def __init__(
+        self,
+        crypto_service: CryptographyService,
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+        checkpoint_path: Optional[str] = "validation_checkpoint.json",
+        check_signatures: bool = True
+    ):
+        self.crypto_service = crypto_service
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.checkpoint_path = checkpoint_path
+        self.check_signatures = check_signatures
+
+    # --- Checkpoint ---
+
+    def load_checkpoint(self) -> Optional[Tuple[int, str]]:
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path, "r") as f:
+            data = json.load(f)
+        return data["height"], data["block_hash"]
+
+    def save_checkpoint(self, height: int, block_hash: str):
+        if not self.checkpoint_path:
+            return
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"height": height, "block_hash": block_hash, "validated_at": time.time()}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    # --- Validation ---
+
+    def validate_repository(
+        self,
+        repository: BlockchainRepository,
+        full: bool = False,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> ValidationReport:
+        """
+        Audit the stored ledger, resuming after the trusted checkpoint unless 'full' is set.
+        'on_progress' receives (validated height, blocks checked so far).
+        """
+        checkpoint = None if full else self.load_checkpoint()
+        start_height = checkpoint[0] if checkpoint else 0
+        chunks = repository.iter_chain(self.chunk_size, start_height)
+        return self.validate_chunks(chunks, checkpoint, on_progress)
+
+    def validate_chain(self, chain: List[Block], on_progress: Optional[Callable[[int, int], None]] = None) -> ValidationReport:
+        chunks = (chain[i:i + self.chunk_size] for i in range(0, len(chain), self.chunk_size))
+        return self.validate_chunks(chunks, None, on_progress)
+
+    def validate_chunks(
+        self,
+        chunks: Iterable[List[Block]],
+        checkpoint: Optional[Tuple[int, str]] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> ValidationReport:
+        started = time.perf_counter()
+        report = ValidationReport(True, 0, -1, 0, 0)
+        previous_hash = None
+        chunks = iter(chunks)
+
+        if checkpoint:
+            # The checkpointed block itself is trusted, but it must still be the one we validated
+            height, block_hash = checkpoint
+            first = next(chunks, [])
+            if not first or first[0].index != height or first[0].hash != block_hash:
+                report.valid = False
+                report.first_invalid_block = height
+                report.reason = "Checkpoint block no longer matches the stored chain"
+                report.elapsed_seconds = time.perf_counter() - started
+                return report
+            report.start_height = height + 1
+            report.validated_height = height
+            previous_hash = block_hash
+            chunks = self._prepend(first[1:], chunks)
+
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        in_flight: "deque[Tuple[Future, Block]]" = deque()
+        try:
+            for blocks in chunks:
+                if not blocks:
+                    continue
+                in_flight.append((self._submit(pool, blocks, previous_hash), blocks[-1]))
+                previous_hash = blocks[-1].hash
+
+                # Bounded window; results are consumed in height order
+                while len(in_flight) >= self.workers * 2:
+                    if not self._collect(in_flight.popleft(), report, on_progress):
+                        return self._finish(report, started)
+
+            while in_flight:
+                if not self._collect(in_flight.popleft(), report, on_progress):
+                    return self._finish(report, started)
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+
+        return self._finish(report, started, tip=previous_hash)
+
+    def _submit(self, pool: Optional[ProcessPoolExecutor], blocks: List[Block], previous_hash: Optional[str]) -> Future:
+        if pool:
+            return pool.submit(validate_blocks, self.crypto_service, blocks, previous_hash, self.check_signatures)
+        future = Future()
+        future.set_result(validate_blocks(self.crypto_service, blocks, previous_hash, self.check_signatures))
+        return future
+
+    def _collect(self, item: Tuple[Future, Block], report: ValidationReport, on_progress) -> bool:
+        future, last_block = item
+        invalid_height, reason, blocks_checked, signatures = future.result()
+        report.signatures_checked += signatures
+        if invalid_height is not None:
+            report.valid = False
+            report.first_invalid_block = invalid_height
+            report.reason = reason
+            report.blocks_checked += invalid_height - (report.validated_height + 1)
+            report.validated_height = invalid_height - 1
+            return False
+
+        report.blocks_checked += blocks_checked
+        report.validated_height = last_block.index
+        if on_progress:
+            on_progress(report.validated_height, report.blocks_checked)
+        return True
+
+    def _finish(self, report: ValidationReport, started: float, tip: Optional[str] = None) -> ValidationReport:
+        report.elapsed_seconds = time.perf_counter() - started
+        if report.valid and tip is not None and report.validated_height >= 0:
+            self.save_checkpoint(report.validated_height, tip)
+        return report
+
+    @staticmethod
+    def _prepend(first: List[Block], rest: Iterable[List[Block]]) -> Iterable[List[Block]]:
+        if first:
+            yield first
+        yield from rest
@@ -0,0 +1,109 @@
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+from src.domain.entities.block import Block
+
+# (block index, position of the transaction inside the block)
+Location = Tuple[int, int]
+Entry = Union[Location, List[Location]]
+
+class DocumentIndex:
+    """
+    In-memory index from document hash to the location of its notarization.
+    Built once from the loaded chain and extended as blocks are mined, so lookups
+    are O(1) regardless of ledger size. SYSTEM transactions are not indexed.
+    An index restored from a snapshot keeps the snapshot's entries as a read-only 'base'
+    (every block up to 'base_height', looked up as the snapshot store provides them);
+    only later blocks are held in the dict.
+    """
+    def __init__(
+        self,
+        entries: Optional[Dict[str, Entry]] = None,
+        base: Optional[Mapping[str, Entry]] = None,
+        base_height: int = -1
+    ):
+        # A single location in the common case; a list only when a document was notarized more than once
+        self._entries: Dict[str, Entry] = entries if entries is not None else {}
+        self._base: Mapping[str, Entry] = base if base is not None else {}
+        self._base_height = base_height if base is not None else -1
+
+    def build(self, chain: Iterable[Block]):
+        self._entries = {}
+        self._base, self._base_height = {}, -1
+        for block in chain:
+            self.add_block(block)
+
+    def add_block(self, block: Block):
+        for position, tx in enumerate(block.transactions):
+            if tx.owner == "SYSTEM":
+                continue
+            location = (block.index, position)
+            current = self._entries.get(tx.document_hash)
+            if current is None:
+                self._entries[tx.document_hash] = location
+            elif isinstance(current, list):
+                current.append(location)
+            else:
+                self._entries[tx.document_hash] = [current, location]
+
+    def copy(self) -> "DocumentIndex":
+        """
+        Quick copy that shares the location lists. They only ever grow with later blocks,
+        so copy_below on the copy still gives an exact cut at any height it covered.
+        """
+        return DocumentIndex(dict(self._entries), self._base, self._base_height)
+
+    def copy_below(self, height: int) -> "DocumentIndex":
+        """Independent copy holding only the notarizations in blocks below 'height'."""
+        if height > self._base_height:
+            return DocumentIndex(self._below(self._entries.items(), height), self._base, self._base_height)
+        # The base itself is cut: the result is a plain index
+        return DocumentIndex(self._below(self._base.items(), height))
+
+    def items(self) -> Iterator[Tuple[str, Entry]]:
+        """(document hash, location or list of locations) pairs, e.g. for snapshots."""
+        for document_hash, entry in self._base.items():
+            yield document_hash, self._combine(entry, self._entries.get(document_hash))
+        for document_hash, entry in self._entries.items():
+            if document_hash not in self._base:
+                yield document_hash, entry
+
+    def lookup(self, document_hash: str) -> Optional[Location]:
+        """First (oldest) notarization of the document."""
+        entry = self._base.get(document_hash) or self._entries.get(document_hash)
+        if isinstance(entry, list):
+            return entry[0]
+        return entry
+
+    def lookup_all(self, document_hash: str) -> List[Location]:
+        entry = self._combine(self._base.get(document_hash), self._entries.get(document_hash))
+        if entry is None:
+            return []
+        if isinstance(entry, list):
+            return list(entry)
+        return [entry]
+
+    def __contains__(self, document_hash: str) -> bool:
+        return document_hash in self._entries or document_hash in self._base
+
+    def __len__(self) -> int:
+        return len(self._base) + sum(1 for document_hash in self._entries if document_hash not in self._base)
+
+    @staticmethod
+    def _below(entries: Iterable[Tuple[str, Entry]], height: int) -> Dict[str, Entry]:
+        below: Dict[str, Entry] = {}
+        for document_hash, entry in entries:
+            if isinstance(entry, list):
+                kept = [location for location in entry if location[0] < height]
+                if len(kept) > 1:
+                    below[document_hash] = kept
+                elif kept:
+                    below[document_hash] = kept[0]
+            elif entry[0] < height:
+                below[document_hash] = entry
+        return below
+
+    @staticmethod
+    def _combine(older: Optional[Entry], newer: Optional[Entry]) -> Optional[Entry]:
+        if older is None or newer is None:
+            return older if newer is None else newer
+        locations = older if isinstance(older, list) else [older]
+        return locations + (newer if isinstance(newer, list) else [newer])
@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Union
+from src.domain.entities.block import Block
+from src.domain.interfaces.blockchain_repository import BlockchainRepository
+
+class LazyChain:
+    """
+    List-like view of the stored chain that reads blocks from the repository on demand,
+    so a node does not hold (or load) the whole ledger to serve it. Supports what the
+    services use on a chain: len, indexing, slicing, iteration, append and pop of the tip.
+    Recently read blocks stay in a bounded LRU cache; the tip is always held, since it is
+    appended before the repository has stored it.
+    """
+    def __init__(self, repository: BlockchainRepository, length: int, cache_blocks: int = 4096, page_blocks: int = 100):
+        self.repository = repository
+        self.cache_blocks = cache_blocks
+        self.page_blocks = page_blocks
+        self._length = length
+        self._tip: Optional[Block] = None
+        self._cache: "OrderedDict[int, Block]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Block, List[Block]]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                return [self[height] for height in range(start, stop, step)]
+            return self._load(start, stop)
+
+        height = key + self._length if key < 0 else key
+        if not 0 <= height < self._length:
+            raise IndexError("chain index out of range")
+        return self._load(height, height + 1)[0]
+
+    def __iter__(self) -> Iterator[Block]:
+        length = self._length
+        for start in range(0, length, self.page_blocks):
+            yield from self._load(start, min(start + self.page_blocks, length))
+
+    def append(self, block: Block):
+        with self._lock:
+            self._remember(block)
+            self._tip = block
+            self._length += 1
+
+    def pop(self) -> Block:
+        """Remove and return the tip (used when the tip could not be persisted)."""
+        block = self[-1]
+        with self._lock:
+            self._cache.pop(block.index, None)
+            self._tip = None
+            self._length -= 1
+        return block
+
+    def with_blocks_from(self, height: int, blocks: List[Block]) -> "LazyChain":
+        """New view of this chain with every block from 'height' on replaced by 'blocks' (already stored)."""
+        chain = LazyChain(self.repository, height + len(blocks), self.cache_blocks, self.page_blocks)
+        with self._lock:
+            kept = [block for index, block in self._cache.items() if index < height]
+        for block in kept + blocks[-self.cache_blocks:]:
+            chain._remember(block)
+        if blocks:
+            chain._tip = blocks[-1]
+        return chain
+
+    def _load(self, start: int, stop: int) -> List[Block]:
+        if start >= stop:
+            return []
+        with self._lock:
+            blocks = [self._cached(height) for height in range(start, stop)]
+        if all(block is not None for block in blocks):
+            return blocks
+
+        # Read the missing range in one query, from the first block not in memory
+        first = blocks.index(None)
+        stored = self.repository.get_blocks(start + first, stop - start - first)
+        with self._lock:
+            for block in stored:
+                if block.index < stop:
+                    blocks[block.index - start] = block
+                    self._remember(block)
+            # The unpersisted tip is never read from the repository
+            if self._tip is not None and start <= self._tip.index < stop:
+                blocks[self._tip.index - start] = self._tip
+        if any(block is None for block in blocks):
+            raise IndexError(f"Blocks {start}-{stop - 1} are not all in the repository")
+        return blocks
+
+    def _cached(self, height: int) -> Optional[Block]:
+        if self._tip is not None and self._tip.index == height:
+            return self._tip
+        block = self._cache.get(height)
+        if block is not None:
+            self._cache.move_to_end(height)
+        return block
+
+    def _remember(self, block: Block):
+        self._cache[block.index] = block
+        self._cache.move_to_end(block.index)
+        while len(self._cache) > self.cache_blocks:
+            self._cache.popitem(last=False)
@@ -0,0 +1,77 @@
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, List, Optional
+from src.domain.entities.block import Block
+from src.domain.interfaces.blockchain_repository import BlockchainRepository
+
+@dataclass
+class MigrationReport:
+    """
+    Outcome of copying a ledger from one repository to another.
+    """
+    start_height: int
+    blocks_copied: int = 0
+    transactions_copied: int = 0
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self):
+        return asdict(self)
+
+def migrate_chain(
+    source: BlockchainRepository,
+    target: BlockchainRepository,
+    batch_blocks: int = 20,
+    on_progress: Optional[Callable[[int, int], None]] = None
+) -> MigrationReport:
+    """
+    Stream the source chain onto the end of the target, 'batch_blocks' blocks per append_blocks
+    call. Blocks the target already holds are skipped, so an interrupted migration resumes where
+    it stopped; the target's tip must then be the source block at that height. Checks indexes and
+    links as it copies; signatures are left to the ledger audit.
+    """
+    started = time.perf_counter()
+    height = target.chain_length()
+    report = MigrationReport(start_height=height)
+    previous_hash = target.get_blocks(height - 1, 1)[0].hash if height > 0 else None
+
+    # Read from the target's tip on, to check the overlap
+    overlap_checked = height == 0
+    for blocks in source.iter_chain(batch_blocks, max(height - 1, 0)):
+        if not overlap_checked:
+            overlap_checked = True
+            if blocks[0].index != height - 1 or blocks[0].hash != previous_hash:
+                report.error = f"the target already holds a different block {height - 1}"
+                break
+            blocks = blocks[1:]
+
+        report.error = _check_batch(blocks, height + report.blocks_copied, previous_hash)
+        if report.error is None and blocks and not target.append_blocks(blocks):
+            report.error = f"could not store blocks {blocks[0].index}..{blocks[-1].index}"
+        if report.error:
+            break
+
+        if blocks:
+            previous_hash = blocks[-1].hash
+            report.blocks_copied += len(blocks)
+            report.transactions_copied += sum(len(block.transactions) for block in blocks)
+            if on_progress:
+                on_progress(blocks[-1].index, report.blocks_copied)
+
+    if report.error is None and not overlap_checked:
+        report.error = f"the target holds {height} blocks, more than the source"
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+def _check_batch(blocks: List[Block], expected_index: int, previous_hash: Optional[str]) -> Optional[str]:
+    for block in blocks:
+        if block.index != expected_index:
+            return f"unexpected block index {block.index}, expected {expected_index}"
+        if previous_hash is not None and block.previous_hash != previous_hash:
+            return f"block {block.index} does not link to the previous block"
+        expected_index, previous_hash = expected_index + 1, block.hash
+    return None
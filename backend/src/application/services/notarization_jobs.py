@@ -0,0 +1,138 @@
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, List, Optional, Union
+from src.domain.entities.block import Block
+from src.application.services.block_producer import NotarizationReceipt, RECEIPT_CONFIRMED, RECEIPT_FAILED
+
+JOB_QUEUED = "queued"
+JOB_MINING = "mining"
+JOB_CONFIRMED = "confirmed"
+JOB_FAILED = "failed"
+
+# A job task signs and records one notarization: it returns the sealed block,
+# or the receipt of the block producer that will seal it
+JobTask = Callable[[], Union[Block, NotarizationReceipt]]
+
+class JobQueueFull(Exception):
+    """Raised when the bounded job queue cannot take another notarization."""
+
+@dataclass
+class NotarizationJob:
+    """
+    Status handle of a notarization accepted by the job queue.
+    """
+    document_hash: str
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = JOB_QUEUED
+    block_index: Optional[int] = None
+    block_hash: Optional[str] = None
+    error: Optional[str] = None
+    # Local user who submitted it; only they can poll it
+    user_id: Optional[int] = None
+    receipt: Optional[NotarizationReceipt] = field(default=None, repr=False)
+    handled: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job is confirmed or failed."""
+        if not self.handled.wait(timeout):
+            return False
+        return self.receipt.wait(timeout) if self.receipt else True
+
+    def to_dict(self) -> Dict[str, Any]:
+        self._sync_receipt()
+        data = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "document_hash": self.document_hash,
+            "block_index": self.block_index,
+            "block_hash": self.block_hash
+        }
+        if self.error:
+            data["error"] = self.error
+        return data
+
+    def _sync_receipt(self):
+        # Batched notarizations stay 'mining' until the producer seals their block
+        receipt = self.receipt
+        if self.status != JOB_MINING or receipt is None or not receipt.sealed.is_set():
+            return
+        if receipt.status == RECEIPT_CONFIRMED:
+            self.block_index, self.block_hash = receipt.block_index, receipt.block_hash
+            self.status = JOB_CONFIRMED
+        elif receipt.status == RECEIPT_FAILED:
+            self.error = receipt.error
+            self.status = JOB_FAILED
+
+class NotarizationJobQueue:
+    """
+    Runs notarization tasks (key generation, signing, mining, persistence) on a pool of
+    worker threads so request handlers only enqueue them. The queue is bounded:
+    submit() raises JobQueueFull once 'max_queued' jobs are waiting.
+    """
+    def __init__(self, workers: int = 2, max_queued: int = 1000, max_jobs: int = 100000):
+        self.workers = max(1, workers)
+        self.max_jobs = max_jobs
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max_queued)
+        self._jobs: "OrderedDict[str, NotarizationJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        if not self._threads:
+            for n in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f"notarization-worker-{n}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Finish the jobs already queued, then stop the workers."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, document_hash: str, task: JobTask, user_id: Optional[int] = None) -> NotarizationJob:
+        job = NotarizationJob(document_hash, user_id=user_id)
+        try:
+            self._queue.put_nowait((job, task))
+        except queue.Full:
+            raise JobQueueFull(f"Notarization queue is full ({self._queue.maxsize} jobs)")
+        with self._lock:
+            # Keep a bounded window of jobs so polling clients can still find recent ones
+            self._jobs[job.job_id] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+        return job
+
+    def get_job(self, job_id: str) -> Optional[NotarizationJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            job, task = item
+            job.status = JOB_MINING
+            try:
+                outcome = task()
+            except Exception as e:
+                print(f"❌ Error in notarization job {job.job_id}: {str(e)}")
+                job.error = str(e)
+                job.status = JOB_FAILED
+            else:
+                if isinstance(outcome, NotarizationReceipt):
+                    job.receipt = outcome
+                else:
+                    job.block_index, job.block_hash = outcome.index, outcome.hash
+                    job.status = JOB_CONFIRMED
+            job.handled.set()
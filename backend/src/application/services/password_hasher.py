@@ -0,0 +1,45 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+from src.application.services.auth_service import AuthService
+
+T = TypeVar("T")
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many password hashes are already waiting for a worker."""
+
+class PasswordHasherPool:
+    """
+    Runs bcrypt hashing and verification on a small dedicated thread pool, so logins
+    neither block the event loop nor hold the threads serving other requests.
+    At most 'max_pending' operations may be running or waiting; beyond that the
+    coroutines raise PasswordHasherBusy instead of queueing more CPU work.
+    """
+    def __init__(self, workers: int = 2, max_pending: int = 64):
+        self.workers = max(1, workers)
+        self.max_pending = max(self.workers, max_pending)
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="password-hasher")
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        return await self._run(AuthService.get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(AuthService.verify_password, plain_password, hashed_password)
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PasswordHasherBusy(f"{self._pending} password hashes already pending")
+            self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
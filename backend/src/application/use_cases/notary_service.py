@@ -1,10 +1,34 @@
 import os
 import hashlib
-from typing import Dict, Any, List, Optional
+import urllib.parse
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import BinaryIO, Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+from src.domain.entities.block import Block, MERKLE_BLOCK_VERSION, CURRENT_BLOCK_VERSION
 from src.domain.entities.blockchain import Blockchain
 from src.domain.entities.transaction import Transaction
-from src.domain.interfaces.blockchain_repository import BlockchainRepository
+from src.domain.interfaces.blockchain_repository import BlockchainRepository, TransactionOwners
 from src.domain.interfaces.cryptography_service import CryptographyService
+from src.domain.interfaces.snapshot_store import LedgerSnapshot, SnapshotStore
+from src.application.services.document_index import DocumentIndex
+from src.application.services.lazy_chain import LazyChain
+from src.application.services.chain_validator import validate_blocks
+from src.application.services.block_producer import (
+    BlockProducer, NotarizationReceipt, RECEIPT_CONFIRMED, RECEIPT_FAILED
+)
+
+# Read size used when hashing documents
+HASH_CHUNK_SIZE = 1024 * 1024
+# Blocks per validate_blocks call when catching up on blocks replayed after a snapshot
+VALIDATION_CHUNK_BLOCKS = 100
+# verify_hashes resolves this many digests together, reading their blocks as height ranges;
+# heights up to RANGE_GAP_BLOCKS apart share a range of at most RANGE_MAX_BLOCKS blocks
+VERIFY_BATCH_HASHES = 1000
+RANGE_GAP_BLOCKS = 8
+RANGE_MAX_BLOCKS = 100
 
 class NotaryService:
     """
@@ -14,16 +38,117 @@ class NotaryService:
         self, 
         blockchain: Blockchain, 
         repository: BlockchainRepository,
-        crypto_service: CryptographyService
+        crypto_service: CryptographyService,
+        node_address: str = "NOTARY_NODE",
+        snapshot_store: Optional[SnapshotStore] = None,
+        snapshot_every_blocks: int = 0,
+        load: bool = True
     ):
         self.blockchain = blockchain
         self.repository = repository
         self.crypto_service = crypto_service
-        
-        # Load existing chain if available
-        existing_chain = self.repository.load_chain()
-        if existing_chain:
-            self.blockchain.chain = existing_chain
+        self.node_address = node_address
+        self.block_producer: Optional[BlockProducer] = None
+        # Serializes mining, persistence and index updates
+        self._chain_lock = threading.RLock()
+        # Called with every block once it is persisted and indexed
+        self._block_listeners: List[Callable[[Block], None]] = []
+
+        # Ledger snapshots: written every 'snapshot_every_blocks' blocks (0: only on request)
+        self.snapshot_store = snapshot_store
+        self.snapshot_every_blocks = snapshot_every_blocks
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_height = -1
+        # Every block up to this height has been validated (links, hashes, signatures)
+        self.validated_height = -1
+        self._validation_lock = threading.Lock()
+
+        # Document hash -> block/position, shared by verification and certificate lookups
+        self.document_index = DocumentIndex()
+
+        if self.snapshot_store and self.snapshot_every_blocks > 0:
+            self.add_block_listener(self._snapshot_listener)
+
+        # With load=False the caller runs load() itself, e.g. once the API has started
+        if load:
+            self.load()
+
+    def load(self):
+        """
+        Load the stored ledger, from the latest snapshot when possible, and the known peers.
+        """
+        if not self._load_from_snapshot():
+            self._load_from_repository()
+
+        # Peers registered in earlier runs
+        self.blockchain.nodes.update(self.repository.load_nodes())
+
+    def _load_from_snapshot(self) -> bool:
+        """
+        Start from the latest snapshot: its document index is loaded as is and only the blocks
+        stored after it are read and indexed; they are validated in the background. Needs a
+        random-access repository, since the chain is then served lazily. False if there is
+        no usable snapshot.
+        """
+        if not self.snapshot_store or not self.repository.random_access:
+            return False
+        snapshot = self.snapshot_store.load()
+        if snapshot is None:
+            return False
+        length = self.repository.chain_length()
+        stored = self.repository.get_blocks(snapshot.height, 1)
+        if not stored or stored[0].hash != snapshot.tip.hash:
+            print(f"⚠️ Ledger snapshot at height {snapshot.height} does not match the stored chain, reindexing")
+            return False
+
+        index = DocumentIndex(base=snapshot.documents, base_height=snapshot.height)
+        for blocks in self.repository.iter_chain(start_height=snapshot.height + 1):
+            for block in blocks:
+                index.add_block(block)
+
+        self.document_index = index
+        self.blockchain.chain = LazyChain(self.repository, length)
+        self.validated_height = snapshot.validated_height
+        self._snapshot_height = snapshot.height
+        print(f"📸 Loaded ledger snapshot at height {snapshot.height}, replayed {length - snapshot.height - 1} blocks")
+
+        # Only the replayed blocks are checked here; a ledger never validated is left to a full audit
+        if snapshot.validated_height == snapshot.height < length - 1:
+            threading.Thread(target=self.validate_new_blocks, name="ledger-validation", daemon=True).start()
+        if 0 < self.snapshot_every_blocks <= length - 1 - snapshot.height:
+            self.save_snapshot_async()
+        return True
+
+    def _load_from_repository(self):
+        """
+        Stream the stored chain (if any) and index it chunk by chunk. Random-access repositories
+        keep serving the blocks, so only other repositories' chains are held in memory.
+        """
+        lazy = self.repository.random_access
+        existing_chain = []
+        length = 0
+        for blocks in self.repository.iter_chain():
+            length += len(blocks)
+            if not lazy:
+                existing_chain.extend(blocks)
+            for block in blocks:
+                self.document_index.add_block(block)
+
+        if length:
+            self.blockchain.chain = LazyChain(self.repository, length) if lazy else existing_chain
+        else:
+            # Fresh ledger: persist the genesis block so later blocks can be appended
+            if not self.blockchain.chain:
+                self.blockchain.create_genesis_block()
+            self.repository.save_chain(self.blockchain.chain)
+            self.document_index.build(self.blockchain.chain)
+            self.validated_height = len(self.blockchain.chain) - 1
+            if lazy:
+                self.blockchain.chain = LazyChain(self.repository, len(self.blockchain.chain))
+
+        # So the next start can skip this scan
+        if self.snapshot_store and lazy and self.snapshot_every_blocks > 0:
+            self.save_snapshot_async()
 
     def notarize_file(self, file_path: str, owner_address: str, private_key: Any, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -32,50 +157,422 @@ class NotaryService:
         # 1. Calculate file hash
         file_hash = self._calculate_file_hash(file_path)
         
-        # 2. Create and sign transaction
         metadata = metadata or {}
         metadata["filename"] = os.path.basename(file_path)
-        
-        transaction = Transaction(owner_address, file_hash, metadata)
-        tx_hash = self.crypto_service.calculate_hash(transaction)
-        transaction.signature = self.crypto_service.sign_data(tx_hash, private_key)
-        
-        # 3. Add to blockchain
-        self.blockchain.add_transaction(transaction)
-        
-        # 4. Mine and Persist
-        new_block = self.blockchain.mine_pending_transactions(owner_address)
-        self.repository.save_chain(self.blockchain.chain)
-        
+        return self.notarize_hash(file_hash, owner_address, private_key, metadata)
+
+    def notarize_hash(self, file_hash: str, owner_address: str, private_key: Any, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Sign and record an already computed document hash.
+        With a running block producer the result is a pending receipt; otherwise a block is mined right away.
+        """
+        outcome = self.record_hash(file_hash, owner_address, private_key, metadata)
+        if isinstance(outcome, NotarizationReceipt):
+            return outcome.to_dict()
+
         return {
             "status": "success",
-            "block_index": new_block.index,
-            "block_hash": new_block.hash,
+            "block_index": outcome.index,
+            "block_hash": outcome.hash,
             "document_hash": file_hash
         }
 
-    def verify_document(self, file_path: str) -> Dict[str, Any]:
+    def record_hash(
+        self, file_hash: str, owner_address: str, private_key: Any, metadata: Dict[str, Any] = None
+    ) -> Union[Block, NotarizationReceipt]:
         """
-        Verify if a document exists in the blockchain and is intact.
+        Same as notarize_hash, returning the sealed block or the block producer's receipt.
         """
-        file_hash = self._calculate_file_hash(file_path)
+        # 2. Create and sign transaction
+        transaction = Transaction(owner_address, file_hash, metadata or {})
+        tx_hash = self.crypto_service.calculate_tx_hash(transaction)
+        transaction.signature = self.crypto_service.sign_data(tx_hash, private_key)
         
-        for block in self.blockchain.chain:
-            for tx in block.transactions:
-                if tx.document_hash == file_hash:
-                    return {
-                        "verified": True,
-                        "owner": tx.owner,
-                        "timestamp": tx.timestamp,
-                        "metadata": tx.metadata,
-                        "block": block.index
-                    }
+        # 3. Validate before it enters the mempool
+        self.blockchain.verify_transaction(transaction)
         
-        return {"verified": False, "reason": "Hash not found in blockchain"}
+        # 4. Queue for the next block, or mine and persist immediately
+        if self.block_producer:
+            return self.block_producer.submit(transaction)
+        return self.seal_block([transaction], owner_address)
 
-    def _calculate_file_hash(self, file_path: str) -> str:
+    def record_hashes(
+        self, items: List[Tuple[str, Dict[str, Any]]], owner_address: str, private_key: Any
+    ) -> List[NotarizationReceipt]:
+        """
+        Sign and admit many (document hash, metadata) pairs as one group.
+        They share as few blocks as possible: one block when mined right away, or consecutive
+        producer batches. Returns a receipt per item, in order.
+        """
+        transactions = []
+        for file_hash, metadata in items:
+            transaction = Transaction(owner_address, file_hash, metadata or {})
+            transaction.signature = self.crypto_service.sign_data(
+                self.crypto_service.calculate_tx_hash(transaction), private_key
+            )
+            transactions.append(transaction)
+        self.blockchain.verify_transactions(transactions)
+
+        if self.block_producer:
+            return self.block_producer.submit_many(transactions)
+
+        receipts = [NotarizationReceipt(tx.document_hash, user_id=tx.metadata.get("user_id")) for tx in transactions]
+        try:
+            block = self.seal_block(transactions, owner_address)
+        except Exception as e:
+            for receipt in receipts:
+                receipt.status, receipt.error = RECEIPT_FAILED, str(e)
+                receipt.sealed.set()
+            raise
+        for receipt in receipts:
+            receipt.status, receipt.block_index, receipt.block_hash = RECEIPT_CONFIRMED, block.index, block.hash
+            receipt.sealed.set()
+        return receipts
+
+    def seal_block(
+        self, transactions: List[Transaction], miner_address: Optional[str] = None, owners: Optional[TransactionOwners] = None
+    ) -> Block:
+        """
+        Mine the given (already verified) transactions into a block, persist it and index it.
+        'owners' is passed on to the repository for re-sealed orphans.
+        """
+        with self._chain_lock:
+            queued = len(self.blockchain.pending_transactions)
+            self.blockchain.pending_transactions.extend(transactions)
+            try:
+                new_block = self.blockchain.mine_pending_transactions(miner_address or self.node_address)
+            except Exception:
+                del self.blockchain.pending_transactions[queued:]
+                raise
+            if not self.repository.append_block(new_block, owners):
+                self.blockchain.chain.pop()
+                raise RuntimeError(f"Failed to persist block {new_block.index}")
+            self.document_index.add_block(new_block)
+            # Mined here from verified transactions
+            if self.validated_height == new_block.index - 1:
+                self.validated_height = new_block.index
+
+        self._notify_block_listeners([new_block])
+        return new_block
+
+    def replace_chain_from(self, height: int, blocks: List[Block]) -> Tuple[List[Transaction], TransactionOwners]:
+        """
+        Replace every block from 'height' on with 'blocks' (already validated), provided the
+        result is longer than the current chain and 'blocks' link to the block below 'height'.
+        Returns the signed transactions of the dropped blocks that the new blocks do not contain,
+        and the local users the repository held for the dropped transactions.
+        """
+        with self._chain_lock:
+            chain = self.blockchain.chain
+            if height + len(blocks) <= len(chain):
+                raise ValueError("The replacement does not make the chain longer")
+            if height > len(chain) or (height > 0 and blocks[0].previous_hash != chain[height - 1].hash):
+                raise ValueError(f"The replacement does not link to block {height - 1}")
+            owners = self.repository.transaction_owners(height)
+            if not self.repository.replace_from(height, blocks):
+                raise RuntimeError(f"Failed to persist the chain from block {height}")
+
+            dropped = chain[height:]
+            if isinstance(chain, LazyChain):
+                new_chain = chain.with_blocks_from(height, blocks)
+            else:
+                new_chain = chain[:height] + blocks
+            # Readers keep using the previous index until the new one is complete
+            index = self.document_index.copy_below(height)
+            for block in blocks:
+                index.add_block(block)
+            self.blockchain.chain = new_chain
+            self.document_index = index
+            self.validated_height = len(new_chain) - 1 if self.validated_height >= height - 1 else self.validated_height
+            # The last snapshot may now describe a dropped block
+            stale_snapshot = self._snapshot_height >= height
+            if stale_snapshot:
+                self._snapshot_height = height - 1
+
+        self._notify_block_listeners(blocks)
+        if stale_snapshot and self.snapshot_store and self.snapshot_every_blocks > 0:
+            self.save_snapshot_async()
+        kept = {(tx.document_hash, tx.signature) for block in blocks for tx in block.transactions}
+        orphans = [
+            tx for block in dropped for tx in block.transactions
+            if tx.owner != "SYSTEM" and (tx.document_hash, tx.signature) not in kept
+        ]
+        return orphans, owners
+
+    def resubmit_transactions(self, transactions: List[Transaction], owners: Optional[TransactionOwners] = None) -> int:
+        """
+        Put transactions orphaned by a chain replacement back on the way to a block.
+        Only current-format transactions are re-sealed: their signatures cover the current
+        transaction hash, and this node never mines blocks in an older format. The others are
+        dropped with a warning. With 'owners' (from replace_chain_from) they are sealed in a
+        block of their own that keeps the local users they had. Returns how many were resubmitted.
+        """
+        resubmitted = []
+        for tx in transactions:
+            ok = tx.signature and self.crypto_service.verify_signature(
+                tx.owner, tx.signature, self.crypto_service.calculate_tx_hash(tx, CURRENT_BLOCK_VERSION)
+            )
+            if ok:
+                resubmitted.append(tx)
+            else:
+                print(f"⚠️ Dropping orphaned transaction for document {tx.document_hash}: older block format")
+        if resubmitted:
+            if self.block_producer and owners is None:
+                self.block_producer.submit_many(resubmitted)
+            else:
+                self.seal_block(resubmitted, owners=owners)
+        return len(resubmitted)
+
+    def _notify_block_listeners(self, blocks: List[Block]):
+        for block in blocks:
+            for listener in self._block_listeners:
+                try:
+                    listener(block)
+                except Exception as e:
+                    print(f"⚠️ Block listener failed for block {block.index}: {e}")
+
+    def validate_new_blocks(self) -> int:
+        """
+        Validate the blocks above validated_height, up to the tip, including signatures.
+        Stops at the first invalid block. Returns the new validated height.
+        """
+        with self._validation_lock:
+            while True:
+                with self._chain_lock:
+                    chain = self.blockchain.chain
+                    start = self.validated_height + 1
+                    if start >= len(chain):
+                        return self.validated_height
+                blocks = chain[start:start + VALIDATION_CHUNK_BLOCKS]
+                previous_hash = chain[start - 1].hash if start > 0 else None
+                invalid_height, reason, _, _ = validate_blocks(self.crypto_service, blocks, previous_hash)
+
+                with self._chain_lock:
+                    # Redo the chunk if the chain was replaced meanwhile
+                    if self.blockchain.chain is not chain or self.validated_height != start - 1:
+                        continue
+                    if invalid_height is not None:
+                        self.validated_height = invalid_height - 1
+                        print(f"⚠️ Block {invalid_height} failed validation: {reason}")
+                        return self.validated_height
+                    self.validated_height = blocks[-1].index
+
+    # --- Ledger snapshots ---
+
+    def take_snapshot(self) -> LedgerSnapshot:
+        """Tip, document index and validated height, captured consistently."""
+        with self._chain_lock:
+            tip = self.blockchain.chain[-1]
+            index = self.document_index.copy()
+            validated_height = min(self.validated_height, tip.index)
+        # Blocks sealed meanwhile are cut off outside the lock
+        documents = dict(index.copy_below(tip.index + 1).items())
+        return LedgerSnapshot(tip, validated_height, documents, time.time())
+
+    def save_snapshot(self) -> bool:
+        """Write a snapshot of the current tip, unless the latest one is already there."""
+        if not self.snapshot_store:
+            return False
+        with self._snapshot_lock:
+            if len(self.blockchain.chain) - 1 == self._snapshot_height:
+                return True
+            snapshot = self.take_snapshot()
+            if not self.snapshot_store.save(snapshot):
+                return False
+            self._snapshot_height = snapshot.height
+            return True
+
+    def save_snapshot_async(self):
+        """save_snapshot on a background thread; skipped while another snapshot is being written."""
+        if self._snapshot_lock.locked():
+            return
+        threading.Thread(target=self.save_snapshot, name="ledger-snapshot", daemon=True).start()
+
+    def _snapshot_listener(self, block: Block):
+        if block.index - self._snapshot_height >= self.snapshot_every_blocks:
+            self.save_snapshot_async()
+
+    def add_block_listener(self, listener: Callable[[Block], None]):
+        """Run 'listener' after each new block is persisted (on the sealing thread, so keep it short)."""
+        self._block_listeners.append(listener)
+
+    @staticmethod
+    def normalize_node_url(node_url: str) -> str:
+        """
+        Canonical form of a peer URL; 'host:port' is read as http://host:port.
+        """
+        parsed = urllib.parse.urlparse(node_url if "://" in node_url else f"http://{node_url}")
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            raise ValueError(f"Invalid node URL: {node_url}")
+        return f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/')}"
+
+    def register_node(self, node_url: str) -> str:
+        """
+        Remember a peer for synchronization. Returns the normalized URL.
+        """
+        url = self.normalize_node_url(node_url)
+        self.blockchain.nodes.add(url)
+        self.repository.save_node(url)
+        return url
+
+    def start_block_producer(self, max_transactions: int = 500, max_wait_seconds: float = 2.0) -> BlockProducer:
+        """
+        Switch to batched notarization: one block per size/time window instead of one per document.
+        """
+        if not self.block_producer:
+            self.block_producer = BlockProducer(self.seal_block, max_transactions, max_wait_seconds)
+            self.block_producer.start()
+        return self.block_producer
+
+    def stop_block_producer(self):
+        if self.block_producer:
+            self.block_producer.stop()
+            self.block_producer = None
+
+    def get_receipt(self, receipt_id: str) -> Optional[NotarizationReceipt]:
+        if not self.block_producer:
+            return None
+        return self.block_producer.get_receipt(receipt_id)
+
+    def verify_document(self, file_path: str) -> Dict[str, Any]:
+        """
+        Verify if a document exists in the blockchain and is intact.
+        """
+        return self.verify_hash(self._calculate_file_hash(file_path))
+
+    def verify_hash(self, document_hash: str) -> Dict[str, Any]:
+        located = self.locate_document(document_hash)
+        if not located:
+            return {"verified": False, "reason": "Hash not found in blockchain"}
+        return self._verification(*located)
+
+    @staticmethod
+    def _verification(block: Block, position: int) -> Dict[str, Any]:
+        tx = block.transactions[position]
+        return {
+            "verified": True,
+            "owner": tx.owner,
+            "timestamp": tx.timestamp,
+            "metadata": tx.metadata,
+            "block": block.index
+        }
+
+    def get_blocks(self, start: int, limit: int, descending: bool = False) -> List[Block]:
+        """
+        Up to 'limit' blocks from height 'start' (inclusive), walking towards the tip or, if descending, towards genesis.
+        """
+        chain = self.blockchain.chain
+        if descending:
+            start = min(start, len(chain) - 1)
+            return [chain[height] for height in range(start, max(start - limit, -1), -1)]
+        return chain[max(start, 0):max(start, 0) + limit]
+
+    def verify_hashes(self, document_hashes: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        verify_hash for many digests, in order. Each batch of digests is probed in the document
+        index first and the blocks it hits are then read together, so a lazily served chain
+        costs a few range reads per batch instead of one read per block.
+        """
+        document_hashes = iter(document_hashes)
+        while True:
+            batch = list(islice(document_hashes, VERIFY_BATCH_HASHES))
+            if not batch:
+                return
+            locations = [self.document_index.lookup(document_hash) for document_hash in batch]
+            blocks = self._blocks_at(location[0] for location in locations if location)
+            for document_hash, location in zip(batch, locations):
+                if location is None:
+                    result = {"verified": False, "reason": "Hash not found in blockchain"}
+                else:
+                    result = self._verification(blocks[location[0]], location[1])
+                result["document_hash"] = document_hash
+                yield result
+
+    def _blocks_at(self, heights: Iterable[int]) -> Dict[int, Block]:
+        """Blocks at the given heights, read as a few contiguous slices of the chain."""
+        chain = self.blockchain.chain
+        blocks: Dict[int, Block] = {}
+        first = last = None
+        for height in sorted(set(heights)):
+            if first is not None and (height - last > RANGE_GAP_BLOCKS or height - first >= RANGE_MAX_BLOCKS):
+                blocks.update((block.index, block) for block in chain[first:last + 1])
+                first = None
+            if first is None:
+                first = height
+            last = height
+        if first is not None:
+            blocks.update((block.index, block) for block in chain[first:last + 1])
+        return blocks
+
+    def locate_document(self, document_hash: str) -> Optional[Tuple[Block, int]]:
+        """
+        Block and transaction position of the first notarization of a document.
+        """
+        location = self.document_index.lookup(document_hash)
+        if location is None:
+            return None
+        block_index, position = location
+        return self.blockchain.chain[block_index], position
+
+    def find_notarizations(self, document_hash: str) -> List[Tuple[Block, Transaction]]:
+        """
+        Every notarization of a document, oldest first.
+        """
+        locations = self.document_index.lookup_all(document_hash)
+        blocks = self._blocks_at(block_index for block_index, _ in locations)
+        return [(blocks[block_index], blocks[block_index].transactions[position]) for block_index, position in locations]
+
+    def get_inclusion_proof(self, document_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Merkle audit path proving a notarization is part of its block.
+        Returns None if the document is unknown; raises ValueError for blocks without a Merkle root.
+        """
+        located = self.locate_document(document_hash)
+        if not located:
+            return None
+
+        block, position = located
+        tx = block.transactions[position]
+        if block.version < MERKLE_BLOCK_VERSION:
+            raise ValueError(f"Block {block.index} predates Merkle proofs (format version {block.version})")
+
+        return {
+            "document_hash": document_hash,
+            "transaction": tx.to_dict(include_signature=False),
+            "tx_hash": self.crypto_service.calculate_tx_hash(tx, block.version),
+            "block_index": block.index,
+            "block_hash": block.hash,
+            "merkle_root": block.tx_root,
+            "proof": self.crypto_service.merkle_proof(block.transactions, position, block.version),
+            "header": block.header_dict()
+        }
+
+    @staticmethod
+    def hash_stream(chunks: Iterable[bytes]) -> str:
+        """
+        SHA-256 of a document delivered in chunks; only one chunk is held at a time.
+        """
         sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        for chunk in chunks:
+            sha256_hash.update(chunk)
         return sha256_hash.hexdigest()
+
+    @classmethod
+    def hash_archive(cls, archive: BinaryIO, workers: Optional[int] = None) -> List[Tuple[str, str]]:
+        """
+        (entry name, SHA-256) of every file in a zip archive. Entries are decompressed
+        and hashed on a thread pool; zlib and hashlib release the GIL on large buffers.
+        """
+        with zipfile.ZipFile(archive) as zf:
+            entries = [info for info in zf.infolist() if not info.is_dir()]
+
+            def hash_entry(info: zipfile.ZipInfo) -> Tuple[str, str]:
+                with zf.open(info) as f:
+                    return info.filename, cls.hash_stream(iter(lambda: f.read(HASH_CHUNK_SIZE), b""))
+
+            with ThreadPoolExecutor(max_workers=workers or min(8, (os.cpu_count() or 1) + 1)) as executor:
+                return list(executor.map(hash_entry, entries))
+
+    def _calculate_file_hash(self, file_path: str) -> str:
+        with open(file_path, "rb") as f:
+            return self.hash_stream(iter(lambda: f.read(HASH_CHUNK_SIZE), b""))
@@ -1,23 +1,67 @@
-from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from .transaction import Transaction
+from .compact_hex import pack_hex, unpack_hex
+
+# Chain format versions. The version decides how a block hash is computed.
+LEGACY_BLOCK_VERSION = 1  # Whole block (including every transaction) serialized as JSON
+HEADER_BLOCK_VERSION = 2  # Fixed-size header committing to a digest of the transactions
+MERKLE_BLOCK_VERSION = 3  # Header commits to the Merkle root of the transaction hashes
+BINARY_BLOCK_VERSION = 4  # Header and transaction hashes use the canonical binary encoding
+CURRENT_BLOCK_VERSION = BINARY_BLOCK_VERSION
 
-@dataclass
 class Block:
     """
     Pure Domain Entity representing a Block in the chain.
+    Slotted, with the hex hashes (previous hash, hash, tx_root) stored compactly as bytes.
     """
-    index: int
-    transactions: List[Transaction]
-    previous_hash: str
-    timestamp: float = field(default_factory=lambda: datetime.now().timestamp())
-    nonce: int = 0
-    hash: Optional[str] = None
-
-    def __post_init__(self):
-        if self.index < 0:
+    __slots__ = ("index", "transactions", "_previous_hash", "timestamp", "nonce", "_hash", "version", "_tx_root")
+
+    def __init__(
+        self,
+        index: int,
+        transactions: List[Transaction],
+        previous_hash: str,
+        timestamp: Optional[float] = None,
+        nonce: int = 0,
+        hash: Optional[str] = None,
+        version: int = CURRENT_BLOCK_VERSION,
+        tx_root: Optional[str] = None  # Transactions digest; the Merkle root from version 3 on
+    ):
+        if index < 0:
             raise ValueError("Block index cannot be negative")
+        self.index = index
+        self.transactions = transactions
+        self._previous_hash = pack_hex(previous_hash)
+        self.timestamp = datetime.now().timestamp() if timestamp is None else timestamp
+        self.nonce = nonce
+        self._hash = pack_hex(hash)
+        self.version = version
+        self._tx_root = pack_hex(tx_root)
+
+    @property
+    def previous_hash(self) -> str:
+        return unpack_hex(self._previous_hash)
+
+    @previous_hash.setter
+    def previous_hash(self, value: str):
+        self._previous_hash = pack_hex(value)
+
+    @property
+    def hash(self) -> Optional[str]:
+        return unpack_hex(self._hash)
+
+    @hash.setter
+    def hash(self, value: Optional[str]):
+        self._hash = pack_hex(value)
+
+    @property
+    def tx_root(self) -> Optional[str]:
+        return unpack_hex(self._tx_root)
+
+    @tx_root.setter
+    def tx_root(self, value: Optional[str]):
+        self._tx_root = pack_hex(value)
 
     def to_dict(self, include_signature: bool = True) -> Dict[str, Any]:
         """
@@ -31,3 +75,30 @@ class Block:
             "nonce": self.nonce,
             "transactions": [tx.to_dict(include_signature) for tx in self.transactions]
         }
+
+    def header_dict(self) -> Dict[str, Any]:
+        """
+        Header fields hashed by versioned blocks. The transactions only enter through 'tx_root'.
+        """
+        return {
+            "version": self.version,
+            "index": self.index,
+            "previous_hash": self.previous_hash,
+            "timestamp": self.timestamp,
+            "tx_root": self.tx_root,
+            "nonce": self.nonce
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Block(index={self.index!r}, transactions={self.transactions!r}, previous_hash={self.previous_hash!r}, "
+            f"timestamp={self.timestamp!r}, nonce={self.nonce!r}, hash={self.hash!r}, version={self.version!r}, "
+            f"tx_root={self.tx_root!r})"
+        )
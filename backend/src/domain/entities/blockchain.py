@@ -1,72 +1,122 @@
+import time
 from typing import List, Optional
-from .block import Block
+from .block import Block, HEADER_BLOCK_VERSION
 from .transaction import Transaction
 from ..interfaces.cryptography_service import CryptographyService
+from ..interfaces.proof_of_work_engine import ProofOfWorkEngine, MiningResult, MiningInterrupted
 
 class Blockchain:
     """
     Core Domain Logic for the Blockchain.
     Independent of persistence, networking, and specific crypto implementations.
     """
-    def __init__(self, crypto_service: CryptographyService, difficulty: int = 2):
+    def __init__(
+        self,
+        crypto_service: CryptographyService,
+        difficulty: int = 2,
+        miner: Optional[ProofOfWorkEngine] = None,
+        create_genesis: bool = True
+    ):
         self.chain: List[Block] = []
         self.pending_transactions: List[Transaction] = []
         self.difficulty = difficulty
         self.crypto_service = crypto_service
+        self.miner = miner
+        self.last_mining_result: Optional[MiningResult] = None
         self.nodes = set()
         
-        # Genesis block creation is part of domain initialization
-        self.create_genesis_block()
+        # Genesis block creation is part of domain initialization, unless the chain is loaded from storage
+        if create_genesis:
+            self.create_genesis_block()
 
     def create_genesis_block(self):
         genesis_tx = Transaction("SYSTEM", "GENESIS_DOCUMENT", {"note": "Genesis Block"})
         genesis_block = Block(0, [genesis_tx], "0")
+        genesis_block.tx_root = self.crypto_service.calculate_tx_root(genesis_block.transactions, genesis_block.version)
         genesis_block.hash = self.crypto_service.calculate_hash(genesis_block)
         self.chain.append(genesis_block)
 
     def get_latest_block(self) -> Block:
         return self.chain[-1]
 
-    def add_transaction(self, transaction: Transaction):
+    def verify_transaction(self, transaction: Transaction):
         if not transaction.signature or not self.crypto_service.verify_signature(
-            transaction.owner, transaction.signature, self.crypto_service.calculate_hash(transaction)
+            transaction.owner, transaction.signature, self.crypto_service.calculate_tx_hash(transaction)
         ):
             if transaction.owner != "SYSTEM":
                 raise ValueError("Invalid transaction signature")
-        
+
+    def verify_transactions(self, transactions: List[Transaction]):
+        """
+        verify_transaction for a group, with the signatures checked as one batch.
+        """
+        signed = [tx for tx in transactions if tx.owner != "SYSTEM"]
+        results = self.crypto_service.verify_many(
+            (tx.owner, tx.signature or "", self.crypto_service.calculate_tx_hash(tx)) for tx in signed
+        )
+        for tx, ok in zip(signed, results):
+            if not tx.signature or not ok:
+                raise ValueError(f"Invalid transaction signature for document {tx.document_hash}")
+
+    def add_transaction(self, transaction: Transaction):
+        self.verify_transaction(transaction)
         self.pending_transactions.append(transaction)
 
-    def mine_pending_transactions(self, miner_address: str) -> Block:
+    def mine_pending_transactions(self, miner_address: str, timeout: Optional[float] = None) -> Block:
         # Create reward transaction
         reward_tx = Transaction("SYSTEM", "REWARD", {"note": f"Reward for {miner_address}"})
-        self.pending_transactions.append(reward_tx)
         
         previous_block = self.get_latest_block()
         new_block = Block(
             index=len(self.chain),
-            transactions=self.pending_transactions,
+            transactions=self.pending_transactions + [reward_tx],
             previous_hash=previous_block.hash
         )
+        # The transactions digest is fixed for the whole nonce search
+        new_block.tx_root = self.crypto_service.calculate_tx_root(new_block.transactions, new_block.version)
         
-        # Proof of Work logic
-        target = "0" * self.difficulty
-        while True:
-            new_block.hash = self.crypto_service.calculate_hash(new_block)
-            if new_block.hash.startswith(target):
-                break
-            new_block.nonce += 1
+        # Proof of Work logic (pending transactions stay queued if the engine is interrupted)
+        if self.miner:
+            result = self.miner.mine(new_block, self.difficulty, timeout)
+        else:
+            result = self._mine_serial(new_block, timeout)
+        new_block.nonce = result.nonce
+        new_block.hash = result.hash
+        self.last_mining_result = result
             
         self.chain.append(new_block)
         self.pending_transactions = []
         return new_block
 
+    def _mine_serial(self, block: Block, timeout: Optional[float] = None) -> MiningResult:
+        target = "0" * self.difficulty
+        hasher = self.crypto_service.header_hasher(block)
+        started = time.perf_counter()
+        attempts = 0
+        while True:
+            attempts += 1
+            if timeout is not None and attempts % 1024 == 0 and time.perf_counter() - started >= timeout:
+                raise MiningInterrupted(f"Mining timed out after {timeout} seconds")
+            digest = hasher.hash_nonce(block.nonce)
+            if digest.startswith(target):
+                break
+            block.nonce += 1
+        block.hash = digest
+        return MiningResult(block.nonce, digest, attempts, time.perf_counter() - started)
+
     def is_chain_valid(self, chain: List[Block]) -> bool:
         for i in range(1, len(chain)):
             current = chain[i]
             previous = chain[i-1]
             
+            # Verify the transactions digest committed to by the header
+            if current.version >= HEADER_BLOCK_VERSION and current.tx_root != self.crypto_service.calculate_tx_root(
+                current.transactions, current.version
+            ):
+                return False
+
             # Verify hash
-            if current.hash != self.crypto_service.calculate_hash(current):
+            if current.hash != self.crypto_service.header_hasher(current).hash_nonce(current.nonce):
                 return False
                 
             # Verify link
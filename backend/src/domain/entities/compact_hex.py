@@ -0,0 +1,18 @@
+from typing import Optional, Union
+
+# Hex strings (keys, digests, signatures) are stored as bytes, half their size and without
+# the str object overhead. Only values that convert back to the identical string are packed,
+# so uppercase hex, odd lengths and non-hex values like "SYSTEM" or "0" stay as they are.
+HexValue = Union[bytes, str, None]
+
+def pack_hex(value: Optional[str]) -> HexValue:
+    if type(value) is not str or not value or len(value) % 2:
+        return value
+    try:
+        packed = bytes.fromhex(value)
+    except ValueError:
+        return value
+    return packed if packed.hex() == value else value
+
+def unpack_hex(value: HexValue) -> Optional[str]:
+    return value.hex() if type(value) is bytes else value
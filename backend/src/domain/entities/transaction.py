@@ -1,29 +1,133 @@
-from dataclasses import dataclass, field
+import sys
 from typing import Dict, Any, Optional
 from datetime import datetime
+from .compact_hex import pack_hex, unpack_hex
+
+class FrozenMetadata(dict):
+    """
+    Read-only dict holding a transaction's metadata, so its cached hash cannot go stale.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Transaction metadata is read-only; assign a new mapping instead")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Pickle's default dict-subclass protocol would rebuild it item by item
+        return (FrozenMetadata, (dict(self),))
 
-@dataclass
 class Transaction:
     """
     Pure Domain Entity representing a Notary Transaction.
+    Slotted, with the owner key, document hash and signature stored compactly as bytes.
+    The transaction hash is cached per block format version and dropped whenever a hashed
+    field is reassigned. Metadata is copied into a read-only FrozenMetadata; replace it to change it.
     """
-    owner: str
-    document_hash: str
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: float = field(default_factory=lambda: datetime.now().timestamp())
-    signature: Optional[str] = None
+    __slots__ = ("_owner", "_document_hash", "_metadata", "_timestamp", "_signature", "_hash_version", "_hash")
+
+    def __init__(
+        self,
+        owner: str,
+        document_hash: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[float] = None,
+        signature: Optional[str] = None
+    ):
+        if not owner or not document_hash:
+            raise ValueError("Owner and Document Hash are mandatory for a Transaction")
+        self._owner = pack_hex(owner)
+        self._document_hash = pack_hex(document_hash)
+        self._metadata = self._own_metadata(metadata)
+        self._timestamp = datetime.now().timestamp() if timestamp is None else timestamp
+        self._signature = pack_hex(signature)
+        self._hash_version = None
+        self._hash = None
+
+    @staticmethod
+    def _own_metadata(metadata: Optional[Dict[str, Any]]) -> FrozenMetadata:
+        # Keys repeat across every transaction, so they are interned once
+        if not metadata:
+            return FrozenMetadata()
+        return FrozenMetadata({sys.intern(key) if type(key) is str else key: value for key, value in metadata.items()})
+
+    @property
+    def owner(self) -> str:
+        return unpack_hex(self._owner)
+
+    @owner.setter
+    def owner(self, value: str):
+        self._owner = pack_hex(value)
+        self._hash_version = self._hash = None
+
+    @property
+    def document_hash(self) -> str:
+        return unpack_hex(self._document_hash)
+
+    @document_hash.setter
+    def document_hash(self, value: str):
+        self._document_hash = pack_hex(value)
+        self._hash_version = self._hash = None
+
+    @property
+    def metadata(self) -> FrozenMetadata:
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]):
+        self._metadata = self._own_metadata(value)
+        self._hash_version = self._hash = None
+
+    @property
+    def timestamp(self) -> float:
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: float):
+        self._timestamp = value
+        self._hash_version = self._hash = None
+
+    @property
+    def signature(self) -> Optional[str]:
+        return unpack_hex(self._signature)
+
+    @signature.setter
+    def signature(self, value: Optional[str]):
+        # The signature is not part of the transaction hash
+        self._signature = pack_hex(value)
+
+    def cached_hash(self, version: int) -> Optional[bytes]:
+        """Digest stored by cache_hash() for this format version, if still valid."""
+        return self._hash if self._hash_version == version else None
+
+    def cache_hash(self, version: int, digest: bytes):
+        self._hash_version = version
+        self._hash = digest
 
     def to_dict(self, include_signature: bool = True) -> Dict[str, Any]:
         data = {
             "owner": self.owner,
             "document_hash": self.document_hash,
-            "metadata": self.metadata,
-            "timestamp": self.timestamp
+            "metadata": self._metadata,
+            "timestamp": self._timestamp
         }
         if include_signature:
             data["signature"] = self.signature
         return data
 
-    def __post_init__(self):
-        if not self.owner or not self.document_hash:
-            raise ValueError("Owner and Document Hash are mandatory for a Transaction")
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self._owner, self._document_hash, self._metadata, self._timestamp, self._signature) ==
+            (other._owner, other._document_hash, other._metadata, other._timestamp, other._signature)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Transaction(owner={self.owner!r}, document_hash={self.document_hash!r}, metadata={self._metadata!r}, "
+            f"timestamp={self._timestamp!r}, signature={self.signature!r})"
+        )
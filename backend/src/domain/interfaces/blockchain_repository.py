@@ -1,19 +1,78 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from ..entities.block import Block
 
+# Local user of a stored transaction, keyed by (document_hash, signature)
+TransactionOwners = Dict[Tuple[str, Optional[str]], Optional[int]]
+
 class BlockchainRepository(ABC):
     """
     Interface for persisting and retrieving the blockchain state.
     """
+    # True when get_blocks reads only the requested blocks, so the chain can be served lazily
+    random_access = False
+
     @abstractmethod
     def save_chain(self, chain: List[Block]) -> bool:
         pass
 
+    @abstractmethod
+    def append_block(self, block: Block, owners: Optional[TransactionOwners] = None) -> bool:
+        """
+        Persist a single new block at the tip. The common write path; save_chain is for full syncs.
+        Transactions take their local user from the 'user_id' metadata, or from 'owners' when
+        given (orphans re-sealed after a chain replacement), for backends that track users.
+        """
+        pass
+
+    def append_blocks(self, blocks: List[Block]) -> bool:
+        """
+        Persist consecutive new blocks at the tip, e.g. a batch of an import.
+        Backends that can write a batch in one go should override this.
+        """
+        return all(self.append_block(block) for block in blocks)
+
     @abstractmethod
     def load_chain(self) -> List[Block]:
         pass
 
+    def iter_chain(self, chunk_size: int = 1000, start_height: int = 0) -> Iterator[List[Block]]:
+        """
+        Stream the stored chain in height order from 'start_height', 'chunk_size' blocks at a time.
+        Backends that can read incrementally should override this.
+        """
+        chain = self.load_chain()
+        for start in range(start_height, len(chain), chunk_size):
+            yield chain[start:start + chunk_size]
+
+    def get_blocks(self, start: int, limit: int) -> List[Block]:
+        """
+        Up to 'limit' stored blocks from height 'start' on.
+        """
+        return next(self.iter_chain(limit, start), [])
+
+    def chain_length(self) -> int:
+        """
+        Number of stored blocks.
+        """
+        return len(self.load_chain())
+
+    @abstractmethod
+    def replace_from(self, height: int, blocks: List[Block]) -> bool:
+        """
+        Drop every stored block from 'height' on and store 'blocks' in their place, as
+        one operation where the backend allows it. Used when adopting a peer's chain, so the
+        'user_id' metadata of those blocks names the peer's users, never local ones.
+        """
+        pass
+
+    def transaction_owners(self, height: int) -> TransactionOwners:
+        """
+        Local user of every transaction stored from 'height' on, read before replace_from drops
+        them. Empty for backends that do not track users.
+        """
+        return {}
+
     @abstractmethod
     def save_node(self, node_url: str) -> bool:
         pass
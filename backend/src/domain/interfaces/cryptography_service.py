@@ -1,5 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Tuple
+from ..entities.block import Block, CURRENT_BLOCK_VERSION
+from ..entities.transaction import Transaction
+
+class NonceHasher(ABC):
+    """
+    Hashes one block for successive nonces. Everything except the nonce is
+    serialized once, so each attempt only hashes a few bytes.
+    Implementations must be picklable to be shipped to mining processes.
+    """
+    @abstractmethod
+    def hash_nonce(self, nonce: int) -> str:
+        pass
 
 class CryptographyService(ABC):
     """
@@ -9,6 +21,27 @@ class CryptographyService(ABC):
     def calculate_hash(self, data: Any) -> str:
         pass
 
+    @abstractmethod
+    def calculate_tx_hash(self, transaction: Transaction, version: int = CURRENT_BLOCK_VERSION) -> str:
+        """
+        Hash a transaction the way blocks of the given format version do. This is also the digest it is signed over.
+        """
+        pass
+
+    @abstractmethod
+    def calculate_tx_root(self, transactions: List[Transaction], version: int) -> str:
+        pass
+
+    @abstractmethod
+    def merkle_proof(
+        self, transactions: List[Transaction], position: int, version: int = CURRENT_BLOCK_VERSION
+    ) -> List[Dict[str, str]]:
+        pass
+
+    @abstractmethod
+    def header_hasher(self, block: Block) -> NonceHasher:
+        pass
+
     @abstractmethod
     def sign_data(self, data: str, private_key: Any) -> str:
         pass
@@ -17,6 +50,12 @@ class CryptographyService(ABC):
     def verify_signature(self, public_key: str, signature: str, data: str) -> bool:
         pass
 
+    def verify_many(self, items: Iterable[Tuple[str, str, str]]) -> List[bool]:
+        """
+        Verify (public key, signature, data) triples. Implementations may parallelize.
+        """
+        return [self.verify_signature(*item) for item in items]
+
     @abstractmethod
     def generate_key_pair(self) -> Dict[str, Any]:
         pass
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List
+from ..entities.block import Block
+
+
+class PeerError(Exception):
+    """
+    Raised when a peer cannot be reached or answers with something unusable.
+    """
+
+
+@dataclass
+class PeerTip:
+    """
+    Height and tip hash advertised by a peer.
+    """
+    length: int
+    tip: str
+
+
+class PeerClient(ABC):
+    """
+    Interface for talking to other nodes during chain synchronization.
+    Headers are blocks without transactions; bodies are complete blocks.
+    """
+    @abstractmethod
+    def get_tip(self, peer: str) -> PeerTip:
+        pass
+
+    @abstractmethod
+    def get_headers(self, peer: str, start: int, limit: int) -> List[Block]:
+        pass
+
+    @abstractmethod
+    def get_blocks(self, peer: str, start: int, limit: int) -> List[Block]:
+        pass
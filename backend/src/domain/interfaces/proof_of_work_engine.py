@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+from ..entities.block import Block
+
+
+class MiningInterrupted(Exception):
+    """
+    Raised when a nonce search is cancelled or runs out of time.
+    """
+
+
+@dataclass
+class MiningResult:
+    """
+    Outcome of a nonce search: the winning nonce/hash and throughput stats.
+    """
+    nonce: int
+    hash: str
+    attempts: int
+    elapsed_seconds: float
+
+    @property
+    def hashes_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return float(self.attempts)
+        return self.attempts / self.elapsed_seconds
+
+
+class ProofOfWorkEngine(ABC):
+    """
+    Interface for pluggable nonce search strategies.
+    Implementations must return the lowest nonce whose hash meets the difficulty,
+    so any engine produces exactly the same block as the serial search.
+    """
+    @abstractmethod
+    def mine(self, block: Block, difficulty: int, timeout: Optional[float] = None) -> MiningResult:
+        pass
+
+    @abstractmethod
+    def cancel(self) -> None:
+        pass
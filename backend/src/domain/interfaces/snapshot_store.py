@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import List, Mapping, Optional, Tuple, Union
+from ..entities.block import Block
+
+# Document hash -> (block index, position), or a list of them for documents notarized more than once.
+# Any read-only mapping: a store may answer lookups straight from the loaded file.
+DocumentEntries = Mapping[str, Union[Tuple[int, int], List[Tuple[int, int]]]]
+
+
+@dataclass
+class LedgerSnapshot:
+    """
+    State a node needs to serve without reading the whole ledger: the tip header,
+    the document index up to it and how far the chain was validated.
+    """
+    tip: Block
+    validated_height: int
+    documents: DocumentEntries = field(default_factory=dict)
+    created_at: float = 0.0
+
+    @property
+    def height(self) -> int:
+        return self.tip.index
+
+
+class SnapshotStore(ABC):
+    """
+    Interface for persisting the latest ledger snapshot.
+    """
+    @abstractmethod
+    def save(self, snapshot: LedgerSnapshot) -> bool:
+        pass
+
+    @abstractmethod
+    def load(self) -> Optional[LedgerSnapshot]:
+        """The latest snapshot, or None if there is none or it cannot be read."""
+        pass
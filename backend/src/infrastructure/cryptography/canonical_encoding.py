@@ -0,0 +1,105 @@
+import struct
+from typing import Any
+from src.domain.entities.block import Block
+from src.domain.entities.transaction import Transaction
+
+# Compact, deterministic binary encoding hashed by blocks from format version 4 on.
+# Every value is a one-byte type tag followed by its payload; lengths are unsigned varints
+# and map keys are sorted by their UTF-8 bytes. Unlike json.dumps the result does not depend
+# on float repr, key insertion order or whitespace, and no intermediate dicts are built.
+TAG_NONE = b"N"
+TAG_TRUE = b"T"
+TAG_FALSE = b"F"
+TAG_INT = b"I"
+TAG_FLOAT = b"D"
+TAG_STR = b"S"
+TAG_BYTES = b"B"
+TAG_LIST = b"L"
+TAG_MAP = b"M"
+
+_pack_double = struct.Struct(">d").pack
+_pack_header = struct.Struct(">BQ").pack
+_pack_nonce = struct.Struct(">Q").pack
+
+def _write_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _write_str(value: str, out: bytearray) -> None:
+    data = value.encode("utf-8")
+    out += TAG_STR
+    _write_varint(len(data), out)
+    out += data
+
+def _write_value(value: Any, out: bytearray) -> None:
+    kind = type(value)
+    if kind is dict and not all(type(key) is str for key in value):
+        # Non-string keys are stringified, as JSON persistence would do
+        value = {str(key): item for key, item in value.items()}
+    if kind is str:
+        _write_str(value, out)
+    elif kind is dict:
+        out += TAG_MAP
+        _write_varint(len(value), out)
+        # Code point order of str keys equals the byte order of their UTF-8 encoding
+        for key in sorted(value):
+            data = key.encode("utf-8")
+            _write_varint(len(data), out)
+            out += data
+            _write_value(value[key], out)
+    elif value is None:
+        out += TAG_NONE
+    elif value is True:
+        out += TAG_TRUE
+    elif value is False:
+        out += TAG_FALSE
+    elif isinstance(value, int):
+        out += TAG_INT
+        # Zigzag keeps small negative numbers short
+        _write_varint(value * 2 if value >= 0 else -value * 2 - 1, out)
+    elif isinstance(value, float):
+        out += TAG_FLOAT
+        out += _pack_double(value)
+    elif isinstance(value, str):
+        _write_str(value, out)
+    elif isinstance(value, (bytes, bytearray)):
+        out += TAG_BYTES
+        _write_varint(len(value), out)
+        out += value
+    elif isinstance(value, (list, tuple)):
+        out += TAG_LIST
+        _write_varint(len(value), out)
+        for item in value:
+            _write_value(item, out)
+    elif isinstance(value, dict):
+        _write_value(dict(value), out)
+    else:
+        raise TypeError(f"Cannot canonically encode {kind.__name__}")
+
+def encode_value(value: Any) -> bytes:
+    """Canonical encoding of a JSON-like value (None, bool, int, float, str, bytes, list, dict)."""
+    out = bytearray()
+    _write_value(value, out)
+    return bytes(out)
+
+def encode_transaction(tx: Transaction) -> bytes:
+    """Signed fields of a transaction in a fixed order; the signature itself is excluded."""
+    out = bytearray()
+    _write_str(tx.owner, out)
+    _write_str(tx.document_hash, out)
+    _write_value(tx.metadata, out)
+    out += _pack_double(float(tx.timestamp))
+    return bytes(out)
+
+def encode_header_prefix(block: Block, tx_root: str) -> bytes:
+    """Header fields except the nonce, which hashers append with encode_nonce()."""
+    out = bytearray(_pack_header(block.version, block.index))
+    _write_str(block.previous_hash, out)
+    out += _pack_double(float(block.timestamp))
+    _write_str(tx_root or "", out)
+    return bytes(out)
+
+def encode_nonce(nonce: int) -> bytes:
+    return _pack_nonce(nonce)
@@ -1,18 +1,66 @@
 import json
 import hashlib
 import binascii
-from typing import Dict, Any
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import ec
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.backends import default_backend
-from src.domain.interfaces.cryptography_service import CryptographyService
+from typing import TYPE_CHECKING, Dict, Any, Iterable, List, Optional, Tuple
+from src.domain.entities.block import (
+    Block, HEADER_BLOCK_VERSION, MERKLE_BLOCK_VERSION, BINARY_BLOCK_VERSION, CURRENT_BLOCK_VERSION
+)
+from src.domain.entities.transaction import Transaction
+from src.domain.interfaces.cryptography_service import CryptographyService, NonceHasher
+from .canonical_encoding import encode_transaction, encode_header_prefix, encode_nonce
+from .merkle_tree import MerkleTree
+from .signature_verifier import SignatureVerifier
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+class BlockHeaderHasher(NonceHasher):
+    """
+    Hashes a versioned block header. The header minus the nonce is fed to SHA-256 once
+    and the resulting state is copied for each nonce.
+    """
+    def __init__(self, prefix: bytes, binary_nonce: bool = False):
+        self.prefix = prefix
+        self.binary_nonce = binary_nonce
+        self._state = None
+
+    def hash_nonce(self, nonce: int) -> str:
+        if self._state is None:
+            self._state = hashlib.sha256(self.prefix)
+        digest = self._state.copy()
+        digest.update(encode_nonce(nonce) if self.binary_nonce else str(nonce).encode('ascii'))
+        return digest.hexdigest()
+
+    def __getstate__(self):
+        # hashlib objects cannot be pickled; workers rebuild the prefix state lazily
+        return {"prefix": self.prefix, "binary_nonce": self.binary_nonce, "_state": None}
+
+class LegacyBlockHasher(NonceHasher):
+    """
+    Hashes a legacy (version 1) block, which re-serializes the whole block per nonce.
+    """
+    def __init__(self, crypto_service: "ECDSAService", block: Block):
+        self.crypto_service = crypto_service
+        self.block = block
+
+    def hash_nonce(self, nonce: int) -> str:
+        self.block.nonce = nonce
+        return self.crypto_service.calculate_hash(self.block)
 
 class ECDSAService(CryptographyService):
     """
     Implementation of CryptographyService using ECDSA (SECP256K1).
     """
+    def __init__(self, verifier: Optional[SignatureVerifier] = None):
+        self.verifier = verifier or SignatureVerifier()
+
     def calculate_hash(self, data: Any) -> str:
+        if isinstance(data, Block) and data.version >= HEADER_BLOCK_VERSION:
+            tx_root = self.calculate_tx_root(data.transactions, data.version)
+            return self._header_hasher(data, tx_root).hash_nonce(data.nonce)
+        if isinstance(data, Transaction):
+            return self.calculate_tx_hash(data)
+
         if hasattr(data, "to_dict"):
             data_dict = data.to_dict(include_signature=False)
         elif isinstance(data, dict):
@@ -23,7 +71,48 @@ class ECDSAService(CryptographyService):
         data_string = json.dumps(data_dict, sort_keys=True)
         return hashlib.sha256(data_string.encode('utf-8')).hexdigest()
 
-    def sign_data(self, data: str, private_key: ec.EllipticCurvePrivateKey) -> str:
+    def calculate_tx_hash(self, transaction: Transaction, version: int = CURRENT_BLOCK_VERSION) -> str:
+        # Each transaction is hashed once per format version; the entity drops the digest when it changes
+        digest = transaction.cached_hash(version)
+        if digest is None:
+            if version >= BINARY_BLOCK_VERSION:
+                digest = hashlib.sha256(encode_transaction(transaction)).digest()
+            else:
+                data_string = json.dumps(transaction.to_dict(include_signature=False), sort_keys=True)
+                digest = hashlib.sha256(data_string.encode('utf-8')).digest()
+            transaction.cache_hash(version, digest)
+        return digest.hex()
+
+    def calculate_tx_root(self, transactions: List[Transaction], version: int) -> str:
+        if version >= MERKLE_BLOCK_VERSION:
+            return MerkleTree([self.calculate_tx_hash(tx, version) for tx in transactions]).root
+
+        digest = hashlib.sha256()
+        for tx in transactions:
+            digest.update(binascii.unhexlify(self.calculate_tx_hash(tx, version)))
+        return digest.hexdigest()
+
+    def merkle_proof(
+        self, transactions: List[Transaction], position: int, version: int = CURRENT_BLOCK_VERSION
+    ) -> List[Dict[str, str]]:
+        return MerkleTree([self.calculate_tx_hash(tx, version) for tx in transactions]).proof(position)
+
+    def header_hasher(self, block: Block) -> NonceHasher:
+        if block.version >= HEADER_BLOCK_VERSION:
+            return self._header_hasher(block, block.tx_root)
+        return LegacyBlockHasher(self, block)
+
+    def _header_hasher(self, block: Block, tx_root: Optional[str]) -> BlockHeaderHasher:
+        if block.version >= BINARY_BLOCK_VERSION:
+            return BlockHeaderHasher(encode_header_prefix(block, tx_root), binary_nonce=True)
+        header = [block.version, block.index, block.previous_hash, block.timestamp, tx_root]
+        prefix = json.dumps(header, separators=(',', ':'))
+        return BlockHeaderHasher(prefix.encode('utf-8'))
+
+    def sign_data(self, data: str, private_key: "ec.EllipticCurvePrivateKey") -> str:
+        # cryptography is imported on first use, not when the API starts
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import ec
         signature = private_key.sign(
             data.encode('utf-8'),
             ec.ECDSA(hashes.SHA256())
@@ -31,30 +120,21 @@ class ECDSAService(CryptographyService):
         return binascii.hexlify(signature).decode('ascii')
 
     def verify_signature(self, public_key_hex: str, signature_hex: str, data: str) -> bool:
-        try:
-            public_key_bytes = binascii.unhexlify(public_key_hex)
-            public_key = ec.EllipticCurvePublicKey.from_encoded_point(
-                ec.SECP256K1(),
-                public_key_bytes
-            )
-            
-            signature_bytes = binascii.unhexlify(signature_hex)
-            public_key.verify(
-                signature_bytes,
-                data.encode('utf-8'),
-                ec.ECDSA(hashes.SHA256())
-            )
-            return True
-        except Exception:
-            return False
-
-    def generate_key_pair(self) -> Dict[str, Any]:
+        return self.verifier.verify(public_key_hex, signature_hex, data)
+
+    def verify_many(self, items: Iterable[Tuple[str, str, str]]) -> List[bool]:
+        return self.verifier.verify_many(items)
+
+    def generate_key_pair(self, compressed: bool = False) -> Dict[str, Any]:
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ec
         private_key = ec.generate_private_key(ec.SECP256K1(), default_backend())
         public_key = private_key.public_key()
         
         public_key_bytes = public_key.public_bytes(
             encoding=serialization.Encoding.X962,
-            format=serialization.PublicFormat.UncompressedPoint
+            format=serialization.PublicFormat.CompressedPoint if compressed else serialization.PublicFormat.UncompressedPoint
         )
         
         return {
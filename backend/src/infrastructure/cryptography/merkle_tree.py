@@ -0,0 +1,70 @@
+import hashlib
+import binascii
+from typing import List, Dict
+
+# Domain separation so a leaf can never be passed off as an inner node (RFC 6962 style)
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+def hash_leaf(leaf_hex: str) -> bytes:
+    return hashlib.sha256(LEAF_PREFIX + binascii.unhexlify(leaf_hex)).digest()
+
+def hash_node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+class MerkleTree:
+    """
+    Binary Merkle tree over hex transaction hashes.
+    An odd node at the end of a level is promoted unchanged to the next level.
+    """
+    def __init__(self, leaves: List[str]):
+        self.levels: List[List[bytes]] = [[hash_leaf(leaf) for leaf in leaves]]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            parents = []
+            for i in range(0, len(level), 2):
+                if i + 1 < len(level):
+                    parents.append(hash_node(level[i], level[i + 1]))
+                else:
+                    parents.append(level[i])
+            self.levels.append(parents)
+
+    @property
+    def root(self) -> str:
+        if not self.levels[0]:
+            return hashlib.sha256(b"").hexdigest()
+        return self.levels[-1][0].hex()
+
+    def proof(self, position: int) -> List[Dict[str, str]]:
+        """
+        Audit path for the leaf at 'position': the sibling hashes from the leaf up to the root.
+        """
+        if position < 0 or position >= len(self.levels[0]):
+            raise IndexError("Leaf position out of range")
+
+        path = []
+        for level in self.levels[:-1]:
+            sibling = position ^ 1
+            if sibling < len(level):
+                path.append({
+                    "position": "left" if sibling < position else "right",
+                    "hash": level[sibling].hex()
+                })
+            position //= 2
+        return path
+
+def verify_proof(leaf_hex: str, proof: List[Dict[str, str]], root_hex: str) -> bool:
+    """
+    Fold the audit path over the leaf and compare the result with the expected root.
+    """
+    try:
+        node = hash_leaf(leaf_hex)
+        for step in proof:
+            sibling = binascii.unhexlify(step["hash"])
+            if step["position"] == "left":
+                node = hash_node(sibling, node)
+            else:
+                node = hash_node(node, sibling)
+        return node.hex() == root_hex
+    except (KeyError, ValueError, binascii.Error):
+        return False
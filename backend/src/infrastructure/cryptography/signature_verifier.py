@@ -0,0 +1,90 @@
+import binascii
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+# (public key hex, signature hex, signed data)
+VerificationItem = Tuple[str, str, str]
+
+class SignatureVerifier:
+    """
+    ECDSA (SECP256K1) verification with a bounded LRU of decoded public keys.
+    Point decoding/validation happens once per key instead of once per signature.
+    Accepts uncompressed (65-byte) and compressed (33-byte) SEC1 keys.
+    """
+    def __init__(self, cache_size: int = 4096, workers: Optional[int] = None, batch_size: int = 64):
+        self.cache_size = cache_size
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.batch_size = batch_size
+        self._init_state()
+
+    def _init_state(self):
+        self._keys: "OrderedDict[str, ec.EllipticCurvePublicKey]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __getstate__(self):
+        # Caches, locks and thread pools stay with the process that created them
+        return {"cache_size": self.cache_size, "workers": self.workers, "batch_size": self.batch_size}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_state()
+
+    def load_public_key(self, public_key_hex: str) -> "ec.EllipticCurvePublicKey":
+        # cryptography is imported on first use, not when the API starts
+        from cryptography.hazmat.primitives.asymmetric import ec
+        with self._lock:
+            key = self._keys.get(public_key_hex)
+            if key is not None:
+                self._keys.move_to_end(public_key_hex)
+                return key
+
+        key = ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256K1(), binascii.unhexlify(public_key_hex))
+        with self._lock:
+            self._keys[public_key_hex] = key
+            while len(self._keys) > self.cache_size:
+                self._keys.popitem(last=False)
+        return key
+
+    def verify(self, public_key_hex: str, signature_hex: str, data: str) -> bool:
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import ec
+        try:
+            public_key = self.load_public_key(public_key_hex)
+            public_key.verify(
+                binascii.unhexlify(signature_hex),
+                data.encode('utf-8'),
+                ec.ECDSA(hashes.SHA256())
+            )
+            return True
+        except Exception:
+            return False
+
+    def verify_many(self, items: Iterable[VerificationItem]) -> List[bool]:
+        """
+        Verify a batch on a thread pool. Results keep the order of 'items'.
+        """
+        items = list(items)
+        if len(items) <= self.batch_size:
+            return [self.verify(*item) for item in items]
+
+        batches = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        results: List[bool] = []
+        for batch_results in self._get_executor().map(self._verify_batch, batches):
+            results.extend(batch_results)
+        return results
+
+    def _verify_batch(self, batch: List[VerificationItem]) -> List[bool]:
+        return [self.verify(*item) for item in batch]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="verify")
+            return self._executor
@@ -0,0 +1,150 @@
+import os
+import time
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Optional, Tuple
+from src.domain.entities.block import Block
+from src.domain.interfaces.cryptography_service import CryptographyService, NonceHasher
+from src.domain.interfaces.proof_of_work_engine import ProofOfWorkEngine, MiningResult, MiningInterrupted
+
+# Shared state injected into every worker process by the pool initializer
+_worker_state = {}
+
+NOT_FOUND = -1
+
+
+def _init_worker(found_nonce, cancel_event):
+    _worker_state["found_nonce"] = found_nonce
+    _worker_state["cancel_event"] = cancel_event
+
+
+def _search_range(
+    hasher: NonceHasher,
+    target: str,
+    start: int,
+    stop: int,
+    check_every: int
+) -> Tuple[Optional[Tuple[int, str]], int]:
+    """
+    Scan [start, stop) for the first nonce meeting the target.
+    Gives up early once a lower nonce has been found elsewhere or the search is cancelled.
+    """
+    found_nonce = _worker_state["found_nonce"]
+    cancel_event = _worker_state["cancel_event"]
+
+    for nonce in range(start, stop):
+        if (nonce - start) % check_every == 0:
+            best = found_nonce.value
+            if cancel_event.is_set() or (best != NOT_FOUND and best < start):
+                return None, nonce - start
+
+        block_hash = hasher.hash_nonce(nonce)
+        if block_hash.startswith(target):
+            with found_nonce.get_lock():
+                if found_nonce.value == NOT_FOUND or nonce < found_nonce.value:
+                    found_nonce.value = nonce
+            return (nonce, block_hash), nonce - start + 1
+
+    return None, stop - start
+
+
+class ParallelMiner(ProofOfWorkEngine):
+    """
+    Proof of Work engine that splits the nonce space across a process pool.
+    Nonces are handed out in ascending chunks and the lowest valid nonce wins,
+    so the mined block is identical to the one the serial loop would produce.
+    """
+    def __init__(
+        self,
+        crypto_service: CryptographyService,
+        workers: Optional[int] = None,
+        chunk_size: int = 20000,
+        check_every: int = 1024,
+        poll_interval: float = 0.05
+    ):
+        self.crypto_service = crypto_service
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.check_every = check_every
+        self.poll_interval = poll_interval
+
+        context = multiprocessing.get_context()
+        self._found_nonce = context.Value("q", NOT_FOUND)
+        self._cancel_event = context.Event()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self._found_nonce, self._cancel_event)
+            )
+        return self._pool
+
+    def mine(self, block: Block, difficulty: int, timeout: Optional[float] = None) -> MiningResult:
+        with self._lock:
+            return self._mine(block, difficulty, timeout)
+
+    def _mine(self, block: Block, difficulty: int, timeout: Optional[float]) -> MiningResult:
+        pool = self._get_pool()
+        # Only the precomputed header travels to the workers, not the transactions
+        hasher = self.crypto_service.header_hasher(block)
+        target = "0" * difficulty
+        self._found_nonce.value = NOT_FOUND
+        self._cancel_event.clear()
+
+        started = time.perf_counter()
+        deadline = started + timeout if timeout is not None else None
+        in_flight = {}
+        next_start = 0
+        attempts = 0
+        best: Optional[Tuple[int, str]] = None
+        interrupted: Optional[str] = None
+
+        while True:
+            # Keep every worker busy with the next chunks until a winner shows up
+            while best is None and interrupted is None and len(in_flight) < self.workers * 2:
+                future = pool.submit(
+                    _search_range, hasher, target,
+                    next_start, next_start + self.chunk_size, self.check_every
+                )
+                in_flight[future] = next_start
+                next_start += self.chunk_size
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.pop(future)
+                found, chunk_attempts = future.result()
+                attempts += chunk_attempts
+                if found and (best is None or found[0] < best[0]):
+                    best = found
+
+            if interrupted is None:
+                if self._cancel_event.is_set():
+                    interrupted = "Mining cancelled"
+                elif deadline is not None and time.perf_counter() >= deadline:
+                    interrupted = f"Mining timed out after {timeout} seconds"
+                    self._cancel_event.set()
+
+        elapsed = time.perf_counter() - started
+        self._cancel_event.clear()
+
+        # A cancelled search may have skipped lower nonces, so its result is discarded
+        if interrupted is not None:
+            raise MiningInterrupted(interrupted)
+
+        return MiningResult(nonce=best[0], hash=best[1], attempts=attempts, elapsed_seconds=elapsed)
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,12 @@
+from typing import Any, Dict
+from src.domain.entities.block import Block
+from src.infrastructure.serialization.block_codec import block_to_dict, block_from_dict as block_from_json
+
+def block_to_json(block: Block, headers_only: bool = False) -> Dict[str, Any]:
+    """
+    JSON form of a block served by the API: the stored form plus the transaction count,
+    without the transactions when 'headers_only'. Read back with block_from_json.
+    """
+    data = block_to_dict(block, transactions=not headers_only)
+    data["tx_count"] = len(block.transactions)
+    return data
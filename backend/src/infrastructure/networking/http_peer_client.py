@@ -0,0 +1,39 @@
+import gzip
+import json
+import urllib.error
+import urllib.request
+from typing import Any, Dict, List
+from src.domain.entities.block import Block
+from src.domain.interfaces.peer_client import PeerClient, PeerError, PeerTip
+from .block_codec import block_from_json
+
+class HTTPPeerClient(PeerClient):
+    """
+    PeerClient for the /sync endpoints of other NotaryChain nodes, over plain urllib.
+    Responses are requested gzip-compressed; block bodies are by far the largest.
+    """
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+
+    def get_tip(self, peer: str) -> PeerTip:
+        data = self._get(peer, "/sync/tip")
+        return PeerTip(data["length"], data["tip"])
+
+    def get_headers(self, peer: str, start: int, limit: int) -> List[Block]:
+        data = self._get(peer, f"/sync/headers?from={start}&limit={limit}")
+        return [block_from_json(header) for header in data["headers"]]
+
+    def get_blocks(self, peer: str, start: int, limit: int) -> List[Block]:
+        data = self._get(peer, f"/sync/blocks?from={start}&limit={limit}")
+        return [block_from_json(block) for block in data["blocks"]]
+
+    def _get(self, peer: str, path: str) -> Dict[str, Any]:
+        request = urllib.request.Request(peer.rstrip("/") + path, headers={"Accept-Encoding": "gzip"})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read()
+                if response.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+            return json.loads(body)
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            raise PeerError(f"{peer}{path}: {e}") from e
@@ -1,4 +1,5 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -6,16 +7,78 @@ import os
 # SQLite database URL
 SQLALCHEMY_DATABASE_URL = "sqlite:///./notarychain.db"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+# Connection pools: writers are few (block appends are serialized anyway), readers scale out
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))
+DB_READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "16"))
+
+# Applied to every SQLite connection. WAL lets readers run alongside the single writer
+# without blocking; NORMAL sync is durable across application crashes in WAL mode.
+SQLITE_PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("busy_timeout", "5000"),
+    ("cache_size", "-20000"),     # ~20 MB page cache per connection
+    ("mmap_size", "268435456"),   # 256 MB of the file memory-mapped for reads
+    ("temp_store", "MEMORY"),
 )
+
+def create_sqlite_engine(
+    url: str = SQLALCHEMY_DATABASE_URL,
+    read_only: bool = False,
+    pool_size: int = DB_POOL_SIZE,
+    pragmas: tuple = SQLITE_PRAGMAS
+) -> Engine:
+    """
+    Pooled engine applying 'pragmas' to each connection. Read-only engines also set
+    query_only, so a read session can never take the write lock.
+    """
+    pool_args = {} if url in ("sqlite://", "sqlite:///:memory:") else {"pool_size": pool_size, "max_overflow": pool_size}
+    engine = create_engine(url, connect_args={"check_same_thread": False}, **pool_args)
+
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas:
+            cursor.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    return engine
+
+engine = create_sqlite_engine()
+read_engine = create_sqlite_engine(read_only=True, pool_size=DB_READ_POOL_SIZE)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 Base = declarative_base()
 
+def upgrade_schema(upgrades: dict, bind=engine):
+    """
+    Add missing columns to existing tables. create_all() only creates new tables,
+    so databases from older releases need their columns added in place.
+    """
+    inspector = inspect(bind)
+    with bind.begin() as conn:
+        for table, columns in upgrades.items():
+            if not inspector.has_table(table):
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table)}
+            for name, ddl in columns:
+                if name not in existing:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+def get_read_db():
+    """Session for endpoints that only read; it runs on the query_only read pool."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,9 +1,58 @@
 import json
 import os
-from typing import List, Dict, Any
-from src.domain.interfaces.blockchain_repository import BlockchainRepository
+import re
+from typing import IO, Any, Iterator, List, Optional
+from src.domain.interfaces.blockchain_repository import BlockchainRepository, TransactionOwners
 from src.domain.entities.block import Block
-from src.domain.entities.transaction import Transaction
+from src.infrastructure.serialization.block_codec import block_to_dict, block_from_dict
+
+# Characters read at a time when streaming the chain file
+READ_SIZE = 1 << 20
+WHITESPACE = re.compile(r"\s*")
+
+def iter_json_array(f: IO[str]) -> Iterator[Any]:
+    """
+    Decode the elements of a top-level JSON array one at a time, so memory holds a read
+    buffer and the current element rather than the whole document.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, eof = "", 0, False
+    state = "open"  # then "first" (element or ']'), "next" (',' or ']'), "element"
+    while True:
+        position = WHITESPACE.match(buffer, position).end()
+        if position == len(buffer) and not eof:
+            chunk = f.read(READ_SIZE)
+            buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+            continue
+        if position == len(buffer):
+            raise ValueError("unexpected end of JSON array")
+
+        char = buffer[position]
+        if state == "open":
+            if char != "[":
+                raise ValueError("not a JSON array")
+            position, state = position + 1, "first"
+        elif char == "]" and state in ("first", "next"):
+            return
+        elif state == "next":
+            if char != ",":
+                raise ValueError(f"expected ',' or ']' in JSON array, found {char!r}")
+            position, state = position + 1, "element"
+        else:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            # Undecodable, or not followed by ',' or ']' yet (a number may be cut short): read more and retry
+            after = WHITESPACE.match(buffer, end).end() if end is not None else len(buffer)
+            if not eof and (after == len(buffer) or buffer[after] not in ",]"):
+                chunk = f.read(READ_SIZE)
+                buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+                continue
+            yield value
+            position, state = end, "next"
 
 class JSONBlockchainRepository(BlockchainRepository):
     """
@@ -14,22 +63,42 @@ class JSONBlockchainRepository(BlockchainRepository):
         self.nodes_path = nodes_path
 
     def save_chain(self, chain: List[Block]) -> bool:
-        data = []
-        for block in chain:
-            block_dict = {
-                "index": block.index,
-                "timestamp": block.timestamp,
-                "previous_hash": block.previous_hash,
-                "nonce": block.nonce,
-                "hash": block.hash,
-                "transactions": [tx.to_dict() for tx in block.transactions]
-            }
-            data.append(block_dict)
+        data = [block_to_dict(block) for block in chain]
             
         with open(self.file_path, "w") as f:
             json.dump(data, f, indent=4)
         return True
 
+    def append_block(self, block: Block, owners: Optional[TransactionOwners] = None) -> bool:
+        """
+        Append in place: overwrite the closing bracket of the JSON array with the new block.
+        """
+        if not os.path.exists(self.file_path):
+            return self.save_chain([block])
+
+        with open(self.file_path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            # Find the closing bracket and whether the array already has elements
+            f.seek(max(0, end - 64))
+            tail = f.read()
+            close_at = tail.rfind(b"]")
+            if close_at == -1:
+                raise ValueError(f"{self.file_path} is not a JSON array")
+            is_empty = tail[:close_at].rstrip().endswith(b"[")
+
+            block_json = json.dumps(block_to_dict(block), indent=4)
+            block_json = "\n".join("    " + line for line in block_json.splitlines())
+            separator = "\n" if is_empty else ",\n"
+
+            f.seek(end - len(tail) + close_at)
+            f.truncate()
+            f.write(f"{separator}{block_json}\n]".encode("utf-8"))
+        return True
+
+    def replace_from(self, height: int, blocks: List[Block]) -> bool:
+        return self.save_chain(self.load_chain()[:height] + blocks)
+
     def load_chain(self) -> List[Block]:
         if not os.path.exists(self.file_path):
             return []
@@ -37,18 +106,27 @@ class JSONBlockchainRepository(BlockchainRepository):
         with open(self.file_path, "r") as f:
             data = json.load(f)
             
-        chain = []
-        for b in data:
-            txs = [
-                Transaction(t['owner'], t['document_hash'], t['metadata'], t.get('signature')) 
-                for t in b['transactions']
-            ]
-            for i, tx in enumerate(txs):
-                tx.timestamp = b['transactions'][i]['timestamp']
-                
-            block = Block(b['index'], txs, b['previous_hash'], b['timestamp'], b['nonce'], b['hash'])
-            chain.append(block)
-        return chain
+        return [block_from_dict(b) for b in data]
+
+    def iter_chain(self, chunk_size: int = 1000, start_height: int = 0) -> Iterator[List[Block]]:
+        """
+        Stream the file block by block instead of loading it whole. Blocks below
+        'start_height' are still decoded, but not kept.
+        """
+        if not os.path.exists(self.file_path):
+            return
+
+        with open(self.file_path, "r") as f:
+            chunk = []
+            for height, b in enumerate(iter_json_array(f)):
+                if height < start_height:
+                    continue
+                chunk.append(block_from_dict(b))
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
 
     def save_node(self, node_url: str) -> bool:
         nodes = self.load_nodes()
@@ -20,19 +20,22 @@ class BlockModel(Base):
     previous_hash = Column(String)
     nonce = Column(Integer)
     block_hash = Column(String, unique=True)
+    version = Column(Integer, default=1, nullable=False)
+    tx_root = Column(String, nullable=True)
     
-    transactions = relationship("TransactionModel", back_populates="block")
+    # Transaction order is part of the block hash, so always load them in insertion order
+    transactions = relationship("TransactionModel", back_populates="block", order_by="TransactionModel.id")
 
 class TransactionModel(Base):
     __tablename__ = "transactions"
     id = Column(Integer, primary_key=True, index=True)
     block_id = Column(Integer, ForeignKey("blocks.id"))
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     
-    owner_address = Column(String)
-    document_hash = Column(String)
+    owner_address = Column(String, index=True)
+    document_hash = Column(String, index=True)
     metadata_json = Column(JSON)
-    timestamp = Column(Float)
+    timestamp = Column(Float, index=True)
     signature = Column(String, nullable=True)
     
     block = relationship("BlockModel", back_populates="transactions")
@@ -42,3 +45,11 @@ class NodeModel(Base):
     __tablename__ = "nodes"
     id = Column(Integer, primary_key=True, index=True)
     url = Column(String, unique=True)
+
+# Columns added after the first release, applied to existing databases by upgrade_schema()
+SCHEMA_UPGRADES = {
+    "blocks": [
+        ("version", "INTEGER NOT NULL DEFAULT 1"),
+        ("tx_root", "VARCHAR"),
+    ],
+}
@@ -0,0 +1,140 @@
+import json
+from typing import Dict, Any, Optional, List
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+FTS_TABLE = "notarizations_fts"
+
+# Text fields of a notarization that are full-text searchable (all live in metadata_json)
+SEARCH_FIELDS = ("original_filename", "description", "display_address")
+# Extra FTS column holding a 'u<user_id>' token, so user-scoped searches intersect
+# posting lists inside FTS instead of filtering every match afterwards
+USER_SCOPE_FIELD = "user_scope"
+
+class NotarizationSearchRepository:
+    """
+    Full-text and metadata search over notarizations.
+    Text fields are indexed in an SQLite FTS5 table keyed by transaction id and kept in
+    sync as blocks are persisted; exact filters use the B-tree indexes on transactions.
+    Falls back to LIKE scans when FTS5 is not available.
+    """
+    def __init__(self, bind: Engine):
+        self.fts_enabled = bind.dialect.name == "sqlite" and self._create_fts(bind)
+
+    def _create_fts(self, bind: Engine) -> bool:
+        columns = ", ".join(SEARCH_FIELDS + (USER_SCOPE_FIELD,))
+        try:
+            with bind.begin() as conn:
+                conn.execute(text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+                    f"USING fts5({columns}, tokenize='unicode61 remove_diacritics 2')"
+                ))
+                # Catch up with transactions stored before the index existed
+                self._index_rows(conn, f"t.id > (SELECT COALESCE(MAX(rowid), 0) FROM {FTS_TABLE})", {})
+            return True
+        except OperationalError as e:
+            print(f"⚠️ Full-text search disabled (FTS5 unavailable): {str(e)}")
+            return False
+
+    def index_block(self, db: Session, block_id: int):
+        """Index the transactions of a block inside the caller's DB transaction."""
+        if self.fts_enabled:
+            self._index_rows(db, "t.block_id = :block_id", {"block_id": block_id})
+
+    def index_blocks(self, db: Session, first_block_id: int, last_block_id: int):
+        """Index the transactions of a range of blocks inside the caller's DB transaction."""
+        if self.fts_enabled:
+            self._index_rows(db, "t.block_id BETWEEN :first AND :last", {"first": first_block_id, "last": last_block_id})
+
+    def unindex_from_height(self, db: Session, height: int):
+        """Remove the transactions of blocks from 'height' on, inside the caller's DB transaction."""
+        if self.fts_enabled:
+            db.execute(text(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid IN (SELECT t.id FROM transactions t "
+                f"JOIN blocks b ON t.block_id = b.id WHERE b.\"index\" >= :height)"
+            ), {"height": height})
+
+    def _index_rows(self, conn, where: str, params: Dict[str, Any]):
+        extracts = ", ".join(f"json_extract(t.metadata_json, '$.{field}')" for field in SEARCH_FIELDS)
+        conn.execute(text(
+            f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(SEARCH_FIELDS)}, {USER_SCOPE_FIELD}) "
+            f"SELECT t.id, {extracts}, 'u' || t.user_id FROM transactions t WHERE {where}"
+        ), params)
+
+    def search(
+        self,
+        db: Session,
+        query: Optional[str] = None,
+        user_id: Optional[int] = None,
+        owner_address: Optional[str] = None,
+        document_hash: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        page: int = 1,
+        page_size: int = 20
+    ) -> Dict[str, Any]:
+        conditions: List[str] = []
+        params: Dict[str, Any] = {}
+        source = "transactions t"
+        order = "t.timestamp DESC"
+
+        terms = (query or "").split()
+        if terms and self.fts_enabled:
+            # CROSS JOIN pins FTS as the outer loop; otherwise SQLite may re-run MATCH per candidate row
+            source = f"{FTS_TABLE} f CROSS JOIN transactions t ON t.id = f.rowid"
+            conditions.append(f"{FTS_TABLE} MATCH :match")
+            # Quote every term (FTS syntax is not exposed to users) and match prefixes
+            columns = "{" + " ".join(SEARCH_FIELDS) + "}"
+            match = " ".join(f'{columns}: "' + term.replace('"', '""') + '"*' for term in terms)
+            if user_id is not None:
+                match = f'{USER_SCOPE_FIELD}: "u{int(user_id)}" AND {match}'
+            params["match"] = match
+            order = "f.rank, t.timestamp DESC"
+        elif terms:
+            for i, term in enumerate(terms):
+                fields = " OR ".join(
+                    f"json_extract(t.metadata_json, '$.{field}') LIKE :term{i}" for field in SEARCH_FIELDS
+                )
+                conditions.append(f"({fields})")
+                params[f"term{i}"] = f"%{term}%"
+
+        filters = {
+            "t.user_id = :user_id": user_id,
+            "t.owner_address = :owner_address": owner_address,
+            "t.document_hash = :document_hash": document_hash,
+            "t.timestamp >= :since": since,
+            "t.timestamp <= :until": until,
+        }
+        for condition, value in filters.items():
+            if value is not None:
+                conditions.append(condition)
+                params[condition.rsplit(":", 1)[1]] = value
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        total = db.execute(text(f"SELECT COUNT(*) FROM {source} {where}"), params).scalar()
+
+        params["limit"] = page_size
+        params["offset"] = (page - 1) * page_size
+        rows = db.execute(text(
+            f"SELECT t.document_hash, t.owner_address, t.timestamp, t.metadata_json, t.signature, b.\"index\" AS block_index "
+            f"FROM {source} LEFT JOIN blocks b ON b.id = t.block_id {where} "
+            f"ORDER BY {order} LIMIT :limit OFFSET :offset"
+        ), params).mappings()
+
+        return {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "results": [
+                {
+                    "timestamp": r["timestamp"],
+                    "document_hash": r["document_hash"],
+                    "metadata": json.loads(r["metadata_json"]) if r["metadata_json"] else {},
+                    "owner": r["owner_address"],
+                    "signature": r["signature"],
+                    "block_index": r["block_index"] or 0
+                } for r in rows
+            ]
+        }
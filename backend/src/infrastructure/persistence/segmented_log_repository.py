@@ -0,0 +1,225 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+from typing import Iterator, List, Optional, Tuple
+from src.domain.interfaces.blockchain_repository import BlockchainRepository, TransactionOwners
+from src.domain.entities.block import Block
+from src.infrastructure.serialization.block_codec import block_to_dict, block_from_dict
+
+# Record: payload length (u32) + CRC32 of the payload (u32) + compact JSON payload
+RECORD_HEADER = struct.Struct(">II")
+# Offset index entry per block height: segment number (u32) + offset (u64) + record length (u32)
+INDEX_ENTRY = struct.Struct(">IQI")
+
+class SegmentedLogBlockchainRepository(BlockchainRepository):
+    """
+    Embedded, dependency-free BlockchainRepository for edge nodes.
+    Blocks are appended as length-prefixed, checksummed records to rotating segment
+    files. A fixed-width offset index maps each height to its record, so any block
+    is read through a memory map without parsing the rest of the ledger.
+    On open, a torn record at the tail (crash mid-write) is detected and truncated.
+    """
+    random_access = True
+
+    def __init__(self, directory: str = "ledger", max_segment_bytes: int = 64 * 1024 * 1024, fsync: bool = False):
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync = fsync
+        self.index_path = os.path.join(directory, "blocks.idx")
+        self.nodes_path = os.path.join(directory, "nodes.json")
+        os.makedirs(directory, exist_ok=True)
+
+        self._entries: List[Tuple[int, int, int]] = []
+        self._recover()
+
+    # --- BlockchainRepository ---
+
+    def save_chain(self, chain: List[Block]) -> bool:
+        """
+        Full sync. Blocks already stored are kept when the chain extends them;
+        a diverging chain is rewritten from the first differing height.
+        """
+        keep = 0
+        while keep < min(len(chain), len(self._entries)) and self._read_hash(keep) == chain[keep].hash:
+            keep += 1
+        if keep < len(self._entries):
+            self._truncate(keep)
+        for block in chain[keep:]:
+            self.append_block(block)
+        return True
+
+    def append_block(self, block: Block, owners: Optional[TransactionOwners] = None) -> bool:
+        if block.index != len(self._entries):
+            print(f"⚠️ Segmented log error: expected height {len(self._entries)}, got {block.index}")
+            return False
+
+        payload = json.dumps(block_to_dict(block), separators=(',', ':')).encode('utf-8')
+        record = RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+        segment = self._entries[-1][0] if self._entries else 0
+        path = self._segment_path(segment)
+        if os.path.exists(path) and os.path.getsize(path) + len(record) > self.max_segment_bytes:
+            segment += 1
+            path = self._segment_path(segment)
+
+        with open(path, "ab") as f:
+            offset = f.tell()
+            f.write(record)
+            self._sync(f)
+
+        entry = (segment, offset, len(record))
+        with open(self.index_path, "ab") as f:
+            f.write(INDEX_ENTRY.pack(*entry))
+            self._sync(f)
+        self._entries.append(entry)
+        return True
+
+    def replace_from(self, height: int, blocks: List[Block]) -> bool:
+        self._truncate(height)
+        return all(self.append_block(block) for block in blocks)
+
+    def load_chain(self) -> List[Block]:
+        return [self.get_block(height) for height in range(len(self._entries))]
+
+    def iter_chain(self, chunk_size: int = 1000, start_height: int = 0) -> Iterator[List[Block]]:
+        for start in range(start_height, len(self._entries), chunk_size):
+            yield [self.get_block(height) for height in range(start, min(start + chunk_size, len(self._entries)))]
+
+    def get_blocks(self, start: int, limit: int) -> List[Block]:
+        return [self.get_block(height) for height in range(max(0, start), min(start + limit, len(self._entries)))]
+
+    def chain_length(self) -> int:
+        return len(self._entries)
+
+    def save_node(self, node_url: str) -> bool:
+        nodes = self.load_nodes()
+        if node_url not in nodes:
+            nodes.append(node_url)
+            with open(self.nodes_path, "w") as f:
+                json.dump(nodes, f)
+        return True
+
+    def load_nodes(self) -> List[str]:
+        if not os.path.exists(self.nodes_path):
+            return []
+        with open(self.nodes_path, "r") as f:
+            return json.load(f)
+
+    # --- Random access ---
+
+    def get_block(self, height: int) -> Optional[Block]:
+        if height < 0 or height >= len(self._entries):
+            return None
+        return block_from_dict(json.loads(self._read_payload(height)))
+
+    @property
+    def height(self) -> int:
+        return len(self._entries)
+
+    # --- Internals ---
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"segment-{segment:06d}.log")
+
+    def _sync(self, f):
+        if self.fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_payload(self, height: int) -> bytes:
+        segment, offset, length = self._entries[height]
+        with open(self._segment_path(segment), "rb") as f:
+            # mmap requires an offset aligned to the allocation granularity
+            start = offset - offset % mmap.ALLOCATIONGRANULARITY
+            with mmap.mmap(f.fileno(), offset + length - start, access=mmap.ACCESS_READ, offset=start) as view:
+                relative = offset - start
+                return view[relative + RECORD_HEADER.size:relative + length]
+
+    def _read_hash(self, height: int) -> Optional[str]:
+        return json.loads(self._read_payload(height)).get("hash")
+
+    def _recover(self):
+        """
+        Load the offset index, then reconcile it with the segment files:
+        drop index entries pointing past the data, re-index complete records the index
+        missed, and truncate a torn tail record.
+        """
+        entries = []
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "rb") as f:
+                raw = f.read()
+            usable = len(raw) - len(raw) % INDEX_ENTRY.size
+            entries = [INDEX_ENTRY.unpack_from(raw, pos) for pos in range(0, usable, INDEX_ENTRY.size)]
+
+        segments = sorted(
+            int(name[len("segment-"):-len(".log")])
+            for name in os.listdir(self.directory)
+            if name.startswith("segment-") and name.endswith(".log")
+        )
+
+        # Keep index entries whose records are fully present
+        valid = 0
+        for segment, offset, length in entries:
+            path = self._segment_path(segment)
+            if not os.path.exists(path) or os.path.getsize(path) < offset + length:
+                break
+            valid += 1
+        entries = entries[:valid]
+
+        # Scan from the last indexed record for records written after the index entry was lost
+        if entries:
+            segment, offset, length = entries[-1]
+            position = offset + length
+        else:
+            segment, position = (segments[0] if segments else 0), 0
+
+        for current in [s for s in segments if s >= segment]:
+            path = self._segment_path(current)
+            if current != segment:
+                position = 0
+            with open(path, "rb+") as f:
+                f.seek(position)
+                data = f.read()
+                cursor = 0
+                while cursor + RECORD_HEADER.size <= len(data):
+                    length, checksum = RECORD_HEADER.unpack_from(data, cursor)
+                    end = cursor + RECORD_HEADER.size + length
+                    if end > len(data) or zlib.crc32(data[cursor + RECORD_HEADER.size:end]) != checksum:
+                        break
+                    entries.append((current, position + cursor, end - cursor))
+                    cursor = end
+                if cursor < len(data):
+                    print(f"⚠️ Segmented log: truncating torn record in {path} at offset {position + cursor}")
+                    f.truncate(position + cursor)
+                    break
+
+        # Segments past a torn record can only hold orphaned data
+        last_segment = entries[-1][0] if entries else (segments[0] if segments else 0)
+        for current in segments:
+            if current > last_segment:
+                os.remove(self._segment_path(current))
+
+        self._entries = entries
+        self._write_index()
+
+    def _truncate(self, height: int):
+        """Drop every block from 'height' on."""
+        if height < len(self._entries):
+            segment, offset, _ = self._entries[height]
+            with open(self._segment_path(segment), "rb+") as f:
+                f.truncate(offset)
+            for current, _, _ in self._entries[height:]:
+                if current > segment and os.path.exists(self._segment_path(current)):
+                    os.remove(self._segment_path(current))
+            self._entries = self._entries[:height]
+            self._write_index()
+
+    def _write_index(self):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(INDEX_ENTRY.pack(*entry) for entry in self._entries))
+            self._sync(f)
+        os.replace(tmp_path, self.index_path)
+
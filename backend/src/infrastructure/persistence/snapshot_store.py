@@ -0,0 +1,170 @@
+import array
+import bisect
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional
+from src.domain.entities.block import Block
+from src.domain.entities.compact_hex import pack_hex
+from src.domain.interfaces.snapshot_store import LedgerSnapshot, SnapshotStore
+
+MAGIC = b"NCSNAP\x01\n"
+HEADER_LENGTH = struct.Struct(">I")
+# SHA-256 digest, block index, position: one per document notarized once, sorted by digest
+DOCUMENT_RECORD = struct.Struct(">32sII")
+DIGEST_SIZE = 32
+LOCATION = struct.Struct(">II")
+CHECKSUM = struct.Struct(">I")
+
+class PackedDocuments(Mapping):
+    """
+    Read-only document entries of a loaded snapshot. Lookups binary-search the sorted
+    fixed-width records in place, so loading costs one read however many documents
+    there are; irregular entries come from the header. The first two bytes of every
+    digest are copied into a compact column that narrows each search to a few records.
+    """
+    def __init__(self, records: memoryview, other: Dict):
+        self._records = records
+        self._other = other
+        self._count = len(records) // DOCUMENT_RECORD.size
+        prefixes = bytearray(2 * self._count)
+        prefixes[0::2] = records[0::DOCUMENT_RECORD.size]
+        prefixes[1::2] = records[1::DOCUMENT_RECORD.size]
+        self._prefixes = array.array("H", prefixes)
+        if sys.byteorder == "little":
+            self._prefixes.byteswap()
+
+    def get(self, document_hash: str, default=None):
+        entry = self._other.get(document_hash)
+        if entry is not None:
+            return entry
+        digest = pack_hex(document_hash)
+        if type(digest) is bytes and len(digest) == DIGEST_SIZE:
+            prefix = digest[0] << 8 | digest[1]
+            lo = bisect.bisect_left(self._prefixes, prefix)
+            hi = bisect.bisect_right(self._prefixes, prefix, lo)
+            position = bisect.bisect_left(_Digests(self._records), digest, lo, hi)
+            offset = position * DOCUMENT_RECORD.size
+            if position < hi and self._records[offset:offset + DIGEST_SIZE] == digest:
+                return LOCATION.unpack_from(self._records, offset + DIGEST_SIZE)
+        return default
+
+    def __getitem__(self, document_hash: str):
+        entry = self.get(document_hash)
+        if entry is None:
+            raise KeyError(document_hash)
+        return entry
+
+    def __contains__(self, document_hash) -> bool:
+        return self.get(document_hash) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._other
+        for offset in range(0, self._count * DOCUMENT_RECORD.size, DOCUMENT_RECORD.size):
+            yield self._records[offset:offset + DIGEST_SIZE].hex()
+
+    def items(self):
+        yield from self._other.items()
+        for digest, block_index, position in DOCUMENT_RECORD.iter_unpack(self._records):
+            yield digest.hex(), (block_index, position)
+
+    def __len__(self) -> int:
+        return self._count + len(self._other)
+
+class _Digests:
+    """Sequence view of the record digests, for bisect within explicit bounds."""
+    def __init__(self, records: memoryview):
+        self._records = records
+
+    def __getitem__(self, position: int) -> bytes:
+        offset = position * DOCUMENT_RECORD.size
+        return self._records[offset:offset + DIGEST_SIZE].tobytes()
+
+class FileSnapshotStore(SnapshotStore):
+    """
+    SnapshotStore keeping the latest snapshot in a single binary file:
+    magic, a JSON header (tip header, validated height, irregular documents), sorted
+    fixed-width records for the document index and a CRC32 trailer. The common entry
+    (a SHA-256 document notarized once) takes 40 bytes. Writes go to a temporary file
+    that replaces the previous snapshot atomically.
+    """
+    def __init__(self, path: str = "ledger.snapshot"):
+        self.path = path
+
+    def save(self, snapshot: LedgerSnapshot) -> bool:
+        records = []
+        other = {}
+        for document_hash, entry in snapshot.documents.items():
+            digest = pack_hex(document_hash)
+            if isinstance(entry, tuple) and type(digest) is bytes and len(digest) == DIGEST_SIZE:
+                records.append(DOCUMENT_RECORD.pack(digest, *entry))
+            else:
+                other[document_hash] = entry
+        # The digest leads each record, so this sorts by digest
+        records.sort()
+
+        tip = snapshot.tip
+        header = json.dumps({
+            "tip": {**tip.header_dict(), "hash": tip.hash},
+            "validated_height": snapshot.validated_height,
+            "created_at": snapshot.created_at or time.time(),
+            "records": len(records),
+            "other_documents": other
+        }).encode("utf-8")
+        body = b"".join([MAGIC, HEADER_LENGTH.pack(len(header)), header, *records])
+
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+                f.write(CHECKSUM.pack(zlib.crc32(body)))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            return True
+        except OSError as e:
+            print(f"❌ Error saving ledger snapshot: {str(e)}")
+            return False
+
+    def load(self) -> Optional[LedgerSnapshot]:
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            body, (checksum,) = data[:-CHECKSUM.size], CHECKSUM.unpack(data[-CHECKSUM.size:])
+            if not body.startswith(MAGIC) or zlib.crc32(body) != checksum:
+                raise ValueError("bad magic or checksum")
+
+            start = len(MAGIC) + HEADER_LENGTH.size
+            (header_length,) = HEADER_LENGTH.unpack_from(body, len(MAGIC))
+            header = json.loads(body[start:start + header_length])
+            records = memoryview(body)[start + header_length:]
+            if len(records) != header["records"] * DOCUMENT_RECORD.size:
+                raise ValueError("truncated document records")
+
+            other = {}
+            for document_hash, entry in header["other_documents"].items():
+                # JSON turns tuples into lists: a pair of ints is one location, anything else a list of them
+                if isinstance(entry[0], int):
+                    other[document_hash] = tuple(entry)
+                else:
+                    other[document_hash] = [tuple(location) for location in entry]
+
+            tip = header["tip"]
+            return LedgerSnapshot(
+                Block(
+                    tip["index"], [], tip["previous_hash"], tip["timestamp"], tip["nonce"], tip["hash"],
+                    tip["version"], tip["tx_root"]
+                ),
+                header["validated_height"],
+                PackedDocuments(records, other),
+                header["created_at"]
+            )
+        except (OSError, ValueError, KeyError, IndexError, TypeError, struct.error) as e:
+            print(f"⚠️ Ignoring unreadable ledger snapshot {self.path}: {str(e)}")
+            return None
@@ -1,121 +1,310 @@
-from typing import List, Optional
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
-from src.domain.interfaces.blockchain_repository import BlockchainRepository
-from src.domain.entities.block import Block
+from src.domain.interfaces.blockchain_repository import BlockchainRepository, TransactionOwners
+from src.domain.entities.block import Block, LEGACY_BLOCK_VERSION
 from src.domain.entities.transaction import Transaction
-from .models import BlockModel, TransactionModel, NodeModel
-from .database import engine, Base
+from .models import BlockModel, TransactionModel, NodeModel, SCHEMA_UPGRADES
+from .database import SessionLocal, Base, upgrade_schema
+from .search_repository import NotarizationSearchRepository
+
+# Core inserts on the tables: rows go to the driver as one executemany, without the ORM bulk
+# layer (which also splits rows into a batch per combination of NULL columns)
+BLOCK_INSERT = BlockModel.__table__.insert()
+TRANSACTION_INSERT = TransactionModel.__table__.insert()
 
 class SQLBlockchainRepository(BlockchainRepository):
     """
     Implementation of BlockchainRepository using SQLAlchemy and a relational database.
+    Every operation runs in its own short-lived session from the given factories: reads
+    on 'read_session_factory', writes on 'session_factory' behind a single writer lock,
+    so concurrent requests never share a session. A fixed 'db_session' (tests, scripts)
+    is used for everything instead. With 'create_schema=False' the schema is left to an
+    explicit create_schema() call, which must run before the repository is used.
     """
-    def __init__(self, db_session: Session = None):
-        # Create tables if they don't exist
-        Base.metadata.create_all(bind=engine)
+    random_access = True
+
+    def __init__(
+        self,
+        db_session: Session = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        read_session_factory: Optional[Callable[[], Session]] = None,
+        create_schema: bool = True
+    ):
         self.db = db_session
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory or session_factory
+        # Block appends are serialized here rather than contending for SQLite's write lock
+        self._write_lock = threading.Lock()
+        self.search: Optional[NotarizationSearchRepository] = None
+        if create_schema:
+            self.create_schema()
 
-    def set_db(self, db: Session):
-        """Helper to inject the session per request if needed"""
-        self.db = db
+    def create_schema(self):
+        """
+        Create missing tables, columns and indexes and catch up the search index. Idempotent.
+        """
+        # On the session's own database
+        with self._session(self.session_factory) as db:
+            bind = db.get_bind()
+        Base.metadata.create_all(bind=bind)
+        upgrade_schema(SCHEMA_UPGRADES, bind)
+        # create_all() skips indexes of tables that already exist
+        for index in TransactionModel.__table__.indexes:
+            index.create(bind, checkfirst=True)
+        self.search = NotarizationSearchRepository(bind)
 
-    def save_chain(self, chain: List[Block]) -> bool:
-        if not self.db:
-            print("⚠️ SQL Repository error: No DB session provided")
-            return False
-            
+    @contextmanager
+    def _session(self, factory: Callable[[], Session]) -> Iterator[Session]:
+        if self.db is not None:
+            yield self.db
+            return
+        db = factory()
         try:
-            for block in chain:
-                # Check if block exists by index
-                db_block = self.db.query(BlockModel).filter(BlockModel.index == block.index).first()
-                
-                if not db_block:
-                    db_block = BlockModel(
-                        index=block.index,
-                        timestamp=block.timestamp,
-                        previous_hash=block.previous_hash,
-                        nonce=block.nonce,
-                        block_hash=block.hash
-                    )
-                    self.db.add(db_block)
-                    self.db.flush() # Get the ID
-                    
-                    # Add transactions for this new block
-                    for tx in block.transactions:
-                        user_id = tx.metadata.get("user_id")
-                        db_tx = TransactionModel(
-                            block_id=db_block.id,
-                            user_id=user_id,
-                            owner_address=tx.owner,
-                            document_hash=tx.document_hash,
-                            metadata_json=tx.metadata,
-                            timestamp=tx.timestamp,
-                            signature=tx.signature
-                        )
-                        self.db.add(db_tx)
-                else:
-                    # Update existing block hash and nonce if needed (unlikely in real chain but good for sync)
-                    db_block.block_hash = block.hash
-                    db_block.nonce = block.nonce
-                    
-            self.db.commit()
+            yield db
+        finally:
+            db.close()
+
+    @contextmanager
+    def _writer(self) -> Iterator[Session]:
+        with self._write_lock, self._session(self.session_factory) as db:
+            yield db
+
+    def save_chain(self, chain: List[Block]) -> bool:
+        with self._writer() as db:
+            try:
+                # One query for the stored heights/hashes instead of one per block
+                stored = dict(db.query(BlockModel.index, BlockModel.block_hash))
+                for block in chain:
+                    if block.index not in stored:
+                        self._insert_block(db, block)
+                    elif stored[block.index] != block.hash:
+                        # Update existing block hash and nonce if needed (unlikely in real chain but good for sync)
+                        db_block = db.query(BlockModel).filter(BlockModel.index == block.index).first()
+                        db_block.block_hash = block.hash
+                        db_block.nonce = block.nonce
+
+                db.commit()
+                return True
+            except Exception as e:
+                print(f"❌ Error saving chain to SQL: {str(e)}")
+                db.rollback()
+                return False
+
+    def append_block(self, block: Block, owners: Optional[TransactionOwners] = None) -> bool:
+        with self._writer() as db:
+            try:
+                self._insert_block(db, block, owners)
+                db.commit()
+                return True
+            except Exception as e:
+                print(f"❌ Error appending block to SQL: {str(e)}")
+                db.rollback()
+                return False
+
+    def append_blocks(self, blocks: List[Block]) -> bool:
+        """
+        Append consecutive blocks in one DB transaction: one multi-row insert for the
+        blocks, one for all their transactions and a single search-index pass.
+        """
+        if not blocks:
             return True
-        except Exception as e:
-            print(f"❌ Error saving chain to SQL: {str(e)}")
-            self.db.rollback()
-            return False
+        with self._writer() as db:
+            try:
+                db.execute(BLOCK_INSERT, [self._block_row(block) for block in blocks])
+                block_ids = dict(db.execute(
+                    select(BlockModel.index, BlockModel.id)
+                    .where(BlockModel.index.between(blocks[0].index, blocks[-1].index))
+                ).all())
+                rows = [
+                    row
+                    for block in blocks
+                    for row in self._transaction_rows(block_ids[block.index], block.transactions)
+                ]
+                if rows:
+                    db.execute(TRANSACTION_INSERT, rows)
+                    self.search.index_blocks(db, min(block_ids.values()), max(block_ids.values()))
+                db.commit()
+                return True
+            except Exception as e:
+                print(f"❌ Error appending blocks to SQL: {str(e)}")
+                db.rollback()
+                return False
+
+    def replace_from(self, height: int, blocks: List[Block]) -> bool:
+        """
+        Blocks from another node: only transactions this node stored before keep their user,
+        since user ids are local and a peer's 'user_id' metadata refers to its own users.
+        """
+        with self._writer() as db:
+            try:
+                owners = self._owners_from(db, height)
+                dropped = select(BlockModel.id).where(BlockModel.index >= height)
+                self.search.unindex_from_height(db, height)
+                db.execute(delete(TransactionModel).where(TransactionModel.block_id.in_(dropped)))
+                db.execute(delete(BlockModel).where(BlockModel.index >= height))
+                for block in blocks:
+                    self._insert_block(db, block, owners)
+                db.commit()
+                return True
+            except Exception as e:
+                print(f"❌ Error replacing blocks in SQL: {str(e)}")
+                db.rollback()
+                return False
+
+    def transaction_owners(self, height: int) -> TransactionOwners:
+        with self._session(self.read_session_factory) as db:
+            return self._owners_from(db, height)
+
+    @staticmethod
+    def _owners_from(db: Session, height: int) -> TransactionOwners:
+        rows = db.execute(
+            select(TransactionModel.document_hash, TransactionModel.signature, TransactionModel.user_id)
+            .join(BlockModel, TransactionModel.block_id == BlockModel.id)
+            .where(BlockModel.index >= height)
+        )
+        return {(document_hash, signature): user_id for document_hash, signature, user_id in rows}
+
+    def _insert_block(self, db: Session, block: Block, owners: Optional[TransactionOwners] = None):
+        """Insert a block and bulk-insert its transactions in the current DB transaction."""
+        db_block = BlockModel(**self._block_row(block))
+        db.add(db_block)
+        db.flush() # Get the ID
+
+        if block.transactions:
+            db.execute(TRANSACTION_INSERT, self._transaction_rows(db_block.id, block.transactions, owners))
+            self.search.index_block(db, db_block.id)
+
+    @staticmethod
+    def _block_row(block: Block) -> dict:
+        return {
+            "index": block.index,
+            "timestamp": block.timestamp,
+            "previous_hash": block.previous_hash,
+            "nonce": block.nonce,
+            "block_hash": block.hash,
+            "version": block.version,
+            "tx_root": block.tx_root
+        }
+
+    @staticmethod
+    def _transaction_rows(block_id: int, transactions: List[Transaction], owners: Optional[TransactionOwners] = None) -> List[dict]:
+        """
+        Rows for the transactions of a block. The user comes from the 'user_id' metadata of
+        blocks sealed from local requests, and only from 'owners' when it is given.
+        """
+        return [
+            {
+                "block_id": block_id,
+                "user_id": tx.metadata.get("user_id") if owners is None else owners.get((tx.document_hash, tx.signature)),
+                "owner_address": tx.owner,
+                "document_hash": tx.document_hash,
+                "metadata_json": tx.metadata,
+                "timestamp": tx.timestamp,
+                "signature": tx.signature
+            }
+            for tx in transactions
+        ]
 
     def load_chain(self) -> List[Block]:
-        if not self.db:
-            return []
-            
         try:
-            db_blocks = self.db.query(BlockModel).order_by(BlockModel.index).all()
             chain = []
-            
-            for db_b in db_blocks:
-                txs = []
-                for t in db_b.transactions:
-                    tx = Transaction(
-                        owner=t.owner_address,
-                        document_hash=t.document_hash,
-                        metadata=t.metadata_json,
-                        signature=t.signature
-                    )
-                    tx.timestamp = t.timestamp # Restore original timestamp
-                    txs.append(tx)
-                    
-                block = Block(
-                    index=db_b.index,
-                    transactions=txs,
-                    previous_hash=db_b.previous_hash,
-                    timestamp=db_b.timestamp,
-                    nonce=db_b.nonce,
-                    hash=db_b.block_hash
-                )
-                chain.append(block)
+            for blocks in self.iter_chain():
+                chain.extend(blocks)
             return chain
         except Exception as e:
             print(f"❌ Error loading chain from SQL: {str(e)}")
             return []
 
+    def iter_chain(self, chunk_size: int = 1000, start_height: int = 0) -> Iterator[List[Block]]:
+        """
+        Stream the chain in chunks with two set-based queries per chunk (blocks, then
+        their transactions). Rows are read through Core selects, so nothing accumulates
+        in the session's identity map. Read errors propagate: a stream that ends early
+        would look like a shorter chain.
+        """
+        with self._session(self.read_session_factory) as db:
+            yield from self._iter_chain(db, chunk_size, start_height)
+
+    def _iter_chain(self, db: Session, chunk_size: int, start_height: int) -> Iterator[List[Block]]:
+        blocks_table = BlockModel.__table__
+        txs_table = TransactionModel.__table__
+        last_index = start_height - 1
+        while True:
+            block_rows = db.execute(
+                select(blocks_table)
+                .where(blocks_table.c.index > last_index)
+                .order_by(blocks_table.c.index)
+                .limit(chunk_size)
+            ).all()
+            if not block_rows:
+                return
+
+            first_index, last_index = block_rows[0].index, block_rows[-1].index
+            txs_by_block = {row.id: [] for row in block_rows}
+            tx_rows = db.execute(
+                select(txs_table)
+                .join(blocks_table, txs_table.c.block_id == blocks_table.c.id)
+                .where(blocks_table.c.index.between(first_index, last_index))
+                .order_by(txs_table.c.id)
+            )
+            for t in tx_rows:
+                tx = Transaction(
+                    owner=t.owner_address,
+                    document_hash=t.document_hash,
+                    metadata=t.metadata_json,
+                    signature=t.signature
+                )
+                tx.timestamp = t.timestamp # Restore original timestamp
+                txs_by_block[t.block_id].append(tx)
+
+            yield [
+                Block(
+                    index=b.index,
+                    transactions=txs_by_block[b.id],
+                    previous_hash=b.previous_hash,
+                    timestamp=b.timestamp,
+                    nonce=b.nonce,
+                    hash=b.block_hash,
+                    version=b.version or LEGACY_BLOCK_VERSION,
+                    tx_root=b.tx_root
+                )
+                for b in block_rows
+            ]
+
+    def get_blocks(self, start: int, limit: int) -> List[Block]:
+        with self._session(self.read_session_factory) as db:
+            chunks = self._iter_chain(db, limit, start)
+            try:
+                return next(chunks, [])
+            finally:
+                chunks.close()
+
+    def chain_length(self) -> int:
+        with self._session(self.read_session_factory) as db:
+            # Heights are contiguous from 0
+            last = db.execute(select(func.max(BlockModel.index))).scalar()
+            return 0 if last is None else last + 1
+
     def save_node(self, node_url: str) -> bool:
-        if not self.db: return False
-        try:
-            exists = self.db.query(NodeModel).filter(NodeModel.url == node_url).first()
-            if not exists:
-                node = NodeModel(url=node_url)
-                self.db.add(node)
-                self.db.commit()
-            return True
-        except:
-            self.db.rollback()
-            return False
+        with self._writer() as db:
+            try:
+                exists = db.query(NodeModel).filter(NodeModel.url == node_url).first()
+                if not exists:
+                    node = NodeModel(url=node_url)
+                    db.add(node)
+                    db.commit()
+                return True
+            except:
+                db.rollback()
+                return False
 
     def load_nodes(self) -> List[str]:
-        if not self.db: return []
-        try:
-            nodes = self.db.query(NodeModel).all()
-            return [n.url for n in nodes]
-        except:
-            return []
+        with self._session(self.read_session_factory) as db:
+            try:
+                nodes = db.query(NodeModel).all()
+                return [n.url for n in nodes]
+            except:
+                return []
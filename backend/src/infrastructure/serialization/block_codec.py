@@ -0,0 +1,34 @@
+from typing import Any, Dict
+from src.domain.entities.block import Block, LEGACY_BLOCK_VERSION
+from src.domain.entities.transaction import Transaction
+
+def block_to_dict(block: Block, transactions: bool = True) -> Dict[str, Any]:
+    """
+    Plain dict form of a block, as stored by the file-based repositories and sent to peers:
+    header fields and hash, plus the transactions unless 'transactions' is False.
+    """
+    data = {
+        "index": block.index,
+        "timestamp": block.timestamp,
+        "previous_hash": block.previous_hash,
+        "nonce": block.nonce,
+        "hash": block.hash,
+        "version": block.version,
+        "tx_root": block.tx_root
+    }
+    if transactions:
+        data["transactions"] = [tx.to_dict() for tx in block.transactions]
+    return data
+
+def block_from_dict(data: Dict[str, Any]) -> Block:
+    """
+    Inverse of block_to_dict. A header (no 'transactions') becomes a block without transactions.
+    """
+    txs = [
+        Transaction(t['owner'], t['document_hash'], t['metadata'], t['timestamp'], t.get('signature'))
+        for t in data.get('transactions', [])
+    ]
+    return Block(
+        data['index'], txs, data['previous_hash'], data['timestamp'], data['nonce'], data['hash'],
+        data.get('version', LEGACY_BLOCK_VERSION), data.get('tx_root')
+    )
@@ -0,0 +1,185 @@
+import hashlib
+import os
+import queue
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from src.infrastructure.services.pdf_service import PDFCertificateGenerator, CERTIFICATE_TEMPLATE_VERSION
+
+# Render locks are striped by key so concurrent requests for one certificate render it once
+RENDER_LOCK_STRIPES = 64
+
+class CertificateCache:
+    """
+    Rendered PDF certificates keyed by transaction identity: an in-memory LRU in front of
+    a directory of PDF files. Each tier is bounded by total size and evicts the least
+    recently used certificates first. A confirmed transaction never changes, so entries
+    never go stale; the key includes the template version so a new layout renders afresh.
+    """
+    def __init__(
+        self,
+        generator: PDFCertificateGenerator,
+        directory: Optional[str] = None,
+        memory_bytes: int = 64 * 1024 * 1024,
+        disk_bytes: int = 512 * 1024 * 1024,
+        max_prerender: int = 1000
+    ):
+        self.generator = generator
+        self.directory = directory
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_size = 0
+        self._memory_lock = threading.Lock()
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_size = 0
+        self._disk_lock = threading.Lock()
+        self._render_locks = [threading.Lock() for _ in range(RENDER_LOCK_STRIPES)]
+
+        self._prerender: "queue.Queue[Optional[Tuple[str, Dict[str, Any]]]]" = queue.Queue(maxsize=max_prerender)
+        self._thread: Optional[threading.Thread] = None
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._scan_disk()
+
+    @staticmethod
+    def key(tx_hash: str, signature: Optional[str]) -> str:
+        """Cache key of a transaction's certificate."""
+        return hashlib.sha256(f"{CERTIFICATE_TEMPLATE_VERSION}:{tx_hash}:{signature}".encode()).hexdigest()
+
+    def peek(self, key: str) -> Optional[bytes]:
+        """The certificate if it is in memory; never touches the disk or renders."""
+        with self._memory_lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+            return data
+
+    def lookup(self, key: str) -> Optional[bytes]:
+        """The certificate from memory or disk, without rendering it."""
+        return self.peek(key) or self._read_disk(key)
+
+    def get(self, key: str, tx_data: Dict[str, Any]) -> bytes:
+        """The certificate from memory, then disk, rendering and storing it on a miss."""
+        data = self.peek(key)
+        if data is not None:
+            return data
+        with self._render_locks[int(key[:8], 16) % RENDER_LOCK_STRIPES]:
+            data = self.lookup(key)
+            if data is None:
+                data = self.generator.generate_certificate(tx_data).getvalue()
+                self._write_disk(key, data)
+            self._remember(key, data)
+            return data
+
+    def prerender(self, key: str, tx_data: Dict[str, Any]) -> bool:
+        """
+        Queue a certificate for background rendering. Returns False if the queue is full;
+        the certificate is then rendered on its first download instead.
+        """
+        try:
+            self._prerender.put_nowait((key, tx_data))
+            return True
+        except queue.Full:
+            return False
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="certificate-prerender", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Render the certificates already queued, then stop the background thread."""
+        if self._thread is not None:
+            self._prerender.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while True:
+            item = self._prerender.get()
+            if item is None:
+                return
+            key, tx_data = item
+            try:
+                self.get(key, tx_data)
+            except Exception as e:
+                print(f"❌ Error pre-rendering certificate {key[:12]}: {str(e)}")
+
+    def _remember(self, key: str, data: bytes):
+        if len(data) > self.memory_bytes:
+            return
+        with self._memory_lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_size -= len(previous)
+            self._memory[key] = data
+            self._memory_size += len(data)
+            while self._memory_size > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.pdf")
+
+    def _scan_disk(self):
+        # Rebuild the disk LRU from the files left by previous runs, oldest access first
+        entries: List[Tuple[float, str, int]] = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".pdf"):
+                    stat = os.stat(os.path.join(root, name))
+                    entries.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_size += size
+        self._evict_disk()
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.directory:
+            return None
+        with self._disk_lock:
+            if key not in self._disk:
+                return None
+            self._disk.move_to_end(key)
+        try:
+            path = self._path(key)
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except OSError:
+            with self._disk_lock:
+                self._disk_size -= self._disk.pop(key, 0)
+            return None
+
+    def _write_disk(self, key: str, data: bytes):
+        if not self.directory or len(data) > self.disk_bytes:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so readers never see a partial certificate
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Could not store certificate {key[:12]}: {e}")
+            return
+        with self._disk_lock:
+            self._disk_size += len(data) - self._disk.pop(key, 0)
+            self._disk[key] = len(data)
+            self._evict_disk()
+
+    def _evict_disk(self):
+        while self._disk_size > self.disk_bytes:
+            key, size = self._disk.popitem(last=False)
+            self._disk_size -= size
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
@@ -0,0 +1,99 @@
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from src.infrastructure.services.pdf_service import PDFCertificateGenerator
+from src.infrastructure.services.certificate_cache import CertificateCache
+
+# (cache key, file name in the archive, certificate data) for each exported certificate
+ExportItem = Tuple[str, str, Dict[str, Any]]
+
+# One generator per worker process, created on its first render
+_worker_generator: Optional[PDFCertificateGenerator] = None
+
+
+def render_certificate(tx_data: Dict[str, Any]) -> bytes:
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = PDFCertificateGenerator()
+    return _worker_generator.generate_certificate(tx_data).getvalue()
+
+
+class _ZipSink:
+    """Write-only target for ZipFile; the bytes written so far are taken out after each entry."""
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class CertificateZipExporter:
+    """
+    Streams many certificates as one ZIP archive. Certificates found in the CertificateCache
+    are copied as they are; the rest are rendered on a process pool with at most
+    'max_in_flight' renders outstanding, and added as they finish. Memory stays at about
+    'max_in_flight' certificates plus one archive entry, whatever the export size.
+    """
+    def __init__(self, cache: CertificateCache, workers: Optional[int] = None, max_in_flight: Optional[int] = None):
+        self.cache = cache
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or 2 * self.workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self._pool
+
+    def zip_stream(self, items: Iterable[ExportItem]) -> Iterator[bytes]:
+        """ZIP archive bytes, one piece per certificate plus the central directory at the end."""
+        sink = _ZipSink()
+        with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, tx_data, pdf in self._certificates(items):
+                # Entries carry the notarization time (ZIP dates start in 1980)
+                timestamp = max(tx_data.get("timestamp", 0), 315532800)
+                archive.writestr(zipfile.ZipInfo(name, time.gmtime(timestamp)[:6]), pdf, zipfile.ZIP_DEFLATED)
+                yield sink.take()
+        yield sink.take()
+
+    def _certificates(self, items: Iterable[ExportItem]) -> Iterator[Tuple[str, Dict[str, Any], bytes]]:
+        pending: Dict[Future, Tuple[str, Dict[str, Any]]] = {}
+        try:
+            for key, name, tx_data in items:
+                pdf = self.cache.lookup(key)
+                if pdf is not None:
+                    yield name, tx_data, pdf
+                    continue
+                while len(pending) >= self.max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield (*pending.pop(future), future.result())
+                pending[self._get_pool().submit(render_certificate, tx_data)] = (name, tx_data)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield (*pending.pop(future), future.result())
+        finally:
+            # The client may disconnect mid-export: drop the renders nobody will read
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
@@ -1,14 +1,18 @@
-from fpdf import FPDF
 from datetime import datetime
 import io
 import os
 
+# Bump when the certificate layout changes so cached certificates are rendered again
+CERTIFICATE_TEMPLATE_VERSION = 1
+
 class PDFCertificateGenerator:
     """
     Infrastructure service to generate Notarization Certificates in PDF format.
     """
     
     def generate_certificate(self, transaction_data: dict) -> io.BytesIO:
+        # fpdf is slow to import and only needed here; the API starts without it
+        from fpdf import FPDF
         pdf = FPDF(orientation='P', unit='mm', format='A4')
         pdf.add_page()
         
@@ -0,0 +1,62 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Importing the API only wires objects together; keep its certificate directory out of the tree
+CACHE_DIR = tempfile.mkdtemp()
+os.environ.setdefault("CERTIFICATE_CACHE_DIR", CACHE_DIR)
+
+from fastapi.testclient import TestClient
+from src.api import server
+from src.application.services.block_producer import NotarizationReceipt
+
+def tearDownModule():
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+class TestPerUserAccess(unittest.TestCase):
+
+    def setUp(self):
+        # No lifespan: jobs stay queued, which is all these lookups need
+        self.user = SimpleNamespace(id=1)
+        server.app.dependency_overrides[server.get_current_user] = lambda: self.user
+        self.client = TestClient(server.app)
+
+    def tearDown(self):
+        server.app.dependency_overrides.clear()
+
+    def test_jobs_are_visible_only_to_their_submitter(self):
+        own = server.job_queue.submit("a1" * 32, lambda: None, user_id=1)
+        other = server.job_queue.submit("b2" * 32, lambda: None, user_id=2)
+
+        response = self.client.get(f"/jobs/{own.job_id}")
+        self.assertEqual((response.status_code, response.json()["document_hash"]), (200, "a1" * 32))
+        self.assertEqual(self.client.get(f"/jobs/{other.job_id}").status_code, 404)
+        self.assertEqual(self.client.get("/jobs/unknown").status_code, 404)
+
+        server.app.dependency_overrides.clear()
+        self.assertEqual(self.client.get(f"/jobs/{own.job_id}").status_code, 401)
+
+    def test_receipts_are_visible_only_to_their_owner(self):
+        receipts = {r.receipt_id: r for r in (NotarizationReceipt("a1" * 32, user_id=1), NotarizationReceipt("b2" * 32, user_id=2))}
+        own, other = receipts
+
+        with mock.patch.object(server.notary_service, "get_receipt", receipts.get):
+            response = self.client.get(f"/receipts/{own}")
+            self.assertEqual((response.status_code, response.json()["document_hash"]), (200, "a1" * 32))
+            self.assertEqual(self.client.get(f"/receipts/{other}").status_code, 404)
+
+            server.app.dependency_overrides.clear()
+            self.assertEqual(self.client.get(f"/receipts/{own}").status_code, 401)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import asyncio
+import os
+import sys
+import threading
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.application.services.ttl_cache import TTLCache
+from src.application.services.password_hasher import PasswordHasherPool, PasswordHasherBusy
+
+class TestTTLCache(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.cache = TTLCache(ttl=30, max_entries=2, clock=lambda: self.now)
+
+    def test_entries_expire_after_ttl(self):
+        self.cache.put("alice@example.com", "alice")
+        self.now = 29.9
+        self.assertEqual(self.cache.get("alice@example.com"), "alice")
+        self.now = 30
+        self.assertIsNone(self.cache.get("alice@example.com"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.get("a")
+        self.cache.put("c", 3)
+        self.assertEqual((self.cache.get("a"), self.cache.get("b"), self.cache.get("c")), (1, None, 3))
+
+    def test_invalidate_and_disabled_cache(self):
+        self.cache.put("a", 1)
+        self.cache.invalidate("a")
+        self.assertIsNone(self.cache.get("a"))
+
+        disabled = TTLCache(ttl=0)
+        disabled.put("a", 1)
+        self.assertIsNone(disabled.get("a"))
+
+class TestPasswordHasherPool(unittest.TestCase):
+
+    def test_hash_and_verify_off_the_event_loop(self):
+        pool = PasswordHasherPool(workers=2)
+
+        async def scenario():
+            hashed = await pool.hash("s3cret")
+            return await asyncio.gather(pool.verify("s3cret", hashed), pool.verify("wrong", hashed))
+
+        self.assertEqual(asyncio.run(scenario()), [True, False])
+        self.assertEqual(pool.pending, 0)
+
+    def test_rejects_work_beyond_max_pending(self):
+        pool = PasswordHasherPool(workers=1, max_pending=2)
+        release = threading.Event()
+
+        async def scenario():
+            running = [asyncio.ensure_future(pool._run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0)
+            with self.assertRaises(PasswordHasherBusy):
+                await pool._run(release.wait)
+            release.set()
+            return await asyncio.gather(*running)
+
+        self.assertEqual(asyncio.run(scenario()), [True, True])
+        self.assertEqual(pool.pending, 0)
+
+if __name__ == '__main__':
+    unittest.main()
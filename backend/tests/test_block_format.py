@@ -0,0 +1,183 @@
+import unittest
+import os
+import pickle
+import sys
+import tempfile
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.domain.entities.block import Block, LEGACY_BLOCK_VERSION, MERKLE_BLOCK_VERSION, CURRENT_BLOCK_VERSION
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.cryptography.canonical_encoding import encode_value
+from src.infrastructure.cryptography.merkle_tree import MerkleTree, verify_proof
+from src.infrastructure.persistence.json_repository import JSONBlockchainRepository
+from src.application.services.chain_validator import ChainValidator
+
+class TestBlockFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.crypto = ECDSAService()
+        self.blockchain = Blockchain(crypto_service=self.crypto, difficulty=2)
+
+    def _mine_legacy_block(self, index, previous_hash):
+        block = Block(index, [Transaction("SYSTEM", f"legacy_{index}")], previous_hash, version=LEGACY_BLOCK_VERSION)
+        while True:
+            block.hash = self.crypto.calculate_hash(block)
+            if block.hash.startswith("00"):
+                return block
+            block.nonce += 1
+
+    def test_header_hash_matches_full_hash(self):
+        block = self.blockchain.mine_pending_transactions("miner")
+        self.assertEqual(block.version, CURRENT_BLOCK_VERSION)
+        self.assertIsNotNone(block.tx_root)
+        self.assertEqual(block.hash, self.crypto.calculate_hash(block))
+
+    def test_legacy_blocks_still_validate(self):
+        genesis = self._mine_legacy_block(0, "0")
+        legacy = self._mine_legacy_block(1, genesis.hash)
+        self.blockchain.chain = [genesis, legacy]
+        self.blockchain.mine_pending_transactions("miner")
+
+        self.assertEqual(self.blockchain.chain[-1].version, CURRENT_BLOCK_VERSION)
+        self.assertTrue(self.blockchain.is_chain_valid(self.blockchain.chain))
+
+        legacy.transactions[0].document_hash = "TAMPERED"
+        self.assertFalse(self.blockchain.is_chain_valid(self.blockchain.chain))
+
+    def test_tampered_tx_root_fails(self):
+        block = self.blockchain.mine_pending_transactions("miner")
+        block.tx_root = "0" * 64
+        self.assertFalse(self.blockchain.is_chain_valid(self.blockchain.chain))
+
+    def test_json_repository_keeps_version(self):
+        self.blockchain.mine_pending_transactions("miner")
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = JSONBlockchainRepository(os.path.join(tmp, "chain.json"), os.path.join(tmp, "nodes.json"))
+            repo.save_chain(self.blockchain.chain)
+            loaded = repo.load_chain()
+
+        self.assertEqual([b.version for b in loaded], [b.version for b in self.blockchain.chain])
+        self.assertTrue(self.blockchain.is_chain_valid(loaded))
+
+class TestCompactEntities(unittest.TestCase):
+
+    def setUp(self):
+        self.crypto = ECDSAService()
+
+    def test_hex_fields_round_trip(self):
+        tx = Transaction("04" + "ab" * 64, "CD" * 32, {"user_id": 1}, 1.5, "30" * 70)
+        self.assertIsInstance(tx._owner, bytes)
+        self.assertEqual(tx.owner, "04" + "ab" * 64)
+        # Uppercase hex cannot round-trip through bytes and is kept verbatim
+        self.assertEqual(tx.document_hash, "CD" * 32)
+        self.assertEqual(Transaction("SYSTEM", "REWARD").owner, "SYSTEM")
+
+        block = Block(1, [tx], "0", hash="00" + "f" * 62)
+        self.assertEqual((block.previous_hash, block.hash, block.tx_root), ("0", "00" + "f" * 62, None))
+
+        copy = pickle.loads(pickle.dumps(block))
+        self.assertEqual(copy, block)
+        self.assertEqual(copy.transactions[0].signature, "30" * 70)
+
+    def test_cached_hash_is_invalidated_on_change(self):
+        tx = Transaction("SYSTEM", "doc", {"n": 1}, 1.0)
+        first = self.crypto.calculate_tx_hash(tx)
+        self.assertIsNotNone(tx.cached_hash(CURRENT_BLOCK_VERSION))
+
+        tx.signature = "ab" * 10
+        self.assertEqual(self.crypto.calculate_tx_hash(tx), first)
+        tx.metadata = {"n": 2}
+        self.assertIsNone(tx.cached_hash(CURRENT_BLOCK_VERSION))
+        self.assertNotEqual(self.crypto.calculate_tx_hash(tx), first)
+        tx.metadata = {"n": 1}
+        self.assertEqual(self.crypto.calculate_tx_hash(tx), first)
+
+    def test_metadata_cannot_be_mutated_in_place(self):
+        tx = Transaction("SYSTEM", "doc", {"n": 1}, 1.0)
+        first = self.crypto.calculate_tx_hash(tx)
+
+        for mutate in (lambda m: m.__setitem__("n", 2), lambda m: m.update(n=2), lambda m: m.pop("n"), lambda m: m.clear()):
+            with self.assertRaises(TypeError):
+                mutate(tx.metadata)
+        self.assertEqual(tx.metadata, {"n": 1})
+        self.assertEqual(self.crypto.calculate_tx_hash(tx), first)
+        self.assertEqual(pickle.loads(pickle.dumps(tx)).metadata, {"n": 1})
+
+class TestMerkleTree(unittest.TestCase):
+
+    def setUp(self):
+        self.crypto = ECDSAService()
+
+    def test_every_leaf_has_valid_proof(self):
+        for size in range(1, 10):
+            leaves = [self.crypto.calculate_hash(f"leaf_{size}_{i}") for i in range(size)]
+            tree = MerkleTree(leaves)
+            for position, leaf in enumerate(leaves):
+                self.assertTrue(verify_proof(leaf, tree.proof(position), tree.root))
+
+    def test_proof_rejects_other_leaf(self):
+        leaves = [self.crypto.calculate_hash(i) for i in range(5)]
+        tree = MerkleTree(leaves)
+        self.assertFalse(verify_proof(leaves[1], tree.proof(0), tree.root))
+
+    def test_block_root_commits_to_transactions(self):
+        blockchain = Blockchain(crypto_service=self.crypto, difficulty=1)
+        for i in range(3):
+            blockchain.pending_transactions.append(Transaction("SYSTEM", f"doc_{i}"))
+        block = blockchain.mine_pending_transactions("miner")
+
+        tx_hash = self.crypto.calculate_hash(block.transactions[2])
+        proof = self.crypto.merkle_proof(block.transactions, 2)
+        self.assertTrue(verify_proof(tx_hash, proof, block.tx_root))
+
+class TestCanonicalEncoding(unittest.TestCase):
+
+    def setUp(self):
+        self.crypto = ECDSAService()
+
+    def test_encoding_is_independent_of_key_order(self):
+        self.assertEqual(encode_value({"b": 1, "a": [1.5, None]}), encode_value({"a": [1.5, None], "b": 1}))
+        self.assertNotEqual(encode_value({"a": 1}), encode_value({"a": 1.0}))
+        self.assertNotEqual(encode_value(["ab", "c"]), encode_value(["a", "bc"]))
+
+    def test_merkle_blocks_validate_before_binary_blocks(self):
+        keys = self.crypto.generate_key_pair()
+        blockchain = Blockchain(crypto_service=self.crypto, difficulty=1)
+
+        # A version 3 block whose transaction was signed over its JSON hash
+        tx = Transaction(keys["public_key_hex"], "doc_v3", {"n": 1})
+        tx.signature = self.crypto.sign_data(
+            self.crypto.calculate_tx_hash(tx, MERKLE_BLOCK_VERSION), keys["private_key"]
+        )
+        old = Block(1, [tx], blockchain.chain[0].hash, version=MERKLE_BLOCK_VERSION)
+        old.tx_root = self.crypto.calculate_tx_root(old.transactions, old.version)
+        hasher = self.crypto.header_hasher(old)
+        while not hasher.hash_nonce(old.nonce).startswith("0"):
+            old.nonce += 1
+        old.hash = hasher.hash_nonce(old.nonce)
+        blockchain.chain.append(old)
+
+        block = blockchain.mine_pending_transactions("miner")
+        self.assertEqual(block.version, CURRENT_BLOCK_VERSION)
+        self.assertNotEqual(
+            self.crypto.calculate_tx_hash(tx, MERKLE_BLOCK_VERSION), self.crypto.calculate_tx_hash(tx)
+        )
+        self.assertTrue(blockchain.is_chain_valid(blockchain.chain))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = JSONBlockchainRepository(os.path.join(tmp, "chain.json"), os.path.join(tmp, "nodes.json"))
+            repo.save_chain(blockchain.chain)
+            validator = ChainValidator(self.crypto, workers=1, checkpoint_path=os.path.join(tmp, "checkpoint.json"))
+            report = validator.validate_repository(repo)
+        self.assertTrue(report.valid)
+        self.assertEqual(report.signatures_checked, 1)
+
+if __name__ == '__main__':
+    unittest.main()
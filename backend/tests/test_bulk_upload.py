@@ -0,0 +1,67 @@
+import unittest
+import io
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Importing the API only wires objects together; keep its certificate directory out of the tree
+CACHE_DIR = tempfile.mkdtemp()
+os.environ.setdefault("CERTIFICATE_CACHE_DIR", CACHE_DIR)
+
+from fastapi.testclient import TestClient
+from src.api import server
+
+def tearDownModule():
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+class TestBulkUploadArchives(unittest.TestCase):
+
+    def setUp(self):
+        # No lifespan: these requests are rejected before the ledger is touched
+        server.app.dependency_overrides[server.get_current_user] = lambda: None
+        self.client = TestClient(server.app)
+
+    def tearDown(self):
+        server.app.dependency_overrides.clear()
+
+    def _post(self, name, content):
+        return self.client.post("/notarize/bulk", files=[("files", (name, content))], data={"owner_address": "owner"})
+
+    def _archive(self, content: bytes, flags: int = 0, method: int = None) -> bytes:
+        """A stored single-entry zip, with its flags/compression method patched in both headers."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("a.bin", content)
+        data = bytearray(buffer.getvalue())
+        central = data.index(b"PK\x01\x02")
+        for flags_at in (6, central + 8):
+            data[flags_at] |= flags
+            if method is not None:
+                data[flags_at + 2] = method
+        return bytes(data)
+
+    def test_unreadable_archives_are_rejected_with_400(self):
+        content = os.urandom(3000)
+        damaged = bytearray(self._archive(content))
+        damaged[100:200] = b"\xff" * 100
+
+        for name, archive in (
+            ("bad.zip", b"not a zip at all"),                     # BadZipFile
+            ("damaged.zip", bytes(damaged)),                      # BadZipFile (CRC)
+            ("encrypted.zip", self._archive(content, flags=0x1)), # RuntimeError
+            ("aes.zip", self._archive(content, method=99)),       # NotImplementedError
+        ):
+            response = self._post(name, archive)
+            self.assertEqual(response.status_code, 400, name)
+            self.assertIn(name, response.json()["detail"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.domain.entities.blockchain import Blockchain
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence.json_repository import JSONBlockchainRepository
+from src.infrastructure.services.pdf_service import PDFCertificateGenerator
+from src.infrastructure.services.certificate_cache import CertificateCache
+from src.application.use_cases.notary_service import NotaryService
+
+class CountingGenerator(PDFCertificateGenerator):
+    def __init__(self):
+        self.renders = 0
+
+    def generate_certificate(self, transaction_data):
+        self.renders += 1
+        return super().generate_certificate(transaction_data)
+
+class TestCertificateCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.generator = CountingGenerator()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _tx(self, n):
+        return {
+            "owner": "04" + "ab" * 64,
+            "timestamp": 1700000000 + n,
+            "document_hash": f"{n:064x}",
+            "metadata": {"original_filename": f"doc_{n}.pdf", "description": "Contrato"},
+            "signature": "cd" * 70
+        }
+
+    def _key(self, n):
+        return CertificateCache.key(f"tx_{n}", "cd" * 70)
+
+    def test_renders_once_then_serves_from_memory(self):
+        cache = CertificateCache(self.generator)
+        self.assertIsNone(cache.peek(self._key(1)))
+
+        pdf = cache.get(self._key(1), self._tx(1))
+        self.assertTrue(pdf.startswith(b"%PDF"))
+        self.assertEqual(cache.get(self._key(1), self._tx(1)), pdf)
+        self.assertEqual(cache.peek(self._key(1)), pdf)
+        self.assertEqual(self.generator.renders, 1)
+
+    def test_disk_store_survives_restarts(self):
+        directory = os.path.join(self.tmp.name, "certs")
+        pdf = CertificateCache(self.generator, directory).get(self._key(1), self._tx(1))
+
+        reopened = CertificateCache(self.generator, directory)
+        self.assertIsNone(reopened.peek(self._key(1)))
+        self.assertEqual(reopened.get(self._key(1), self._tx(1)), pdf)
+        self.assertEqual(self.generator.renders, 1)
+
+    def test_tiers_evict_least_recently_used_by_size(self):
+        size = len(self.generator.generate_certificate(self._tx(0)).getvalue())
+        directory = os.path.join(self.tmp.name, "certs")
+        cache = CertificateCache(self.generator, directory, memory_bytes=2 * size + 100, disk_bytes=3 * size + 100)
+
+        for n in range(1, 4):
+            cache.get(self._key(n), self._tx(n))
+        cache.get(self._key(2), self._tx(2))
+        cache.get(self._key(4), self._tx(4))
+
+        self.assertEqual([n for n in range(1, 5) if cache.peek(self._key(n))], [2, 4])
+        stored = sorted(f[:-4] for _, _, files in os.walk(directory) for f in files)
+        self.assertEqual(stored, sorted(self._key(n) for n in (2, 3, 4)))
+
+    def test_prerender_renders_in_background(self):
+        cache = CertificateCache(self.generator)
+        cache.start()
+        self.assertTrue(cache.prerender(self._key(1), self._tx(1)))
+        cache.stop()
+        self.assertIsNotNone(cache.peek(self._key(1)))
+
+    def test_block_listener_runs_after_persistence(self):
+        crypto = ECDSAService()
+        repository = JSONBlockchainRepository(
+            os.path.join(self.tmp.name, "chain.json"), os.path.join(self.tmp.name, "nodes.json")
+        )
+        service = NotaryService(Blockchain(crypto_service=crypto, difficulty=1), repository, crypto)
+        sealed = []
+        service.add_block_listener(lambda block: sealed.append((block.index, len(repository.load_chain()))))
+        service.add_block_listener(lambda block: 1 / 0)
+
+        keys = crypto.generate_key_pair()
+        block = service.record_hash("a" * 64, keys["public_key_hex"], keys["private_key"])
+        self.assertEqual(sealed, [(block.index, block.index + 1)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import io
+import os
+import sys
+import zipfile
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.infrastructure.services.pdf_service import PDFCertificateGenerator
+from src.infrastructure.services.certificate_cache import CertificateCache
+from src.infrastructure.services.certificate_export import CertificateZipExporter, render_certificate
+
+class TestCertificateZipExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = CertificateCache(PDFCertificateGenerator())
+        self.exporter = CertificateZipExporter(self.cache, workers=2, max_in_flight=3)
+
+    def tearDown(self):
+        self.exporter.shutdown()
+
+    def _items(self, count):
+        for n in range(count):
+            yield CertificateCache.key(f"tx_{n}", "cd" * 70), f"certificado_{n}.pdf", {
+                "owner": "04" + "ab" * 64,
+                "timestamp": 1700000000 + n,
+                "document_hash": f"{n:064x}",
+                "metadata": {"original_filename": f"doc_{n}.pdf"},
+                "signature": "cd" * 70
+            }
+
+    def test_streams_every_certificate_into_a_valid_zip(self):
+        items = list(self._items(10))
+        # Cached certificates are copied into the archive as they are
+        key, _, tx_data = items[4]
+        self.cache.get(key, tx_data)
+
+        pieces = list(self.exporter.zip_stream(iter(items)))
+        self.assertEqual(len(pieces), 11)
+
+        with zipfile.ZipFile(io.BytesIO(b"".join(pieces))) as archive:
+            self.assertIsNone(archive.testzip())
+            self.assertEqual(sorted(archive.namelist()), sorted(name for _, name, _ in items))
+            self.assertEqual(archive.read("certificado_4.pdf"), self.cache.peek(items[4][0]))
+            rendered = archive.read("certificado_7.pdf")
+            self.assertEqual(rendered, render_certificate(items[7][2]))
+            self.assertEqual(archive.getinfo("certificado_0.pdf").date_time[0], 2023)
+
+    def test_empty_export_is_an_empty_archive(self):
+        data = b"".join(self.exporter.zip_stream(iter([])))
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            self.assertEqual(archive.namelist(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,255 @@
+import unittest
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from src.domain.entities.block import Block, CURRENT_BLOCK_VERSION, LEGACY_BLOCK_VERSION, MERKLE_BLOCK_VERSION
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.networking.http_peer_client import HTTPPeerClient
+from src.infrastructure.persistence.json_repository import JSONBlockchainRepository
+from src.application.use_cases.notary_service import NotaryService
+from src.application.services.chain_sync import ChainSynchronizer
+from src.api.controllers.sync_controller import create_sync_router
+
+def _operator(request: Request):
+    if request.headers.get("authorization") != "Bearer operator":
+        raise HTTPException(status_code=401, detail="Credenciales inválidas")
+
+class Node:
+    """A NotaryChain node serving the sync endpoints on a localhost port, in this process."""
+
+    def __init__(self, directory: str, crypto: ECDSAService):
+        os.makedirs(directory)
+        self.repository = JSONBlockchainRepository(
+            os.path.join(directory, "chain.json"), os.path.join(directory, "nodes.json")
+        )
+        self.service = NotaryService(Blockchain(crypto_service=crypto, difficulty=1), self.repository, crypto)
+        # Small batches so a few blocks already span several header pages and body ranges
+        self.synchronizer = ChainSynchronizer(self.service, HTTPPeerClient(), header_batch=3, body_batch=2)
+        app = FastAPI()
+        app.include_router(create_sync_router(self.service, self.synchronizer, authorize=_operator))
+
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join()
+
+    @property
+    def hashes(self):
+        return [b.hash for b in self.service.blockchain.chain]
+
+class TestChainSync(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.crypto = ECDSAService()
+        self.keys = self.crypto.generate_key_pair()
+        self.nodes = [Node(os.path.join(self.tmp.name, name), self.crypto) for name in ("a", "b", "c")]
+        self.a, self.b, self.c = self.nodes
+
+    def tearDown(self):
+        for node in self.nodes:
+            node.stop()
+        self.tmp.cleanup()
+
+    def _notarize(self, node, document):
+        return node.service.record_hash(document.ljust(64, "0"), self.keys["public_key_hex"], self.keys["private_key"])
+
+    def test_fresh_node_adopts_longer_chain(self):
+        for i in range(6):
+            self._notarize(self.a, f"a{i}")
+        self.b.service.register_node(self.a.url.replace("http://", ""))
+
+        result = self.b.synchronizer.sync()
+
+        self.assertTrue(result.replaced)
+        self.assertEqual((result.fork_height, result.blocks_downloaded), (-1, 7))
+        self.assertEqual(self.b.hashes, self.a.hashes)
+        self.assertEqual([b.hash for b in self.b.repository.load_chain()], self.a.hashes)
+        self.assertTrue(self.b.service.verify_hash("a3".ljust(64, "0"))["verified"])
+        self.assertEqual(self.b.repository.load_nodes(), [self.a.url])
+
+    def test_fork_resolves_to_longest_chain_and_resubmits_orphans(self):
+        for i in range(3):
+            self._notarize(self.a, f"a{i}")
+        self.b.synchronizer.sync([self.a.url])
+
+        # Both extend the shared chain; a's branch is longer
+        for i in range(3, 6):
+            self._notarize(self.a, f"a{i}")
+        self._notarize(self.b, "b0")
+
+        result = self.b.synchronizer.sync([self.a.url])
+        self.assertTrue(result.replaced)
+        self.assertEqual(
+            (result.fork_height, result.blocks_downloaded, result.resubmitted_transactions, result.dropped_transactions),
+            (3, 3, 1, 0)
+        )
+        # b's orphaned notarization was sealed again on top of a's chain
+        self.assertEqual(self.b.hashes[:-1], self.a.hashes)
+        self.assertTrue(self.b.service.verify_hash("b0".ljust(64, "0"))["verified"])
+
+        # a then only downloads the block it is missing
+        result = self.a.synchronizer.sync([self.b.url])
+        self.assertEqual((result.replaced, result.fork_height, result.blocks_downloaded), (True, 6, 1))
+        self.assertEqual(self.a.hashes, self.b.hashes)
+
+    def test_equal_or_shorter_chains_are_kept(self):
+        self._notarize(self.a, "a0")
+        self._notarize(self.b, "b0")
+        result = self.b.synchronizer.sync([self.a.url, "http://127.0.0.1:9"])
+        self.assertFalse(result.replaced)
+        self.assertNotEqual(self.b.hashes, self.a.hashes)
+
+    def test_invalid_longer_chain_is_rejected(self):
+        for i in range(4):
+            self._notarize(self.c, f"c{i}")
+        for i in range(2):
+            self._notarize(self.a, f"a{i}")
+        # c's longest chain carries a transaction that was never signed by its owner
+        forged = self.c.service.blockchain.chain[2]
+        forged.transactions[0] = Transaction(self.keys["public_key_hex"], "f" * 64, {}, signature="00")
+        forged.tx_root = self.crypto.calculate_tx_root(forged.transactions, forged.version)
+        for block in self.c.service.blockchain.chain[2:]:
+            if block.index > 2:
+                block.previous_hash = self.c.service.blockchain.chain[block.index - 1].hash
+            block.nonce = self.c.service.blockchain._mine_serial(block).nonce
+
+        before = self.b.hashes
+        result = self.b.synchronizer.sync([self.c.url, self.a.url])
+
+        # c is rejected once its bodies fail validation; a's valid chain is adopted instead
+        self.assertTrue(result.replaced)
+        self.assertEqual(result.peer, self.a.url)
+        self.assertEqual(self.b.hashes, self.a.hashes)
+        self.assertNotEqual(self.b.hashes, before)
+
+    def test_bad_headers_are_rejected_before_any_body_download(self):
+        for i in range(4):
+            self._notarize(self.c, f"c{i}")
+        self.c.service.blockchain.chain[3].nonce += 1
+
+        requested = []
+        client = HTTPPeerClient()
+        get_blocks = client.get_blocks
+        client.get_blocks = lambda *args: requested.append(args) or get_blocks(*args)
+        result = ChainSynchronizer(self.b.service, client).sync([self.c.url])
+
+        self.assertFalse(result.replaced)
+        self.assertIn("Header 3 hash mismatch", result.reason)
+        self.assertEqual(requested, [])
+
+    def test_forged_legacy_blocks_are_rejected(self):
+        for i in range(2):
+            self._notarize(self.b, f"b{i}")
+        # c serves b's genesis followed by legacy blocks with no proof of work
+        forged = [self.b.service.blockchain.chain[0]]
+        for index in range(1, 10):
+            block = Block(index, [Transaction("SYSTEM", f"{index:064x}", {})], forged[-1].hash, version=LEGACY_BLOCK_VERSION)
+            block.hash = self.crypto.calculate_hash(block)
+            forged.append(block)
+        self.c.service.blockchain.chain = forged
+        before = self.b.hashes
+
+        result = self.b.synchronizer.sync([self.c.url])
+        self.assertFalse(result.replaced)
+        self.assertIn("Header 1 uses block format 1", result.reason)
+        self.assertEqual(self.b.hashes, before)
+
+    def test_peer_registration_needs_authorization_and_an_allowed_peer(self):
+        app = FastAPI()
+        app.include_router(create_sync_router(
+            self.b.service, self.b.synchronizer, authorize=_operator, allowed_peers=[self.a.url.replace("http://", "")]
+        ))
+        client = TestClient(app)
+        operator = {"Authorization": "Bearer operator"}
+
+        self.assertEqual(client.post("/nodes/register", json={"nodes": [self.a.url]}).status_code, 401)
+        self.assertEqual(client.post("/nodes/resolve").status_code, 401)
+        response = client.post("/nodes/register", json={"nodes": ["http://169.254.169.254"]}, headers=operator)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self.b.service.blockchain.nodes, set())
+
+        response = client.post("/nodes/register", json={"nodes": [self.a.url + "/"]}, headers=operator)
+        self.assertEqual((response.status_code, response.json()["registered"]), (201, [self.a.url]))
+        self.assertFalse(client.post("/nodes/resolve", headers=operator).json()["replaced"])
+
+    def test_chain_on_another_genesis_is_refused_unless_allowed(self):
+        for i in range(6):
+            self._notarize(self.a, f"a{i}")
+        self._notarize(self.b, "b0")
+        before = self.b.hashes
+
+        result = self.b.synchronizer.sync([self.a.url])
+        self.assertFalse(result.replaced)
+        self.assertIn("different genesis", result.reason)
+        self.assertEqual(self.b.hashes, before)
+
+        self.b.synchronizer.allow_deep_reorg = True
+        result = self.b.synchronizer.sync([self.a.url])
+        self.assertEqual((result.replaced, result.fork_height), (True, -1))
+        self.assertTrue(self.b.service.verify_hash("b0".ljust(64, "0"))["verified"])
+
+    def test_deep_or_finalized_forks_are_refused(self):
+        self._notarize(self.a, "a0")
+        self.b.synchronizer.sync([self.a.url])
+        for i in range(1, 6):
+            self._notarize(self.a, f"a{i}")
+        for i in range(3):
+            self._notarize(self.b, f"b{i}")
+        before = self.b.hashes
+
+        self.b.synchronizer.max_reorg_blocks = 2
+        result = self.b.synchronizer.sync([self.a.url])
+        self.assertIn("would replace 3 blocks, more than 2", result.reason)
+
+        self.b.synchronizer.max_reorg_blocks = 3
+        self.b.synchronizer.finalized_height = lambda: 2
+        result = self.b.synchronizer.sync([self.a.url])
+        self.assertIn("below the finalized height 2", result.reason)
+        self.assertEqual(self.b.hashes, before)
+
+        self.b.synchronizer.finalized_height = lambda: 1
+        result = self.b.synchronizer.sync([self.a.url])
+        self.assertEqual((result.replaced, result.fork_height, result.resubmitted_transactions), (True, 1, 3))
+
+    def test_orphans_signed_for_an_older_block_format_are_dropped(self):
+        service = self.b.service
+        legacy = Transaction(self.keys["public_key_hex"], "d" * 64, {"original_filename": "antiguo.pdf"})
+        legacy.signature = self.crypto.sign_data(
+            self.crypto.calculate_tx_hash(legacy, MERKLE_BLOCK_VERSION), self.keys["private_key"]
+        )
+        current = Transaction(self.keys["public_key_hex"], "e" * 64, {"original_filename": "actual.pdf"})
+        current.signature = self.crypto.sign_data(self.crypto.calculate_tx_hash(current), self.keys["private_key"])
+
+        self.assertEqual(service.resubmit_transactions([legacy, current]), 1)
+        # Re-sealed in a block of the current format only
+        self.assertEqual(service.blockchain.chain[-1].version, CURRENT_BLOCK_VERSION)
+        self.assertTrue(service.verify_hash("e" * 64)["verified"])
+        self.assertFalse(service.verify_hash("d" * 64)["verified"])
+
+if __name__ == '__main__':
+    unittest.main()
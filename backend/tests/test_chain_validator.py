@@ -0,0 +1,102 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence.json_repository import JSONBlockchainRepository
+from src.application.services.chain_validator import ChainValidator, validate_blocks
+
+class TestChainValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.crypto = ECDSAService()
+        self.keys = self.crypto.generate_key_pair()
+        self.blockchain = Blockchain(crypto_service=self.crypto, difficulty=1)
+        self.repository = JSONBlockchainRepository(
+            os.path.join(self.tmp.name, "chain.json"), os.path.join(self.tmp.name, "nodes.json")
+        )
+        self.checkpoint = os.path.join(self.tmp.name, "checkpoint.json")
+        self._mine_blocks(6)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _mine_blocks(self, count):
+        for _ in range(count):
+            tx = Transaction(self.keys["public_key_hex"], f"doc_{len(self.blockchain.chain)}")
+            tx.signature = self.crypto.sign_data(self.crypto.calculate_hash(tx), self.keys["private_key"])
+            self.blockchain.add_transaction(tx)
+            self.blockchain.mine_pending_transactions("miner")
+        self.repository.save_chain(self.blockchain.chain)
+
+    def _validator(self, workers=2):
+        return ChainValidator(self.crypto, workers=workers, chunk_size=2, checkpoint_path=self.checkpoint)
+
+    def test_parallel_validation_checks_signatures(self):
+        progress = []
+        report = self._validator().validate_repository(self.repository, on_progress=lambda h, n: progress.append(h))
+
+        self.assertTrue(report.valid)
+        self.assertEqual(report.validated_height, 6)
+        self.assertEqual(report.blocks_checked, 7)
+        self.assertEqual(report.signatures_checked, 6)
+        self.assertEqual(progress, [1, 3, 5, 6])
+
+    def test_reports_first_invalid_block(self):
+        # A forged signature does not change any block hash; only signature checks catch it
+        forged = self.crypto.generate_key_pair()
+        tx = self.blockchain.chain[4].transactions[0]
+        tx.signature = self.crypto.sign_data(self.crypto.calculate_hash(tx), forged["private_key"])
+        self.repository.save_chain(self.blockchain.chain)
+
+        report = self._validator().validate_repository(self.repository)
+        self.assertFalse(report.valid)
+        self.assertEqual(report.first_invalid_block, 4)
+        self.assertEqual(report.validated_height, 3)
+        self.assertIn("signature", report.reason)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_blocks_must_meet_the_given_difficulty(self):
+        chain = self.blockchain.chain
+        self.assertIsNone(validate_blocks(self.crypto, chain[1:], chain[0].hash, difficulty=1)[0])
+
+        # Mined for difficulty 1: the first block without a second leading zero fails at 2
+        expected = next(block.index for block in chain[1:] if not block.hash.startswith("00"))
+        invalid_height, reason, _, _ = validate_blocks(self.crypto, chain[1:], chain[0].hash, difficulty=2)
+        self.assertEqual((invalid_height, reason), (expected, "Block does not meet the proof of work target"))
+
+    def test_checkpoint_limits_later_runs_to_new_blocks(self):
+        self.assertTrue(self._validator(workers=1).validate_repository(self.repository).valid)
+        self._mine_blocks(2)
+
+        report = self._validator().validate_repository(self.repository)
+        self.assertTrue(report.valid)
+        self.assertEqual((report.start_height, report.validated_height, report.blocks_checked), (7, 8, 2))
+
+        # A rewritten history invalidates the checkpoint
+        self.blockchain.chain[8].hash = "f" * 64
+        self.repository.save_chain(self.blockchain.chain)
+        self.assertFalse(self._validator().validate_repository(self.repository).valid)
+
+    def test_read_error_aborts_the_audit_without_a_checkpoint(self):
+        def failing_chain(chunk_size=1000, start_height=0):
+            yield self.blockchain.chain[:chunk_size]
+            raise OSError("disk I/O error")
+        self.repository.iter_chain = failing_chain
+
+        with self.assertRaises(OSError):
+            self._validator(workers=1).validate_repository(self.repository)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+if __name__ == '__main__':
+    unittest.main()
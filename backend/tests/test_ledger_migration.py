@@ -0,0 +1,117 @@
+import unittest
+import io
+import json
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence import json_repository
+from src.infrastructure.persistence.json_repository import JSONBlockchainRepository, iter_json_array
+from src.infrastructure.persistence.sql_repository import SQLBlockchainRepository
+from src.application.services.ledger_migration import migrate_chain
+
+class TestJSONStreaming(unittest.TestCase):
+
+    def test_iter_json_array_across_read_boundaries(self):
+        document = ' [1, 2.5 ,{"a": [1, "]"]}, "x,y", -3e2]\n'
+        for read_size in (1, 2, 7, 1 << 20):
+            with mock.patch.object(json_repository, "READ_SIZE", read_size):
+                self.assertEqual(list(iter_json_array(io.StringIO(document))), json.loads(document))
+                self.assertEqual(list(iter_json_array(io.StringIO("[]"))), [])
+                for bad in ("", "{}", "[1 2]", "[1,", "[1,]"):
+                    with self.assertRaises(ValueError):
+                        list(iter_json_array(io.StringIO(bad)))
+
+class TestLedgerMigration(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.crypto = ECDSAService()
+        self.blockchain = Blockchain(crypto_service=self.crypto, difficulty=1)
+        for i in range(6):
+            self.blockchain.pending_transactions.append(
+                Transaction("SYSTEM", f"hash_{i}", {"user_id": 1, "original_filename": f"acta_{i}.pdf"})
+            )
+            self.blockchain.mine_pending_transactions("miner")
+        self.source = JSONBlockchainRepository(os.path.join(self.tmp.name, "blockchain.json"))
+        self.source.save_chain(self.blockchain.chain)
+
+        self.db = sessionmaker(bind=create_engine("sqlite://"))()
+        self.target = SQLBlockchainRepository(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_json_iter_chain_streams_the_file(self):
+        with mock.patch.object(json_repository, "READ_SIZE", 64):
+            chunks = list(self.source.iter_chain(chunk_size=3, start_height=2))
+        self.assertEqual([len(c) for c in chunks], [3, 2])
+        self.assertEqual([b.hash for c in chunks for b in c], [b.hash for b in self.blockchain.chain[2:]])
+
+    def test_migrates_in_batches(self):
+        progress = []
+        report = migrate_chain(self.source, self.target, batch_blocks=3, on_progress=lambda *p: progress.append(p))
+
+        self.assertTrue(report.ok)
+        self.assertEqual((report.blocks_copied, report.transactions_copied), (7, 13))
+        self.assertEqual(progress, [(2, 3), (5, 6), (6, 7)])
+        loaded = self.target.load_chain()
+        self.assertEqual([b.hash for b in loaded], [b.hash for b in self.blockchain.chain])
+        self.assertTrue(self.blockchain.is_chain_valid(loaded))
+        self.assertEqual(self.target.search.search(self.db, query="acta")["total"], 6)
+
+    def test_resumes_after_the_stored_blocks(self):
+        self.target.append_blocks(self.blockchain.chain[:4])
+        report = migrate_chain(self.source, self.target, batch_blocks=2)
+        self.assertTrue(report.ok)
+        self.assertEqual((report.start_height, report.blocks_copied), (4, 3))
+        self.assertEqual([b.hash for b in self.target.load_chain()], [b.hash for b in self.blockchain.chain])
+
+        # Nothing left to copy
+        self.assertEqual(migrate_chain(self.source, self.target).blocks_copied, 0)
+
+    def test_refuses_a_different_target_ledger(self):
+        other = Blockchain(crypto_service=self.crypto, difficulty=1)
+        other.mine_pending_transactions("other")
+        self.target.append_blocks(other.chain)
+
+        report = migrate_chain(self.source, self.target)
+        self.assertFalse(report.ok)
+        self.assertEqual(report.blocks_copied, 0)
+        self.assertEqual(self.target.chain_length(), 2)
+
+    def test_stops_at_a_gap_keeping_earlier_batches(self):
+        self.source.save_chain(self.blockchain.chain[:4] + self.blockchain.chain[5:])
+        report = migrate_chain(self.source, self.target, batch_blocks=2)
+
+        self.assertFalse(report.ok)
+        self.assertIn("expected 4", report.error)
+        self.assertEqual(report.blocks_copied, 4)
+        self.assertEqual(self.target.chain_length(), 4)
+
+    def test_schema_can_be_created_later(self):
+        engine = create_engine("sqlite://")
+        db = sessionmaker(bind=engine)()
+        repository = SQLBlockchainRepository(db, create_schema=False)
+        self.assertNotIn("blocks", inspect(engine).get_table_names())
+
+        repository.create_schema()
+        self.assertTrue(repository.append_blocks(self.blockchain.chain))
+        self.assertEqual(repository.chain_length(), 7)
+        db.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,219 @@
+import unittest
+import os
+import sys
+import tempfile
+import time
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence.segmented_log_repository import SegmentedLogBlockchainRepository
+from src.infrastructure.persistence.snapshot_store import FileSnapshotStore
+from src.application.use_cases.notary_service import NotaryService
+from src.application.services.lazy_chain import LazyChain
+
+class TestLedgerSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.crypto = ECDSAService()
+        self.keys = self.crypto.generate_key_pair()
+        self.snapshot_path = os.path.join(self.tmp.name, "ledger.snapshot")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _open(self, snapshot_every_blocks=0):
+        service = NotaryService(
+            Blockchain(crypto_service=self.crypto, difficulty=1, create_genesis=False),
+            SegmentedLogBlockchainRepository(os.path.join(self.tmp.name, "ledger")),
+            self.crypto,
+            snapshot_store=FileSnapshotStore(self.snapshot_path),
+            snapshot_every_blocks=snapshot_every_blocks
+        )
+        service.save_snapshot()
+        return service
+
+    def _notarize(self, service, document):
+        return service.record_hash(document.ljust(64, "0"), self.keys["public_key_hex"], self.keys["private_key"])
+
+    def test_boot_replays_only_blocks_after_snapshot(self):
+        service = self._open()
+        for i in range(4):
+            self._notarize(service, f"a{i}")
+        self.assertTrue(service.save_snapshot())
+        # Sealed after the snapshot, and a second notarization of an earlier document
+        for document in ("b0", "b1", "a1"):
+            self._notarize(service, document)
+        hashes = [b.hash for b in service.blockchain.chain]
+
+        reopened = NotaryService(
+            Blockchain(crypto_service=self.crypto, difficulty=1, create_genesis=False),
+            service.repository,
+            self.crypto,
+            snapshot_store=FileSnapshotStore(self.snapshot_path)
+        )
+        self.assertIsInstance(reopened.blockchain.chain, LazyChain)
+        self.assertEqual([b.hash for b in reopened.blockchain.chain], hashes)
+        # The replayed blocks are validated in the background
+        self.assertEqual(reopened.validate_new_blocks(), len(hashes) - 1)
+        self.assertEqual(reopened.verify_hash("a2".ljust(64, "0"))["block"], 3)
+        self.assertEqual(reopened.verify_hash("b1".ljust(64, "0"))["block"], 6)
+        self.assertEqual([b.index for b, _ in reopened.find_notarizations("a1".ljust(64, "0"))], [2, 7])
+        self.assertEqual([b.index for b in reopened.get_blocks(6, 10, descending=True)], [6, 5, 4, 3, 2, 1, 0])
+
+        block = self._notarize(reopened, "c0")
+        self.assertEqual(block.previous_hash, hashes[-1])
+        self.assertEqual(reopened.repository.chain_length(), len(hashes) + 1)
+
+    def test_invalid_block_after_snapshot_stops_validation(self):
+        service = self._open()
+        self._notarize(service, "a0")
+        self.assertTrue(service.save_snapshot())
+        self._notarize(service, "a1")
+        forged = Transaction(self.keys["public_key_hex"], "f" * 64, {}, signature="00")
+        service.blockchain.pending_transactions.append(forged)
+        service.repository.append_block(service.blockchain.mine_pending_transactions("miner"))
+
+        reopened = NotaryService(
+            Blockchain(crypto_service=self.crypto, difficulty=1, create_genesis=False),
+            service.repository,
+            self.crypto,
+            snapshot_store=FileSnapshotStore(self.snapshot_path)
+        )
+        self.assertEqual(reopened.validate_new_blocks(), 2)
+        # Still indexed and served; only the validated height stops short of it
+        self.assertTrue(reopened.verify_hash("f" * 64)["verified"])
+
+    def test_stale_or_corrupt_snapshot_falls_back_to_full_scan(self):
+        service = self._open()
+        self._notarize(service, "a0")
+        self.assertTrue(service.save_snapshot())
+
+        # The snapshot tip no longer matches the stored chain after a replacement
+        replacement = Blockchain(crypto_service=self.crypto, difficulty=1)
+        replacement.chain[0] = service.blockchain.chain[0]
+        for i in range(3):
+            replacement.pending_transactions.append(service.blockchain.chain[1].transactions[0])
+            replacement.mine_pending_transactions("other")
+        service.repository.replace_from(1, replacement.chain[1:])
+
+        reopened = self._open()
+        self.assertEqual(len(reopened.blockchain.chain), 4)
+        self.assertEqual(reopened.verify_hash("a0".ljust(64, "0"))["block"], 1)
+        # The full scan does not re-verify signatures
+        self.assertEqual(reopened.validated_height, -1)
+
+        with open(self.snapshot_path, "r+b") as f:
+            f.seek(20)
+            f.write(b"\xff")
+        self.assertIsNone(FileSnapshotStore(self.snapshot_path).load())
+        self.assertEqual(len(self._open().blockchain.chain), 4)
+
+    def test_snapshot_round_trip(self):
+        service = self._open()
+        for document in ("a0", "a1", "a0"):
+            self._notarize(service, document)
+        # Stored apart from the fixed-width records
+        service.record_hash("not-a-digest", self.keys["public_key_hex"], self.keys["private_key"])
+        self.assertTrue(service.save_snapshot())
+
+        snapshot = FileSnapshotStore(self.snapshot_path).load()
+        self.assertEqual(snapshot.height, 4)
+        self.assertEqual(snapshot.tip.hash, service.blockchain.chain[4].hash)
+        self.assertEqual(snapshot.validated_height, 4)
+        self.assertEqual(snapshot.documents, dict(service.document_index.items()))
+        self.assertEqual(snapshot.documents["a0".ljust(64, "0")], [(1, 0), (3, 0)])
+        self.assertEqual(snapshot.documents["not-a-digest"], (4, 0))
+        self.assertEqual(snapshot.documents.get("a1".ljust(64, "0")), (2, 0))
+        self.assertIsNone(snapshot.documents.get("a2".ljust(64, "0")))
+        self.assertNotIn("ff" * 32, snapshot.documents)
+
+    def test_batch_verification_reads_blocks_in_ranges(self):
+        service = self._open()
+        documents = [f"c{i:02d}" for i in range(12)]
+        for document in documents:
+            self._notarize(service, document)
+        self.assertTrue(service.save_snapshot())
+
+        repository = service.repository
+        reopened = NotaryService(
+            Blockchain(crypto_service=self.crypto, difficulty=1, create_genesis=False),
+            repository,
+            self.crypto,
+            snapshot_store=FileSnapshotStore(self.snapshot_path)
+        )
+        reads = []
+        get_blocks = repository.get_blocks
+        repository.get_blocks = lambda start, limit: reads.append((start, limit)) or get_blocks(start, limit)
+
+        hashes = [document.ljust(64, "0") for document in documents] + ["ff" * 32]
+        results = list(reopened.verify_hashes(hashes))
+        self.assertEqual([r["block"] for r in results[:-1]], list(range(1, 13)))
+        self.assertFalse(results[-1]["verified"])
+        self.assertEqual([r["document_hash"] for r in results], hashes)
+        # One range for twelve blocks, not a read per block
+        self.assertEqual(len(reads), 1)
+
+    def test_periodic_snapshots(self):
+        service = self._open(snapshot_every_blocks=2)
+        for i in range(5):
+            self._notarize(service, f"a{i}")
+        # Written in the background by the block listener
+        deadline = time.time() + 5
+        while FileSnapshotStore(self.snapshot_path).load().height < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertGreaterEqual(FileSnapshotStore(self.snapshot_path).load().height, 2)
+        # Let a write still in progress finish before the directory is removed
+        with service._snapshot_lock:
+            pass
+
+class TestLazyChain(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        crypto = ECDSAService()
+        blockchain = Blockchain(crypto_service=crypto, difficulty=1)
+        for _ in range(9):
+            blockchain.mine_pending_transactions("miner")
+        self.blocks = blockchain.chain
+        self.repository = SegmentedLogBlockchainRepository(self.tmp.name)
+        for block in self.blocks:
+            self.repository.append_block(block)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_reads_like_a_list(self):
+        chain = LazyChain(self.repository, len(self.blocks), cache_blocks=3, page_blocks=4)
+        hashes = [b.hash for b in self.blocks]
+        self.assertEqual(len(chain), 10)
+        self.assertEqual(chain[-1].hash, hashes[-1])
+        self.assertEqual([b.hash for b in chain[2:7]], hashes[2:7])
+        self.assertEqual([b.hash for b in chain[::3]], hashes[::3])
+        self.assertEqual([b.hash for b in chain], hashes)
+        self.assertEqual(chain[20:], [])
+        with self.assertRaises(IndexError):
+            chain[10]
+
+    def test_append_pop_and_replace(self):
+        chain = LazyChain(self.repository, 9)
+        chain.append(self.blocks[9])
+        # The tip is served from memory whether or not it reached the repository
+        self.assertIs(chain[9], self.blocks[9])
+        self.assertIs(chain.pop(), self.blocks[9])
+        self.assertEqual(len(chain), 9)
+
+        replaced = chain.with_blocks_from(5, self.blocks[5:8])
+        self.assertEqual(len(replaced), 8)
+        self.assertEqual(len(chain), 9)
+        self.assertIs(replaced[7], self.blocks[7])
+
+if __name__ == '__main__':
+    unittest.main()
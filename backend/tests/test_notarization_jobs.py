@@ -0,0 +1,81 @@
+import unittest
+import os
+import sys
+import tempfile
+import threading
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.domain.entities.blockchain import Blockchain
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence.json_repository import JSONBlockchainRepository
+from src.application.use_cases.notary_service import NotaryService
+from src.application.services.notarization_jobs import (
+    NotarizationJobQueue, JobQueueFull, JOB_QUEUED, JOB_CONFIRMED, JOB_FAILED
+)
+
+class TestNotarizationJobs(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.crypto = ECDSAService()
+        repository = JSONBlockchainRepository(
+            os.path.join(self.tmp.name, "chain.json"), os.path.join(self.tmp.name, "nodes.json")
+        )
+        self.service = NotaryService(Blockchain(crypto_service=self.crypto, difficulty=1), repository, self.crypto)
+        self.keys = self.crypto.generate_key_pair()
+        self.jobs = NotarizationJobQueue(workers=2, max_queued=10)
+
+    def tearDown(self):
+        self.jobs.stop()
+        self.service.stop_block_producer()
+        self.tmp.cleanup()
+
+    def _task(self, document_hash):
+        return lambda: self.service.record_hash(document_hash, self.keys["public_key_hex"], self.keys["private_key"])
+
+    def test_jobs_are_mined_by_workers(self):
+        self.jobs.start()
+        jobs = [self.jobs.submit(f"doc_{i}", self._task(f"doc_{i}")) for i in range(4)]
+
+        for job in jobs:
+            self.assertTrue(job.wait(10))
+            self.assertEqual(job.to_dict()["status"], JOB_CONFIRMED)
+            self.assertTrue(self.service.verify_hash(job.document_hash)["verified"])
+        self.assertEqual(len(self.service.blockchain.chain), 5)
+        self.assertIs(self.jobs.get_job(jobs[0].job_id), jobs[0])
+
+    def test_batched_jobs_follow_the_block_producer(self):
+        self.service.start_block_producer(max_transactions=3, max_wait_seconds=10)
+        self.jobs.start()
+        jobs = [self.jobs.submit(f"doc_{i}", self._task(f"doc_{i}")) for i in range(3)]
+
+        for job in jobs:
+            self.assertTrue(job.wait(10))
+        self.assertEqual({job.to_dict()["block_index"] for job in jobs}, {1})
+        self.assertEqual({job.status for job in jobs}, {JOB_CONFIRMED})
+
+    def test_bounded_queue_and_failures(self):
+        jobs = NotarizationJobQueue(workers=1, max_queued=1)
+        release = threading.Event()
+        blocked = jobs.submit("a", lambda: release.wait() and self._task("a")())
+        with self.assertRaises(JobQueueFull):
+            jobs.submit("b", self._task("b"))
+        self.assertEqual(blocked.status, JOB_QUEUED)
+
+        jobs.start()
+        release.set()
+        self.assertTrue(blocked.wait(10))
+        failing = jobs.submit("", self._task(""))
+        jobs.stop()
+
+        self.assertEqual(blocked.status, JOB_CONFIRMED)
+        self.assertEqual(failing.status, JOB_FAILED)
+        self.assertIn("mandatory", failing.to_dict()["error"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import unittest
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import zipfile
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence.json_repository import JSONBlockchainRepository
+from src.infrastructure.persistence.sql_repository import SQLBlockchainRepository
+from src.application.use_cases.notary_service import NotaryService
+
+class TestNotaryService(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.crypto = ECDSAService()
+        self.repository = JSONBlockchainRepository(
+            os.path.join(self.tmp.name, "chain.json"), os.path.join(self.tmp.name, "nodes.json")
+        )
+        self.service = self._new_service()
+        self.keys = self.crypto.generate_key_pair()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _new_service(self):
+        return NotaryService(Blockchain(crypto_service=self.crypto, difficulty=1), self.repository, self.crypto)
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def _notarize(self, name, content, metadata=None):
+        return self.service.notarize_file(
+            self._write(name, content), self.keys["public_key_hex"], self.keys["private_key"], metadata
+        )
+
+    def test_verify_uses_index(self):
+        result = self._notarize("a.txt", b"hello")
+
+        verified = self.service.verify_document(self._write("copy.txt", b"hello"))
+        self.assertTrue(verified["verified"])
+        self.assertEqual(verified["block"], result["block_index"])
+        self.assertFalse(self.service.verify_document(self._write("other.txt", b"bye"))["verified"])
+
+    def test_verify_many_hashes(self):
+        result = self._notarize("a.txt", b"hello")
+        results = list(self.service.verify_hashes([result["document_hash"], "ff" * 32]))
+
+        self.assertEqual([r["verified"] for r in results], [True, False])
+        self.assertEqual([r["document_hash"] for r in results], [result["document_hash"], "ff" * 32])
+        self.assertEqual(results[0]["block"], result["block_index"])
+        self.assertEqual(results[0]["owner"], self.keys["public_key_hex"])
+
+    def test_block_pages(self):
+        for i in range(4):
+            self._notarize(f"{i}.txt", f"doc {i}".encode())
+
+        self.assertEqual([b.index for b in self.service.get_blocks(1, 2)], [1, 2])
+        self.assertEqual([b.index for b in self.service.get_blocks(3, 10)], [3, 4])
+        self.assertEqual([b.index for b in self.service.get_blocks(99, 2, descending=True)], [4, 3])
+        self.assertEqual([b.index for b in self.service.get_blocks(1, 5, descending=True)], [1, 0])
+        self.assertEqual(self.service.get_blocks(7, 2), [])
+
+    def test_index_is_rebuilt_on_startup(self):
+        first = self._notarize("a.txt", b"same", {"user_id": 1})
+        second = self._notarize("b.txt", b"same", {"user_id": 2})
+
+        restarted = self._new_service()
+        self.assertEqual(restarted.verify_hash(first["document_hash"])["block"], first["block_index"])
+        notarizations = restarted.find_notarizations(first["document_hash"])
+        self.assertEqual([b.index for b, _ in notarizations], [first["block_index"], second["block_index"]])
+        self.assertEqual([tx.metadata["user_id"] for _, tx in notarizations], [1, 2])
+
+    def test_block_producer_batches_transactions(self):
+        self.service.start_block_producer(max_transactions=3, max_wait_seconds=1.0)
+        try:
+            receipts = [
+                self.service.notarize_hash(f"{i:064x}", self.keys["public_key_hex"], self.keys["private_key"])
+                for i in range(7)
+            ]
+            self.assertTrue(all(r["status"] == "pending" for r in receipts))
+            sealed = [self.service.get_receipt(r["receipt_id"]) for r in receipts]
+            for receipt in sealed:
+                self.assertTrue(receipt.wait(5))
+        finally:
+            self.service.stop_block_producer()
+
+        self.assertEqual([r.status for r in sealed], ["confirmed"] * 7)
+        self.assertEqual([r.block_index for r in sealed], [1, 1, 1, 2, 2, 2, 3])
+        self.assertEqual(len(self.service.blockchain.chain), 4)
+        self.assertEqual([len(b.transactions) for b in self.service.blockchain.chain[1:]], [4, 4, 2])
+        self.assertTrue(self.service.verify_hash(f"{6:064x}")["verified"])
+        self.assertTrue(self.service.blockchain.is_chain_valid(self._new_service().blockchain.chain))
+
+    def test_bulk_hashes_share_one_block(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            for i in range(4):
+                zf.writestr(f"scans/page_{i}.pdf", f"page {i}" * 100)
+            zf.writestr("scans/", "")
+        archive.seek(0)
+        hashed = NotaryService.hash_archive(archive, workers=2)
+        self.assertEqual(
+            hashed, [(f"scans/page_{i}.pdf", hashlib.sha256((f"page {i}" * 100).encode()).hexdigest()) for i in range(4)]
+        )
+
+        receipts = self.service.record_hashes(
+            [(file_hash, {"filename": name}) for name, file_hash in hashed],
+            self.keys["public_key_hex"], self.keys["private_key"]
+        )
+        self.assertEqual({(r.status, r.block_index) for r in receipts}, {("confirmed", 1)})
+        self.assertEqual(len(self.service.blockchain.chain), 2)
+        self.assertTrue(all(self.service.verify_hash(h)["verified"] for _, h in hashed))
+
+        forged = self.crypto.generate_key_pair()
+        with self.assertRaises(ValueError):
+            self.service.record_hashes([("ab" * 32, {})], self.keys["public_key_hex"], forged["private_key"])
+        self.assertEqual(len(self.service.blockchain.chain), 2)
+
+    def test_resubmitted_orphans_keep_only_local_users(self):
+        db = sessionmaker(bind=create_engine("sqlite://"))()
+        self.addCleanup(db.close)
+        service = NotaryService(Blockchain(crypto_service=self.crypto, difficulty=1), SQLBlockchainRepository(db), self.crypto)
+        service.record_hash("a1" * 32, self.keys["public_key_hex"], self.keys["private_key"], {"user_id": 1})
+
+        # A peer's chain from the genesis block, carrying a notarization of its own user 1
+        peer = Blockchain(crypto_service=self.crypto, difficulty=1)
+        peer.chain = service.blockchain.chain[:1]
+        foreign = Transaction(self.keys["public_key_hex"], "b2" * 32, {"user_id": 1})
+        foreign.signature = self.crypto.sign_data(self.crypto.calculate_tx_hash(foreign), self.keys["private_key"])
+        peer.pending_transactions.append(foreign)
+        peer.mine_pending_transactions("peer")
+        peer.mine_pending_transactions("peer")
+
+        orphans, owners = service.replace_chain_from(1, peer.chain[1:])
+        self.assertEqual([tx.document_hash for tx in orphans], ["a1" * 32])
+        self.assertEqual(service.resubmit_transactions(orphans, owners), 1)
+
+        users = dict(db.execute(
+            text("SELECT document_hash, user_id FROM transactions WHERE owner_address != 'SYSTEM'")
+        ).all())
+        self.assertEqual(users, {"a1" * 32: 1, "b2" * 32: None})
+        self.assertTrue(service.verify_hash("a1" * 32)["verified"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import os
+import sys
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.domain.entities.block import Block
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.domain.interfaces.proof_of_work_engine import MiningInterrupted
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.mining.parallel_miner import ParallelMiner
+
+class TestParallelMiner(unittest.TestCase):
+
+    def setUp(self):
+        self.crypto = ECDSAService()
+        self.miner = ParallelMiner(self.crypto, workers=2, chunk_size=500, check_every=64)
+
+    def tearDown(self):
+        self.miner.shutdown()
+
+    def _block(self):
+        txs = [Transaction("SYSTEM", "doc_hash_parallel", {"note": "test"}, timestamp=1700000000.0)]
+        return Block(1, txs, "0" * 64, timestamp=1700000000.0)
+
+    def test_same_block_as_serial_miner(self):
+        serial_chain = Blockchain(crypto_service=self.crypto, difficulty=3)
+        serial_block = self._block()
+        serial_result = serial_chain._mine_serial(serial_block)
+
+        parallel_result = self.miner.mine(self._block(), difficulty=3)
+
+        self.assertEqual(parallel_result.nonce, serial_result.nonce)
+        self.assertEqual(parallel_result.hash, serial_result.hash)
+        self.assertGreater(parallel_result.hashes_per_second, 0)
+
+    def test_blockchain_uses_engine(self):
+        blockchain = Blockchain(crypto_service=self.crypto, difficulty=2, miner=self.miner)
+        block = blockchain.mine_pending_transactions("miner")
+
+        self.assertTrue(block.hash.startswith("00"))
+        self.assertEqual(block.hash, self.crypto.calculate_hash(block))
+        self.assertIsNotNone(blockchain.last_mining_result)
+        self.assertTrue(blockchain.is_chain_valid(blockchain.chain))
+
+    def test_timeout_keeps_pending_transactions(self):
+        blockchain = Blockchain(crypto_service=self.crypto, difficulty=2, miner=self.miner)
+        blockchain.difficulty = 16
+        blockchain.pending_transactions.append(Transaction("SYSTEM", "doc_hash_timeout"))
+
+        with self.assertRaises(MiningInterrupted):
+            blockchain.mine_pending_transactions("miner", timeout=0.2)
+
+        self.assertEqual(len(blockchain.chain), 1)
+        self.assertEqual(len(blockchain.pending_transactions), 1)
+
+if __name__ == '__main__':
+    unittest.main()
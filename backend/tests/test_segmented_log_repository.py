@@ -0,0 +1,86 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence.segmented_log_repository import SegmentedLogBlockchainRepository
+
+class TestSegmentedLogRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.crypto = ECDSAService()
+        self.blockchain = Blockchain(crypto_service=self.crypto, difficulty=1)
+        for i in range(5):
+            self.blockchain.pending_transactions.append(Transaction("SYSTEM", f"doc_{i}", {"n": i}))
+            self.blockchain.mine_pending_transactions("miner")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _open(self, **kwargs):
+        return SegmentedLogBlockchainRepository(self.tmp.name, max_segment_bytes=kwargs.get("max_segment_bytes", 1024))
+
+    def _fill(self):
+        repository = self._open()
+        for block in self.blockchain.chain:
+            self.assertTrue(repository.append_block(block))
+        return repository
+
+    def test_round_trip_across_segments(self):
+        self._fill()
+        segments = [n for n in os.listdir(self.tmp.name) if n.startswith("segment-")]
+        self.assertGreater(len(segments), 1)
+
+        reopened = self._open()
+        loaded = reopened.load_chain()
+        self.assertEqual([b.hash for b in loaded], [b.hash for b in self.blockchain.chain])
+        self.assertTrue(self.blockchain.is_chain_valid(loaded))
+        self.assertEqual(reopened.get_block(3).transactions[0].document_hash, "doc_2")
+
+    def test_rejects_out_of_order_block(self):
+        repository = self._open()
+        self.assertFalse(repository.append_block(self.blockchain.chain[1]))
+
+    def test_torn_tail_is_truncated(self):
+        repository = self._fill()
+        segment, offset, length = repository._entries[-1]
+        path = repository._segment_path(segment)
+        with open(path, "ab") as f:
+            f.write(b"\x00\x00\x10\x00garbage")
+
+        reopened = self._open()
+        self.assertEqual(reopened.height, len(self.blockchain.chain))
+        self.assertEqual(os.path.getsize(path), offset + length)
+        self.assertTrue(reopened.append_block(self._next_block()))
+
+    def test_lost_index_is_rebuilt(self):
+        self._fill()
+        os.remove(os.path.join(self.tmp.name, "blocks.idx"))
+
+        reopened = self._open()
+        self.assertEqual([b.hash for b in reopened.load_chain()], [b.hash for b in self.blockchain.chain])
+
+    def test_save_chain_rewrites_diverging_suffix(self):
+        repository = self._fill()
+        fork = Blockchain(crypto_service=self.crypto, difficulty=1)
+        fork.chain = self.blockchain.chain[:3]
+        fork.mine_pending_transactions("other_miner")
+
+        repository.save_chain(fork.chain)
+        self.assertEqual([b.hash for b in self._open().load_chain()], [b.hash for b in fork.chain])
+
+    def _next_block(self):
+        return self.blockchain.mine_pending_transactions("miner")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import os
+import sys
+import pickle
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.cryptography.signature_verifier import SignatureVerifier
+
+class TestSignatureVerifier(unittest.TestCase):
+
+    def setUp(self):
+        self.crypto = ECDSAService(SignatureVerifier(cache_size=2, batch_size=4))
+
+    def _signed(self, keys, text):
+        data = self.crypto.calculate_hash(text)
+        return keys["public_key_hex"], self.crypto.sign_data(data, keys["private_key"]), data
+
+    def test_compressed_keys(self):
+        keys = self.crypto.generate_key_pair(compressed=True)
+        self.assertEqual(len(keys["public_key_hex"]), 66)
+        self.assertTrue(self.crypto.verify_signature(*self._signed(keys, "doc")))
+
+    def test_cache_is_bounded(self):
+        for _ in range(3):
+            self.assertTrue(self.crypto.verify_signature(*self._signed(self.crypto.generate_key_pair(), "doc")))
+        self.assertEqual(len(self.crypto.verifier._keys), 2)
+
+    def test_verify_many_keeps_order(self):
+        keys = self.crypto.generate_key_pair()
+        items = [self._signed(keys, f"doc_{i}") for i in range(10)]
+        items[7] = (items[7][0], items[7][1], "tampered")
+        items.append((keys["public_key_hex"], "not-hex", "data"))
+
+        self.assertEqual(self.crypto.verify_many(items), [True] * 7 + [False, True, True, False])
+
+    def test_service_is_picklable(self):
+        keys = self.crypto.generate_key_pair()
+        self.crypto.verify_signature(*self._signed(keys, "doc"))
+        clone = pickle.loads(pickle.dumps(self.crypto))
+        self.assertTrue(clone.verify_signature(*self._signed(keys, "doc")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,252 @@
+import unittest
+import os
+import sys
+import tempfile
+import threading
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from src.domain.entities.blockchain import Blockchain
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.cryptography.ecdsa_service import ECDSAService
+from src.infrastructure.persistence.database import create_sqlite_engine
+from src.infrastructure.persistence.sql_repository import SQLBlockchainRepository
+
+class TestSQLRepository(unittest.TestCase):
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: self.statements.append(args[2]))
+        self.db = sessionmaker(bind=engine)()
+        self.repository = SQLBlockchainRepository(self.db)
+        self.crypto = ECDSAService()
+        self.blockchain = Blockchain(crypto_service=self.crypto, difficulty=1)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _mine(self, documents):
+        for doc in documents:
+            self.blockchain.pending_transactions.append(Transaction("SYSTEM", doc, {"user_id": 7}))
+        return self.blockchain.mine_pending_transactions("miner")
+
+    def test_append_block_round_trip(self):
+        self.assertTrue(self.repository.append_block(self.blockchain.chain[0]))
+        for i in range(3):
+            self.assertTrue(self.repository.append_block(self._mine([f"doc_{i}_a", f"doc_{i}_b"])))
+
+        loaded = self.repository.load_chain()
+        self.assertEqual([b.hash for b in loaded], [b.hash for b in self.blockchain.chain])
+        self.assertEqual(
+            [tx.document_hash for tx in loaded[2].transactions],
+            [tx.document_hash for tx in self.blockchain.chain[2].transactions]
+        )
+        self.assertTrue(self.blockchain.is_chain_valid(loaded))
+
+    def test_duplicate_height_is_rejected(self):
+        self.assertTrue(self.repository.append_block(self.blockchain.chain[0]))
+        self.assertFalse(self.repository.append_block(self.blockchain.chain[0]))
+        self.assertEqual(len(self.repository.load_chain()), 1)
+
+    def test_save_chain_only_inserts_missing_blocks(self):
+        self._mine(["doc_a"])
+        self.assertTrue(self.repository.save_chain(self.blockchain.chain))
+        self._mine(["doc_b"])
+        self.assertTrue(self.repository.save_chain(self.blockchain.chain))
+
+        loaded = self.repository.load_chain()
+        self.assertEqual(len(loaded), 3)
+        self.assertEqual(sum(len(b.transactions) for b in loaded), 5)
+
+    def test_iter_chain_streams_chunks_with_set_based_queries(self):
+        for i in range(4):
+            self._mine([f"doc_{i}_a", f"doc_{i}_b"])
+        self.repository.save_chain(self.blockchain.chain)
+
+        self.statements.clear()
+        chunks = list(self.repository.iter_chain(chunk_size=2))
+
+        self.assertEqual([len(c) for c in chunks], [2, 2, 1])
+        # Blocks + transactions per chunk, plus the final empty block query
+        self.assertEqual(len(self.statements), 2 * len(chunks) + 1)
+        loaded = [b for c in chunks for b in c]
+        self.assertEqual([b.hash for b in loaded], [b.hash for b in self.blockchain.chain])
+        self.assertTrue(self.blockchain.is_chain_valid(loaded))
+
+    def test_append_blocks_uses_a_fixed_number_of_statements(self):
+        self.assertTrue(self.repository.append_blocks(self.blockchain.chain[:1]))
+        blocks = [self._mine_documents([(1, f"acta_{i}.pdf", "Acta"), (2, f"otra_{i}.pdf", "Otra")]) for i in range(5)]
+
+        self.statements.clear()
+        self.assertTrue(self.repository.append_blocks(blocks))
+        # Blocks, their ids, transactions and the search index, however many blocks there are
+        self.assertLessEqual(len([s for s in self.statements if not s.startswith(("BEGIN", "COMMIT"))]), 4)
+        self.assertEqual([b.hash for b in self.repository.load_chain()], [b.hash for b in self.blockchain.chain])
+        self.assertEqual(self.repository.search.search(self.db, query="acta")["total"], 5)
+        # Rejected as a whole
+        self.assertFalse(self.repository.append_blocks([self._mine(["doc_x"]), blocks[0]]))
+        self.assertEqual(self.repository.chain_length(), 6)
+
+    def test_read_errors_propagate_from_iter_chain(self):
+        for i in range(4):
+            self._mine([f"doc_{i}"])
+        self.repository.save_chain(self.blockchain.chain)
+
+        chunks = self.repository.iter_chain(chunk_size=2)
+        next(chunks)
+        self.db.execute(text("ALTER TABLE transactions RENAME TO transactions_moved"))
+        # Not a silently shorter chain
+        with self.assertRaises(OperationalError):
+            next(chunks)
+        with self.assertRaises(OperationalError):
+            self.repository.get_blocks(2, 2)
+
+    def _mine_documents(self, documents):
+        for user_id, filename, description in documents:
+            self.blockchain.pending_transactions.append(Transaction(
+                "SYSTEM", f"hash_{filename}",
+                {"user_id": user_id, "original_filename": filename, "description": description}
+            ))
+        return self.blockchain.mine_pending_transactions("miner")
+
+    def test_search_full_text_scoped_to_user(self):
+        self.repository.append_block(self.blockchain.chain[0])
+        self.repository.append_block(self._mine_documents([
+            (1, "Contrato_arrendamiento.pdf", "Firma del contrato"),
+            (1, "factura.pdf", "Factura de marzo"),
+            (2, "contrato_ajeno.pdf", "Otro usuario"),
+        ]))
+
+        result = self.repository.search.search(self.db, query="contrato", user_id=1)
+        self.assertEqual(result["total"], 1)
+        self.assertEqual(result["results"][0]["metadata"]["original_filename"], "Contrato_arrendamiento.pdf")
+        self.assertEqual(result["results"][0]["block_index"], 1)
+
+        # Prefix and accent-insensitive matching
+        self.assertEqual(self.repository.search.search(self.db, query="FACTU", user_id=1)["total"], 1)
+        self.assertEqual(self.repository.search.search(self.db, query="márzo", user_id=1)["total"], 1)
+
+        page = self.repository.search.search(self.db, user_id=1, page=2, page_size=1)
+        self.assertEqual((page["total"], len(page["results"])), (2, 1))
+
+    def test_search_index_backfills_existing_transactions(self):
+        self.repository.append_block(self.blockchain.chain[0])
+        self.repository.append_block(self._mine_documents([(1, "acta.pdf", "Acta de reunion")]))
+        self.db.execute(text("DELETE FROM notarizations_fts"))
+        self.db.commit()
+
+        reopened = SQLBlockchainRepository(self.db)
+        self.assertEqual(reopened.search.search(self.db, query="acta")["total"], 1)
+
+    def test_replace_from_swaps_blocks_and_search_index(self):
+        self.repository.append_block(self.blockchain.chain[0])
+        self.repository.append_block(self._mine_documents([(1, "acta.pdf", "Acta de reunion")]))
+        self.repository.append_block(self._mine_documents([(1, "viejo.pdf", "Bloque reemplazado")]))
+
+        fork = Blockchain(crypto_service=self.crypto, difficulty=1)
+        fork.chain = self.blockchain.chain[:2]
+        for name in ("nuevo.pdf", "otro.pdf"):
+            fork.pending_transactions.append(Transaction("SYSTEM", f"hash_{name}", {"user_id": 1, "original_filename": name}))
+            fork.mine_pending_transactions("miner")
+
+        self.assertTrue(self.repository.replace_from(2, fork.chain[2:]))
+        self.assertEqual([b.hash for b in self.repository.load_chain()], [b.hash for b in fork.chain])
+        self.assertEqual(self.repository.search.search(self.db, query="viejo")["total"], 0)
+        self.assertEqual(self.repository.search.search(self.db, query="nuevo")["total"], 1)
+        self.assertEqual(self.repository.search.search(self.db, query="acta")["total"], 1)
+
+    def test_peer_blocks_are_not_attributed_to_local_users(self):
+        def fork_with(transactions):
+            fork = Blockchain(crypto_service=self.crypto, difficulty=1)
+            fork.chain = self.blockchain.chain[:1]
+            fork.pending_transactions.extend(transactions)
+            fork.mine_pending_transactions("miner")
+            return fork
+
+        def stored_users():
+            return dict(self.db.execute(text("SELECT document_hash, user_id FROM transactions WHERE document_hash LIKE 'hash_%'")).all())
+
+        own = Transaction("SYSTEM", "hash_own", {"user_id": 1, "original_filename": "propio.pdf"})
+        foreign = Transaction("SYSTEM", "hash_foreign", {"user_id": 1, "original_filename": "ajeno.pdf"})
+        self.repository.append_block(self.blockchain.chain[0])
+        self.repository.append_block(fork_with([own]).chain[1])
+
+        # The peer's block carries its own user 1 and a copy of the local notarization
+        self.assertTrue(self.repository.replace_from(1, fork_with([foreign, own]).chain[1:]))
+        self.assertEqual(stored_users(), {"hash_own": 1, "hash_foreign": None})
+        result = self.repository.search.search(self.db, user_id=1)
+        self.assertEqual([r["document_hash"] for r in result["results"]], ["hash_own"])
+
+        # Both orphaned by another peer and re-sealed here with the users read before the
+        # replacement: only the local one gets its user back
+        dropped = self.repository.transaction_owners(1)
+        other = fork_with([Transaction("SYSTEM", "hash_other", {"user_id": 1})])
+        self.assertTrue(self.repository.replace_from(1, other.chain[1:]))
+        other.pending_transactions.extend([own, foreign])
+        self.assertTrue(self.repository.append_block(other.mine_pending_transactions("miner"), dropped))
+        self.assertEqual(stored_users(), {"hash_other": None, "hash_own": 1, "hash_foreign": None})
+
+class TestConcurrentSessions(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{os.path.join(self.tmp.name, 'chain.db')}"
+        self.engines = [create_sqlite_engine(url), create_sqlite_engine(url, read_only=True)]
+        self.write_factory, self.read_factory = (sessionmaker(bind=e) for e in self.engines)
+        self.repository = SQLBlockchainRepository(
+            session_factory=self.write_factory, read_session_factory=self.read_factory
+        )
+        self.blockchain = Blockchain(crypto_service=ECDSAService(), difficulty=1)
+
+    def tearDown(self):
+        for engine in self.engines:
+            engine.dispose()
+        self.tmp.cleanup()
+
+    def test_read_sessions_cannot_write(self):
+        self.repository.append_block(self.blockchain.chain[0])
+        with self.read_factory() as db:
+            self.assertEqual(db.execute(text("PRAGMA journal_mode")).scalar(), "wal")
+            with self.assertRaises(Exception):
+                db.execute(text("DELETE FROM blocks"))
+
+    def test_concurrent_readers_and_writer_keep_chain_consistent(self):
+        self.repository.append_block(self.blockchain.chain[0])
+        errors = []
+        done = threading.Event()
+
+        def read():
+            try:
+                while not done.is_set():
+                    chain = [b for c in self.repository.iter_chain(chunk_size=2) for b in c]
+                    if not self.blockchain.is_chain_valid(chain):
+                        errors.append("inconsistent chain read")
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        try:
+            for i in range(10):
+                self.blockchain.pending_transactions.append(Transaction("SYSTEM", f"doc_{i}", {"user_id": 1}))
+                self.assertTrue(self.repository.append_block(self.blockchain.mine_pending_transactions("miner")))
+        finally:
+            done.set()
+            for thread in readers:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        loaded = self.repository.load_chain()
+        self.assertEqual([b.hash for b in loaded], [b.hash for b in self.blockchain.chain])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import hashlib
+import os
+import sys
+
+# Setup path for Clean Architecture
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.testclient import TestClient
+from src.api.streaming_upload import StreamedUpload, UploadStreamError, FILE_START, FILE_DATA, FILE_END
+from src.application.use_cases.notary_service import NotaryService
+
+app = FastAPI()
+
+@app.post("/upload")
+async def upload(request: Request):
+    try:
+        upload = StreamedUpload(request, chunk_size=64 * 1024)
+        chunks = []
+        def consume():
+            # Record chunk sizes to check the body is never held whole
+            for chunk in upload.file_chunks():
+                chunks.append(len(chunk))
+                yield chunk
+        file_hash = await run_in_threadpool(NotaryService.hash_stream, consume())
+    except UploadStreamError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"hash": file_hash, "filename": upload.filename, "size": upload.size, "fields": upload.fields, "largest_chunk": max(chunks)}
+
+@app.post("/bulk")
+async def bulk(request: Request):
+    def hash_files(upload):
+        hashed = []
+        for kind, value in upload.file_events():
+            if kind == FILE_START:
+                name, digest = value, hashlib.sha256()
+            elif kind == FILE_DATA:
+                digest.update(value)
+            elif kind == FILE_END:
+                hashed.append([name, digest.hexdigest()])
+        return hashed
+    try:
+        upload = StreamedUpload(request, file_field="files", max_files=3)
+        return {"files": await run_in_threadpool(hash_files, upload), "fields": upload.fields}
+    except UploadStreamError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+class TestStreamingUpload(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_hashes_file_and_reads_fields_after_it(self):
+        content = os.urandom(3 * 1024 * 1024 + 7)
+        res = self.client.post(
+            "/upload",
+            files=[("file", ("contrato.pdf", content)), ("owner_address", (None, "0xabc")), ("description", (None, "Compraventa"))]
+        )
+        self.assertEqual(res.status_code, 200)
+        body = res.json()
+        self.assertEqual(body["hash"], hashlib.sha256(content).hexdigest())
+        self.assertEqual(body["filename"], "contrato.pdf")
+        self.assertEqual(body["size"], len(content))
+        self.assertEqual(body["fields"], {"owner_address": "0xabc", "description": "Compraventa"})
+        self.assertLess(body["largest_chunk"], 256 * 1024)
+
+    def test_rejects_missing_file(self):
+        res = self.client.post("/upload", files=[("owner_address", (None, "0xabc"))])
+        self.assertEqual(res.status_code, 400)
+
+    def test_rejects_non_multipart_body(self):
+        res = self.client.post("/upload", json={"file": "hola"})
+        self.assertEqual(res.status_code, 400)
+
+    def test_streams_several_files(self):
+        files = [("files", (f"{n}.txt", n.encode() * 100000)) for n in ("a", "b", "c")]
+        res = self.client.post("/bulk", files=files + [("owner_address", (None, "0xabc"))])
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            res.json()["files"], [[f"{n}.txt", hashlib.sha256(n.encode() * 100000).hexdigest()] for n in ("a", "b", "c")]
+        )
+        self.assertEqual(res.json()["fields"], {"owner_address": "0xabc"})
+
+        too_many = [("files", (f"{n}.txt", b"x")) for n in range(4)]
+        self.assertEqual(self.client.post("/bulk", files=too_many).status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
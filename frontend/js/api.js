@@ -5,12 +5,16 @@ const authHeaders = () => {
   return token ? { Authorization: `Bearer ${token}` } : {};
 };
 
+// Only the tip header is needed for stats; the ETag turns unchanged polls into 304s
 export const getChain = () =>
-  fetch(`${API_URL}/chain`);
+  fetch(`${API_URL}/chain?order=desc&limit=1&headers_only=true`, { cache: 'no-cache' });
 
 export const notarize = (formData) =>
   fetch(`${API_URL}/notarize`, { method: 'POST', body: formData, headers: authHeaders() });
 
+export const getJob = (jobId) =>
+  fetch(`${API_URL}/jobs/${jobId}`);
+
 export const verify = (formData) =>
   fetch(`${API_URL}/verify`, { method: 'POST', body: formData });
 
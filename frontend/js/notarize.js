@@ -1,4 +1,4 @@
-import { notarize, verify } from './api.js';
+import { notarize, verify, getJob } from './api.js';
 import { showToast }        from './utils.js';
 
 export const initDropZone = () => {
@@ -51,7 +51,7 @@ const doNotarize = async (file) => {
     const res    = await notarize(formData);
     const result = await res.json();
     if (!res.ok) throw new Error(result.detail || 'Error del servidor');
-    showSuccess(result);
+    showSuccess({ ...result, ...(await waitForBlock(result.job_id)) });
   } catch (err) {
     showToast('Error: ' + err.message, 'error');
     btn.disabled = false;
@@ -60,6 +60,19 @@ const doNotarize = async (file) => {
   }
 };
 
+// Notarizations run as server jobs, confirmed once their block is sealed
+const waitForBlock = async (jobId, attempts = 30) => {
+  for (let i = 0; i < attempts; i++) {
+    await new Promise((resolve) => setTimeout(resolve, 500));
+    const res = await getJob(jobId);
+    const job = await res.json();
+    if (!res.ok) throw new Error(job.detail || 'Error del servidor');
+    if (job.status === 'confirmed') return job;
+    if (job.status === 'failed') throw new Error(job.error || 'No se pudo sellar el bloque');
+  }
+  throw new Error('El bloque aún no ha sido sellado');
+};
+
 const doVerify = async (file) => {
   const btn = document.getElementById('btn-verify');
   btn.disabled = true;